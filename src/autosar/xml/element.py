@@ -4,18 +4,23 @@ Classes related to AUTOSAR Elements
 """
 
 import re
+import sys
+import functools
+import operator
 from collections.abc import Iterable
-from typing import Any, Union
+from typing import Any, SupportsIndex, Union
 from enum import Enum
-import abc
 import autosar.xml.enumeration as ar_enum
 
 
 alignment_type_re = re.compile(
-    r"[1-9][0-9]*|0[xX][0-9a-fA-F]*|0[bB][0-1]+|0[0-7]*|UNSPECIFIED|UNKNOWN|BOOLEAN|PTR")
+    r"[1-9][0-9]*|0[xX][0-9a-fA-F]*|0[bB][0-1]+|0[0-7]*|UNSPECIFIED|UNKNOWN|BOOLEAN|PTR", re.ASCII)
+
+# Values accepted by alignment_type_re without running the regex engine
+_ALIGNMENT_KEYWORDS = frozenset(["UNSPECIFIED", "UNKNOWN", "BOOLEAN", "PTR"])
 
 display_format_str_re = re.compile(
-    r"%[ \-+#]?[0-9]*(\.[0-9]+)?[diouxXfeEgGcs]")
+    r"%[ \-+#]?[0-9]*(\.[0-9]+)?[diouxXfeEgGcs]", re.ASCII)
 
 # Type aliases
 
@@ -30,11 +35,78 @@ ValueSpeficationElement = Union["TextValueSpecification",
 # Helper classes
 
 
+def str_to_int(value: str) -> int:
+    """
+    Same as int(value, 0) but with shortcuts for the most common literal forms
+    """
+    if value.isdigit() and value.isascii() and (value[0] != "0" or len(value) == 1):
+        return int(value)
+    prefix = value[:2]
+    if prefix == "0x" or prefix == "0X":
+        return int(value, 16)
+    if prefix == "0b" or prefix == "0B":
+        return int(value, 2)
+    return int(value, 0)
+
+
+def str_to_number(value: str) -> int | float:
+    """
+    Converts string to int when possible, otherwise to float
+    """
+    try:
+        return str_to_int(value)
+    except ValueError:
+        return float(value)
+
+
+def _intern_str(value: Any) -> Any:
+    """
+    Interns value if it's a string, other values are returned unchanged
+    """
+    return sys.intern(value) if value.__class__ is str else value
+
+
+def _lookup_ctor(ctors: dict, value: Any) -> Any:
+    """
+    Returns converter for value from a table keyed by exact type.
+    Subclasses are resolved by trying isinstance in table order.
+    Returns None if no converter matches.
+    """
+    ctor = ctors.get(value.__class__)
+    if ctor is None:
+        for type_class, type_ctor in ctors.items():
+            if isinstance(value, type_class):
+                return type_ctor
+    return ctor
+
+
+def _all_of_type(items: Any, type_class: type) -> bool:
+    """
+    True if items is a list or tuple where every item has exactly the given type
+    """
+    items_type = items.__class__
+    if items_type is not list and items_type is not tuple:
+        return False
+    return all(item.__class__ is type_class for item in items)
+
+
+def _all_in_types(items: Any, type_classes: frozenset[type]) -> bool:
+    """
+    True if items is a list or tuple where the exact type of every item is in type_classes
+    """
+    items_type = items.__class__
+    if items_type is not list and items_type is not tuple:
+        return False
+    return all(item.__class__ in type_classes for item in items)
+
+
 class NumericalValue:
     """
     Wrapper for numerical value
     """
 
+    __slots__ = ("_value", "value_format")
+
     def __init__(self,
                  value: int | float | str,
                  value_format: ar_enum.ValueFormat = ar_enum.ValueFormat.DEFAULT
@@ -57,7 +129,12 @@ class NumericalValue:
         self._value = self._validate_value(value)
 
     def _validate_value(self, value: Any) -> int | float | str:
-        if isinstance(value, (int, float)):
+        value_type = value.__class__
+        if value_type is int or value_type is float:
+            return value
+        elif value_type is str:
+            return str_to_number(value)
+        elif isinstance(value, (int, float)):
             return value
         elif isinstance(value, str):
             try:
@@ -73,6 +150,8 @@ class PositiveIntegerValue:
     Wrapper for positive value
     """
 
+    __slots__ = ("_value", "value_format")
+
     def __init__(self,
                  value: int,
                  value_format: ar_enum.ValueFormat = ar_enum.ValueFormat.DEFAULT
@@ -92,7 +171,7 @@ class PositiveIntegerValue:
     def _validate_value(self, value: int | str) -> int:
         if isinstance(value, str):
             try:
-                value = int(value, 0)
+                value = str_to_int(value)
             except ValueError as err:
                 raise TypeError("Unable to convert to integer") from err
         if isinstance(value, int):
@@ -102,25 +181,224 @@ class PositiveIntegerValue:
         else:
             raise TypeError(f"Unexpected type for value {str(type(value))}")
 
+
+class ElementList(list):
+    """
+    List of named elements that keeps a name-to-element index
+    for fast lookup by name.
+    The index is dropped by every method that changes which elements are in the list
+    and by renaming any Referrable. It is rebuilt on next lookup.
+    Reordering (sort, reverse) keeps the index since short names are unique.
+    """
+
+    _name_version = 0  # Incremented by Referrable.name setter
+
+    def __init__(self, iterable: Iterable = ()) -> None:
+        super().__init__(iterable)
+        self._by_name: dict[str, Any] | None = None
+        self._indexed_version = -1
+
+    @classmethod
+    def name_changed(cls) -> None:
+        """
+        Invalidates indexes of all element lists after an element has been renamed
+        """
+        cls._name_version += 1
+
+    def append(self, item: Any) -> None:
+        """
+        Appends item and updates index
+        """
+        super().append(item)
+        if self._by_name is not None:
+            self._by_name.setdefault(item.name, item)
+
+    def extend(self, iterable: Iterable) -> None:
+        """
+        Extends list and invalidates index
+        """
+        super().extend(iterable)
+        self._by_name = None
+
+    def insert(self, index: SupportsIndex, item: Any) -> None:
+        """
+        Inserts item and invalidates index
+        """
+        super().insert(index, item)
+        self._by_name = None
+
+    def pop(self, index: SupportsIndex = -1) -> Any:
+        """
+        Removes and returns item, invalidates index
+        """
+        self._by_name = None
+        return super().pop(index)
+
+    def remove(self, item: Any) -> None:
+        """
+        Removes first occurrence of item and invalidates index
+        """
+        super().remove(item)
+        self._by_name = None
+
+    def clear(self) -> None:
+        """
+        Removes all items and invalidates index
+        """
+        super().clear()
+        self._by_name = None
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        """Replaces item(s) and invalidates index"""
+        super().__setitem__(index, value)
+        self._by_name = None
+
+    def __delitem__(self, index: Any) -> None:
+        """Deletes item(s) and invalidates index"""
+        super().__delitem__(index)
+        self._by_name = None
+
+    def __iadd__(self, iterable: Iterable) -> "ElementList":
+        """Extends list in place and invalidates index"""
+        super().__iadd__(iterable)
+        self._by_name = None
+        return self
+
+    def __imul__(self, count: SupportsIndex) -> "ElementList":
+        """Repeats list in place and invalidates index"""
+        super().__imul__(count)
+        self._by_name = None
+        return self
+
+    def get_by_name(self, name: str) -> Any:
+        """
+        Returns the first element with matching name or None
+        """
+        by_name = self._by_name
+        if by_name is None or self._indexed_version != ElementList._name_version:
+            by_name = {}
+            for elem in self:
+                by_name.setdefault(elem.name, elem)
+            self._by_name = by_name
+            self._indexed_version = ElementList._name_version
+        return by_name.get(name)
+
+
+class OptionalAttr:
+    """
+    Data descriptor for optional attributes of builtin type (bool, int, str, float).
+    Assigned values are converted to the type, None is stored as-is.
+    The value is kept in the instance attribute named by the
+    descriptor prefixed with underscore.
+    """
+
+    __slots__ = ("type_class", "storage_name")
+
+    def __init__(self, type_class: type) -> None:
+        if type_class not in (bool, int, str, float):
+            raise TypeError(f"Unsupported type for OptionalAttr: {str(type_class)}")
+        self.type_class = type_class
+        self.storage_name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Called when owner class is created"""
+        self.storage_name = "_" + name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        """Returns stored value or None"""
+        if instance is None:
+            return self
+        return getattr(instance, self.storage_name, None)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        """Converts and stores value"""
+        if value is not None and value.__class__ is not self.type_class:
+            value = self.type_class(value)
+        setattr(instance, self.storage_name, value)
+
+
 # Base classes
 
 
+def _slot_names(cls: type) -> tuple[str, ...]:
+    """
+    Returns names of all slots declared in cls and its base classes
+    """
+    merged: list[str] = []
+    for base in reversed(cls.__mro__):
+        slots = base.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name not in ("__dict__", "__weakref__") and name not in merged:
+                merged.append(name)
+    return tuple(merged)
+
+
+@functools.lru_cache(maxsize=None)
+def _slot_names_without(cls: type, ignore_set: frozenset[str]) -> tuple[str, ...]:
+    """
+    Returns cls._ATTR_NAMES minus names in ignore_set
+    """
+    return tuple(name for name in cls._ATTR_NAMES if name not in ignore_set)
+
+
+# Memoized setter for ARObject._assign, keyed by the requested type
+_ASSIGN_DISPATCH: dict[type, Any] = {}
+
+
 class ARObject:
     """
     Base class for all AUTOSAR objects
     """
 
+    __slots__ = ()
+    _ATTR_NAMES: tuple[str, ...] = ()  # Merged __slots__ names, set by __init_subclass__
+
+    _ATTR_GETTER: operator.attrgetter | None = None  # Fetches all slot values in a single call
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Precomputes attribute names used by is_empty"""
+        super().__init_subclass__(**kwargs)
+        cls._ATTR_NAMES = _slot_names(cls)
+        if len(cls._ATTR_NAMES) > 1:
+            cls._ATTR_GETTER = operator.attrgetter(*cls._ATTR_NAMES)
+        elif len(cls._ATTR_NAMES) == 1:
+            # attrgetter with a single name doesn't return a tuple
+            cls._ATTR_GETTER = operator.attrgetter(cls._ATTR_NAMES[0], cls._ATTR_NAMES[0])
+        else:
+            cls._ATTR_GETTER = None
+
     @property
     def is_empty(self) -> bool:
         """
         True if no value has been set (everything is None)
         """
-        for value in vars(self).values():
+        attr_getter = type(self)._ATTR_GETTER
+        if attr_getter is None:
+            values = ()
+        else:
+            try:
+                values = attr_getter(self)
+            except AttributeError:
+                values = tuple(getattr(self, name, None) for name in type(self)._ATTR_NAMES)
+        for value in values:
+            if value is None:
+                continue
             if isinstance(value, list):
-                if len(value) > 0:
+                if value:
                     return False
             else:
-                if value is not None:
+                return False
+        instance_dict = getattr(self, "__dict__", None)
+        if instance_dict is not None:
+            for value in instance_dict.values():
+                if value is None:
+                    continue
+                if isinstance(value, list):
+                    if value:
+                        return False
+                else:
                     return False
         return True
 
@@ -130,15 +408,25 @@ class ARObject:
         a list of property names to ignore during
         check
         """
-        for key in vars(self).keys():
-            if key not in ignore_set:
-                value = getattr(self, key)
+        for name in _slot_names_without(type(self), frozenset(ignore_set)):
+            value = getattr(self, name, None)
+            if value is None:
+                continue
+            if isinstance(value, list):
+                if value:
+                    return False
+            else:
+                return False
+        instance_dict = getattr(self, "__dict__", None)
+        if instance_dict is not None:
+            for key, value in instance_dict.items():
+                if value is None or key in ignore_set:
+                    continue
                 if isinstance(value, list):
-                    if len(value) > 0:
+                    if value:
                         return False
                 else:
-                    if value is not None:
-                        return False
+                    return False
         return True
 
     def _assign_optional(self, attr_name: str, value: Any, type_name: type) -> None:
@@ -146,18 +434,29 @@ class ARObject:
         Same as _assign but with a None-check
         """
         if value is not None:
-            self._assign(attr_name, value, type_name)
+            if value.__class__ is type_name:
+                setattr(self, attr_name, value)
+            else:
+                self._assign(attr_name, value, type_name)
 
     def _assign(self, attr_name: str, value: Any, type_name: type) -> None:
         """
         Assign single value to attribute with type check.
+        Values already of the exact type are assigned directly.
         """
-        if issubclass(type_name, Enum):
-            self._set_attr_with_strict_type(attr_name, value, type_name)
-        elif issubclass(type_name, BaseRef):
-            self._set_attr_from_str_or_direct(attr_name, value, type_name)
-        else:
-            self._set_attr_with_type_cast(attr_name, value, type_name)
+        if value.__class__ is type_name:
+            setattr(self, attr_name, value)
+            return
+        setter = _ASSIGN_DISPATCH.get(type_name)
+        if setter is None:
+            if issubclass(type_name, Enum):
+                setter = ARObject._set_attr_with_strict_type
+            elif issubclass(type_name, BaseRef):
+                setter = ARObject._set_attr_from_str_or_direct
+            else:
+                setter = ARObject._set_attr_with_type_cast
+            _ASSIGN_DISPATCH[type_name] = setter
+        setter(self, attr_name, value, type_name)
 
     def _assign_int_or_str_pattern_optional(self, attr_name: str, value: int | str | None, pattern: re.Pattern) -> None:
         """
@@ -171,10 +470,18 @@ class ARObject:
         Special assignment-function for values that can be either int or conforms
         to a specific regular expression
         """
-        if isinstance(value, int):
+        value_type = value.__class__
+        if value_type is int:
+            pass
+        elif value_type is str:
+            if pattern is alignment_type_re and value in _ALIGNMENT_KEYWORDS:
+                pass
+            elif pattern.fullmatch(value) is None:
+                raise ValueError(f"Invalid parameter '{value}' for '{attr_name}'")
+        elif isinstance(value, int):
             pass
         elif isinstance(value, str):
-            match = pattern.match(value)
+            match = pattern.fullmatch(value)
             if match is None:
                 raise ValueError(f"Invalid parameter '{value}' for '{attr_name}'")
         else:
@@ -192,7 +499,9 @@ class ARObject:
         """
         Checks that the optional value is a positive integer before assignment
         """
-        if value is not None:
+        if value.__class__ is int and value >= 0:
+            setattr(self, attr_name, value)
+        elif value is not None:
             self._set_attr_positive_int(attr_name, value)
 
     def _set_attr_with_strict_type(self, attr_name: str, value: Any, type_class: type) -> None:
@@ -222,8 +531,14 @@ class ARObject:
         """
         Sets object attribute only if it can be converted to given type.
         """
-        if type_class in {bool, int, str, float}:
-            new_value = type_class(value)
+        if type_class is str:
+            new_value = value if type(value) is str else str(value)
+        elif type_class is int:
+            new_value = value if type(value) is int else int(value)
+        elif type_class is bool:
+            new_value = bool(value)
+        elif type_class is float:
+            new_value = float(value)
         else:
             raise NotImplementedError(type_class)
         setattr(self, attr_name, new_value)
@@ -232,6 +547,11 @@ class ARObject:
         """
         Checks that value is non-negative before updating attribute
         """
+        if value.__class__ is int:
+            if value < 0:
+                raise ValueError(f"Positive integer expected: {value}")
+            setattr(self, attr_name, value)
+            return
         if not isinstance(value, int):
             raise TypeError(f"Invalid type for '{attr_name}'. Expected int, got '{str(type(value))}'")
         if value < 0:
@@ -243,6 +563,8 @@ class ARObject:
         Iterates through list of elements and return the first whose
         name matches the name argument
         """
+        if type(elements) is ElementList:
+            return elements.get_by_name(name)
         for elem in elements:
             if elem.name == name:
                 return elem
@@ -255,9 +577,37 @@ class Referrable(ARObject):
     Type: Abstract
     """
 
+    __slots__ = ("_name", "_parent", "_ref_cache")
+
     def __init__(self, name: str) -> None:
-        self.name: str = name  # .SHORT-NAME
-        self.parent: 'CollectableElement' = None
+        self._name: str = _intern_str(name)  # .SHORT-NAME
+        self._parent: 'CollectableElement' = None
+        self._ref_cache: str | None = None
+
+    @property
+    def name(self) -> str:
+        """
+        Name of the element (.SHORT-NAME)
+        """
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = _intern_str(value)
+        self._invalidate_ref()
+        ElementList.name_changed()
+
+    @property
+    def parent(self) -> Any:
+        """
+        Parent object, used when generating references
+        """
+        return self._parent
+
+    @parent.setter
+    def parent(self, value: Any) -> None:
+        self._parent = value
+        self._invalidate_ref()
 
     @property
     def short_name(self) -> str:
@@ -266,6 +616,32 @@ class Referrable(ARObject):
         """
         return self.name
 
+    def _invalidate_ref(self) -> None:
+        """
+        Clears cached reference string
+        """
+        self._ref_cache = None
+
+    def _ref_str(self) -> str | None:
+        """
+        Returns reference string to this object or None if it has no parent.
+        The string is cached until name or parent (of any ancestor package) changes.
+        A cached reference of the parent is reused as prefix.
+        """
+        if self._ref_cache is None:
+            parent = self._parent
+            if parent is None:
+                return None
+            parent_ref = parent._ref_str() if isinstance(parent, Referrable) else None
+            if parent_ref is not None:
+                self._ref_cache = parent_ref + '/' + self._name
+            else:
+                ref_parts: list[str] = []
+                parent.update_ref_parts(ref_parts)
+                ref_parts.append(self._name)
+                self._ref_cache = '/'.join(ref_parts)
+        return self._ref_cache
+
 
 class MultiLanguageReferrable(Referrable):
     """
@@ -273,6 +649,8 @@ class MultiLanguageReferrable(Referrable):
     Type: Abstract
     """
 
+    __slots__ = ("long_name",)
+
     def __init__(self,
                  name: str,
                  long_name: Union["MultilanguageLongName", None] = None) -> None:
@@ -292,6 +670,11 @@ class Identifiable(MultiLanguageReferrable):
     Type: Abstract
     """
 
+    __slots__ = ("desc", "_category", "admin_data", "introduction", "annotations", "_uuid")
+
+    category = OptionalAttr(str)
+    uuid = OptionalAttr(str)
+
     def __init__(self,
                  name: str,
                  desc: Union["MultiLanguageOverviewParagraph", tuple, str, None] = None,
@@ -300,22 +683,16 @@ class Identifiable(MultiLanguageReferrable):
                  **kwargs) -> None:
         super().__init__(name, **kwargs)
         self.desc: MultiLanguageOverviewParagraph | None = None
-        self.category = None
+        self.category = _intern_str(category)
         self.admin_data = None
         self.introduction = None
         self.annotations = None
-        self.uuid = None
+        self.uuid = uuid
         if desc is not None:
-            if isinstance(desc, MultiLanguageOverviewParagraph):
-                self.desc = desc
-            elif isinstance(desc, str):
-                self.desc = MultiLanguageOverviewParagraph.make(ar_enum.Language.FOR_ALL, desc)
-            elif isinstance(desc, tuple) and len(desc) == 2:
-                self.desc = MultiLanguageOverviewParagraph.make(*desc)
-            else:
+            desc_ctor = _lookup_ctor(_DESC_CTORS, desc)
+            if desc_ctor is None:
                 raise TypeError(f"Invalid type for argument 'desc': {str(type(desc))}")
-        self._assign_optional('category', category, str)
-        self._assign_optional('uuid', uuid, str)
+            self.desc = desc_ctor(desc)
 
 
 class CollectableElement(Identifiable):
@@ -330,6 +707,8 @@ class CollectableElement(Identifiable):
     Type Abstract
     """
 
+    __slots__ = ()
+
 
 class ARElement(CollectableElement):
     """
@@ -340,6 +719,8 @@ class ARElement(CollectableElement):
     Type: Abstract
     """
 
+    __slots__ = ()
+
 # AdminData
 
 
@@ -356,198 +737,200 @@ class AdminData(ARObject):
 # Reference classes
 
 
-class BaseRef(ARObject, abc.ABC):
+class BaseRef(ARObject):
     """
     Bas type for all references
     Complex-type AR:REF
     Type: Abstract
     """
 
+    __slots__ = ("value", "dest")
+
+    # Overridden by each concrete reference class
+    _ACCEPTED_SUBTYPES: frozenset[ar_enum.IdentifiableSubTypes] = frozenset()
+    # Used when dest is not given, only set for single sub-type references
+    _DEFAULT_DEST: ar_enum.IdentifiableSubTypes | None = None
+
     def __init__(self,
                  value: str,
-                 dest: ar_enum.IdentifiableSubTypes) -> None:
-        self.value = value
+                 dest: ar_enum.IdentifiableSubTypes | None = None) -> None:
+        # Reference strings repeat a lot within a model, let equal ones share storage
+        self.value = sys.intern(value) if type(value) is str else value
         self.dest: ar_enum.IdentifiableSubTypes = None
-        if dest in self._accepted_subtypes():
+        if dest is None:
+            dest = self._DEFAULT_DEST
+        if dest in type(self)._ACCEPTED_SUBTYPES:
             self.dest = dest
         else:
             raise ValueError(f"{str(dest)} is not a valid sub-type for {str(type(self))}")
 
-    @abc.abstractmethod
-    def _accepted_subtypes(self) -> set[ar_enum.IdentifiableSubTypes]:
+    @classmethod
+    def _accepted_subtypes(cls) -> frozenset[ar_enum.IdentifiableSubTypes]:
         """
         Subset of ar_enum.IdentifiableSubTypes defining
         which enum values are acceptable for dest
         """
+        return cls._ACCEPTED_SUBTYPES
 
     def __str__(self) -> str:
         """Returns reference as string"""
         return self.value
 
 
+def ref_subtypes(*subtypes: ar_enum.IdentifiableSubTypes):
+    """
+    Class decorator for BaseRef subclasses.
+    Sets the accepted sub-types for dest and installs an __init__
+    specialized for them. Classes accepting a single sub-type
+    use it as default value for dest.
+    """
+    accepted = frozenset(subtypes)
+
+    def decorator(cls: type[BaseRef]) -> type[BaseRef]:
+        cls._ACCEPTED_SUBTYPES = accepted
+        if len(accepted) == 1:
+            default_dest = subtypes[0]
+            cls._DEFAULT_DEST = default_dest
+
+            def __init__(self, value: str, dest: ar_enum.IdentifiableSubTypes | None = None) -> None:
+                self.value = sys.intern(value) if value.__class__ is str else value
+                if dest is not None and dest is not default_dest:
+                    raise ValueError(f"{str(dest)} is not a valid sub-type for {str(type(self))}")
+                self.dest = default_dest
+        else:
+            def __init__(self, value: str, dest: ar_enum.IdentifiableSubTypes) -> None:
+                self.value = sys.intern(value) if value.__class__ is str else value
+                if dest not in accepted:
+                    raise ValueError(f"{str(dest)} is not a valid sub-type for {str(type(self))}")
+                self.dest = dest
+        __init__.__qualname__ = f"{cls.__qualname__}.__init__"
+        cls.__init__ = __init__
+        return cls
+    return decorator
+
+
+@ref_subtypes(ar_enum.IdentifiableSubTypes.COMPU_METHOD)
 class CompuMethodRef(BaseRef):
     """
     CompuMethod reference
     """
 
-    def __init__(self, value: str) -> None:
-        super().__init__(value, ar_enum.IdentifiableSubTypes.COMPU_METHOD)
-
-    def _accepted_subtypes(self) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.COMPU_METHOD}
+    __slots__ = ()
 
 
+@ref_subtypes(ar_enum.IdentifiableSubTypes.BSW_MODULE_ENTRY)
 class FunctionPtrSignatureRef(BaseRef):
     """
     Function pointer signature reference
     """
 
-    def __init__(self, value: str) -> None:
-        super().__init__(value, ar_enum.IdentifiableSubTypes.BSW_MODULE_ENTRY)
-
-    def _accepted_subtypes(self) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.BSW_MODULE_ENTRY}
+    __slots__ = ()
 
 
+@ref_subtypes(ar_enum.IdentifiableSubTypes.IMPLEMENTATION_DATA_TYPE)
 class ImplementationDataTypeRef(BaseRef):
     """
     ImplementationDataType reference
     """
 
-    def __init__(self, value: str) -> None:
-        super().__init__(value, ar_enum.IdentifiableSubTypes.IMPLEMENTATION_DATA_TYPE)
-
-    def _accepted_subtypes(self) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.IMPLEMENTATION_DATA_TYPE}
+    __slots__ = ()
 
 
+@ref_subtypes(ar_enum.IdentifiableSubTypes.SW_ADDR_METHOD)
 class SwAddrMethodRef(BaseRef):
     """
     SwAddrMethod reference
     """
 
-    def __init__(self, value: str) -> None:
-        super().__init__(value, ar_enum.IdentifiableSubTypes.SW_ADDR_METHOD)
-
-    def _accepted_subtypes(self) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.SW_ADDR_METHOD}
+    __slots__ = ()
 
 
+@ref_subtypes(ar_enum.IdentifiableSubTypes.SW_BASE_TYPE)
 class SwBaseTypeRef(BaseRef):
     """
     SwBaseType reference
     """
 
-    def __init__(self, value: str) -> None:
-        super().__init__(value, ar_enum.IdentifiableSubTypes.SW_BASE_TYPE)
-
-    def _accepted_subtypes(self) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.SW_BASE_TYPE}
+    __slots__ = ()
 
 
+@ref_subtypes(ar_enum.IdentifiableSubTypes.DATA_CONSTR)
 class DataConstraintRef(BaseRef):
     """
     DataConstraint reference
     """
 
-    def __init__(self, value: str) -> None:
-        super().__init__(value, ar_enum.IdentifiableSubTypes.DATA_CONSTR)
-
-    def _accepted_subtypes(self) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.DATA_CONSTR}
+    __slots__ = ()
 
 
+@ref_subtypes(ar_enum.IdentifiableSubTypes.PHYSICAL_DIMENSION)
 class PhysicalDimensionRef(BaseRef):
     """
     PhysicalDimension reference
     """
 
-    def __init__(self, value: str) -> None:
-        super().__init__(value, ar_enum.IdentifiableSubTypes.PHYSICAL_DIMENSION)
-
-    def _accepted_subtypes(self) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.PHYSICAL_DIMENSION}
+    __slots__ = ()
 
 
+@ref_subtypes(ar_enum.IdentifiableSubTypes.UNIT)
 class UnitRef(BaseRef):
     """
-    DataConstraint reference
+    Unit reference
     """
 
-    def __init__(self, value: str) -> None:
-        super().__init__(value, ar_enum.IdentifiableSubTypes.UNIT)
-
-    def _accepted_subtypes(self) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.UNIT}
+    __slots__ = ()
 
 
+@ref_subtypes(ar_enum.IdentifiableSubTypes.APPLICATION_PRIMITIVE_DATA_TYPE)
 class IndexDataTypeRef(BaseRef):
     """
     IndexDataType reference
     """
 
-    def __init__(self, value: str) -> None:
-        super().__init__(value, ar_enum.IdentifiableSubTypes.APPLICATION_PRIMITIVE_DATA_TYPE)
-
-    def _accepted_subtypes(self) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.APPLICATION_PRIMITIVE_DATA_TYPE}
+    __slots__ = ()
 
 
+@ref_subtypes(ar_enum.IdentifiableSubTypes.APPLICATION_ARRAY_DATA_TYPE,
+              ar_enum.IdentifiableSubTypes.APPLICATION_ASSOC_MAP_DATA_TYPE,
+              ar_enum.IdentifiableSubTypes.APPLICATION_COMPOSITE_DATA_TYPE,
+              ar_enum.IdentifiableSubTypes.APPLICATION_DATA_TYPE,
+              ar_enum.IdentifiableSubTypes.APPLICATION_DEFERRED_DATA_TYPE,
+              ar_enum.IdentifiableSubTypes.APPLICATION_PRIMITIVE_DATA_TYPE,
+              ar_enum.IdentifiableSubTypes.APPLICATION_RECORD_DATA_TYPE)
 class ApplicationDataTypeRef(BaseRef):
     """
     Application data type reference
     """
 
-    def _accepted_subtypes(self) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.APPLICATION_ARRAY_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_ASSOC_MAP_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_COMPOSITE_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_DEFERRED_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_PRIMITIVE_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_RECORD_DATA_TYPE}
+    __slots__ = ()
 
 
+@ref_subtypes(ar_enum.IdentifiableSubTypes.ABSTRACT_IMPLEMENTATION_DATA_TYPE,
+              ar_enum.IdentifiableSubTypes.APPLICATION_ARRAY_DATA_TYPE,
+              ar_enum.IdentifiableSubTypes.APPLICATION_ASSOC_MAP_DATA_TYPE,
+              ar_enum.IdentifiableSubTypes.APPLICATION_COMPOSITE_DATA_TYPE,
+              ar_enum.IdentifiableSubTypes.APPLICATION_DATA_TYPE,
+              ar_enum.IdentifiableSubTypes.APPLICATION_DEFERRED_DATA_TYPE,
+              ar_enum.IdentifiableSubTypes.APPLICATION_PRIMITIVE_DATA_TYPE,
+              ar_enum.IdentifiableSubTypes.APPLICATION_RECORD_DATA_TYPE,
+              ar_enum.IdentifiableSubTypes.AUTOSAR_DATA_TYPE,
+              ar_enum.IdentifiableSubTypes.IMPLEMENTATION_DATA_TYPE)
 class AutosarDataTypeRef(BaseRef):
     """
     References to elements in AR:AUTOSAR-DATA-TYPE--SUBTYPES-ENUM
     """
 
-    def _accepted_subtypes(self) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.ABSTRACT_IMPLEMENTATION_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_ARRAY_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_ASSOC_MAP_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_COMPOSITE_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_DEFERRED_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_PRIMITIVE_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.APPLICATION_RECORD_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.AUTOSAR_DATA_TYPE,
-                ar_enum.IdentifiableSubTypes.IMPLEMENTATION_DATA_TYPE}
+    __slots__ = ()
 
 
+@ref_subtypes(ar_enum.IdentifiableSubTypes.CONSTANT_SPECIFICATION)
 class ConstantRef(BaseRef):
     """
     Reference to ConstantSpecification
     """
 
-    def __init__(self, value: str) -> None:
-        super().__init__(value, ar_enum.IdentifiableSubTypes.CONSTANT_SPECIFICATION)
+    __slots__ = ()
 
-    def _accepted_subtypes(self) -> set[ar_enum.IdentifiableSubTypes]:
-        """Acceptable values for dest"""
-        return {ar_enum.IdentifiableSubTypes.CONSTANT_SPECIFICATION}
 
 # Documentation Elements
 
@@ -562,6 +945,8 @@ class Break(ARObject):
 
     """
 
+    __slots__ = ()
+
 
 class EmphasisText(ARObject):
     """
@@ -575,6 +960,8 @@ class EmphasisText(ARObject):
 
     """
 
+    __slots__ = ("elements", "color", "font", "type")
+
     def __init__(self,
                  elements: None | list | str = None,
                  color: str = None,
@@ -602,6 +989,8 @@ class IndexEntry(ARObject):
     Limitations: Doesn't support sub-elements as seen in XML schema.
     """
 
+    __slots__ = ("text",)
+
     def __init__(self, text: str) -> None:
         self.text = text  # Text content
 
@@ -616,6 +1005,8 @@ class TechnicalTerm(ARObject):
 
     """
 
+    __slots__ = ("tex_render", "type", "text")
+
     def __init__(self,
                  text: str,
                  tex_render: str = None,
@@ -635,6 +1026,8 @@ class Subscript(ARObject):
 
     """
 
+    __slots__ = ("text",)
+
     def __init__(self, text: str) -> None:
         self.text = text  # Simple content
 
@@ -648,6 +1041,8 @@ class Superscript(ARObject):
     Superscript
     """
 
+    __slots__ = ("text",)
+
     def __init__(self, text: str) -> None:
         self.text = text  # Simple content
 
@@ -664,27 +1059,41 @@ class LanguageSpecific(ARObject):
     Type: Abstract
     """
 
+    __slots__ = ("language",)
+
     def __init__(self, language: ar_enum.Language) -> None:
-        assert isinstance(language, ar_enum.Language)
+        if language.__class__ is not ar_enum.Language:
+            raise TypeError(f"language: Expected type 'Language', got '{str(type(language))}'")
         self.language = language  # Attribute @L
 
 
+# Part types accepted by the MixedContentFor* classes
+_LONG_NAME_PART_TYPES = frozenset([str, TechnicalTerm, EmphasisText, Subscript, Superscript, IndexEntry])
+_OVERVIEW_PARAGRAPH_PART_TYPES = _LONG_NAME_PART_TYPES
+_PARAGRAPH_PART_TYPES = frozenset([str, Break, EmphasisText, IndexEntry, Subscript, Superscript, TechnicalTerm])
+
+
 class MixedContentForLongName(LanguageSpecific):
     """
     Group AR:MIXED-CONTENT-FOR-LONG-NAME
     Type: Abstract
     """
 
+    __slots__ = ("parts",)
+
     def __init__(self, language: ar_enum.Language) -> None:
         super().__init__(language)
-        self.parts = []  # Unbounded list of str | TT | E | SUP | SUB | IE
+        self.parts: list | None = None  # Unbounded list of str | TT | E | SUP | SUB | IE, allocated on first append
 
-    def append(self, part: str | TechnicalTerm | EmphasisText | Subscript | Subscript):
+    def append(self, part: str | TechnicalTerm | EmphasisText | Subscript | Superscript | IndexEntry):
         """
         Checks type validity before adding element to elements
         """
-        if isinstance(part, (str, TechnicalTerm, EmphasisText, Subscript, Subscript, IndexEntry)):
-            self.parts.append(part)
+        if part.__class__ in _LONG_NAME_PART_TYPES or isinstance(part, tuple(_LONG_NAME_PART_TYPES)):
+            parts = self.parts
+            if parts is None:
+                self.parts = parts = []
+            parts.append(part)
         else:
             raise TypeError('Unsupported element type: ' + str(type(part)))
 
@@ -695,20 +1104,25 @@ class MixedContentForOverviewParagraph(LanguageSpecific):
     Type: Abstract
     """
 
+    __slots__ = ("parts",)
+
     def __init__(self, language: ar_enum.Language) -> None:
         super().__init__(language)
-        self.parts = []  # Unbounded list of str | TT | E | SUP | SUB | IE
+        self.parts: list | None = None  # Unbounded list of str | TT | E | SUP | SUB | IE, allocated on first append
         # Unsupported elements:
         # FT : AR:SL-OVERVIEW-PARAGRAPH
         # TRACE-REF: Complex-type
         # XREF: AR:-XREF-TARGET
 
-    def append(self, part: str | TechnicalTerm | EmphasisText | Subscript | Subscript):
+    def append(self, part: str | TechnicalTerm | EmphasisText | Subscript | Superscript | IndexEntry):
         """
         Checks type validity before adding element to elements
         """
-        if isinstance(part, (str, TechnicalTerm, EmphasisText, Subscript, Subscript, IndexEntry)):
-            self.parts.append(part)
+        if part.__class__ in _OVERVIEW_PARAGRAPH_PART_TYPES or isinstance(part, tuple(_OVERVIEW_PARAGRAPH_PART_TYPES)):
+            parts = self.parts
+            if parts is None:
+                self.parts = parts = []
+            parts.append(part)
         else:
             raise TypeError('Unsupported element type: ' + str(type(part)))
 
@@ -728,9 +1142,11 @@ class LanguageLongName(MixedContentForLongName):
     * TechnicalTerm
     * EmphasisText
     * Subscript
-    * Subscript
+    * Superscript
     """
 
+    __slots__ = ()
+
     def __init__(self, language: ar_enum.Language, parts: None | str | list[Any] = None) -> None:
         super().__init__(language)
         if parts is not None:
@@ -748,12 +1164,19 @@ class MultilanguageLongName(ARObject):
     Tag variants: 'LABEL' | 'LONG-NAME'
     """
 
+    __slots__ = ("elements",)
+
     def __init__(self,
                  long_name: None | tuple[ar_enum.Language,
                                          str] | LanguageLongName = None) -> None:
         self.elements: list[LanguageLongName] = []
         if long_name is not None:
-            if isinstance(long_name, LanguageLongName):
+            long_name_type = long_name.__class__
+            if long_name_type is LanguageLongName:
+                self.elements.append(long_name)
+            elif long_name_type is tuple:
+                self.elements.append(LanguageLongName(long_name[0], long_name[1]))
+            elif isinstance(long_name, LanguageLongName):
                 self.append(long_name)
             elif isinstance(long_name, tuple):
                 self.append(LanguageLongName(long_name[0], long_name[1]))
@@ -766,10 +1189,24 @@ class MultilanguageLongName(ARObject):
         """
         Adds long_name to its inner list with type-check
         """
-        assert isinstance(long_name, LanguageLongName)
+        if not isinstance(long_name, LanguageLongName):
+            raise TypeError(f"long_name: Expected type 'LanguageLongName', got '{str(type(long_name))}'")
         self.elements.append(long_name)
 
 
+def _coerce_multilanguage_long_name(attr_name: str,
+                                    value: MultilanguageLongName | tuple[ar_enum.Language, str] | LanguageLongName
+                                    ) -> MultilanguageLongName:
+    """
+    Returns value as MultilanguageLongName, wrapping tuples and LanguageLongName objects when needed
+    """
+    if isinstance(value, MultilanguageLongName):
+        return value
+    if isinstance(value, (tuple, LanguageLongName)):
+        return MultilanguageLongName(value)
+    raise TypeError(f"Invalid type for '{attr_name}': {str(type(value))}")
+
+
 class LanguageOverviewParagraph(MixedContentForOverviewParagraph):
     """
     Complex-type AR:L-OVERVIEW-PARAGRAPH
@@ -785,9 +1222,11 @@ class LanguageOverviewParagraph(MixedContentForOverviewParagraph):
     * TechnicalTerm
     * EmphasisText
     * Subscript
-    * Subscript
+    * Superscript
     """
 
+    __slots__ = ()
+
     def __init__(self, language: ar_enum.Language, parts: None | str | list[Any] = None) -> None:
         super().__init__(language)
         if parts is not None:
@@ -805,12 +1244,19 @@ class MultiLanguageOverviewParagraph(ARObject):
     Tag variants: 'DESC' | 'ITEM-LABEL' | 'CHANGE' | 'REASON'
     """
 
+    __slots__ = ("elements",)
+
     def __init__(self,
                  paragraph: None | tuple[ar_enum.Language,
                                          str] | LanguageOverviewParagraph = None) -> None:
         self.elements: list[LanguageOverviewParagraph] = []
         if paragraph is not None:
-            if isinstance(paragraph, LanguageOverviewParagraph):
+            paragraph_type = paragraph.__class__
+            if paragraph_type is LanguageOverviewParagraph:
+                self.elements.append(paragraph)
+            elif paragraph_type is tuple and len(paragraph) == 2:
+                self.elements.append(LanguageOverviewParagraph(*paragraph))
+            elif isinstance(paragraph, LanguageOverviewParagraph):
                 self.append(paragraph)
             elif isinstance(paragraph, tuple) and len(paragraph) == 2:
                 self.append(LanguageOverviewParagraph(*paragraph))
@@ -823,7 +1269,8 @@ class MultiLanguageOverviewParagraph(ARObject):
         """
         Adds long_name to its inner list with type-check
         """
-        assert isinstance(paragraph, LanguageOverviewParagraph)
+        if not isinstance(paragraph, LanguageOverviewParagraph):
+            raise TypeError(f"paragraph: Expected type 'LanguageOverviewParagraph', got '{str(type(paragraph))}'")
         self.elements.append(paragraph)
 
     @classmethod
@@ -834,6 +1281,23 @@ class MultiLanguageOverviewParagraph(ARObject):
         return cls(LanguageOverviewParagraph(language, paragraph))
 
 
+def _desc_from_tuple(desc: tuple) -> MultiLanguageOverviewParagraph:
+    """
+    Creates description from (language, text) tuple
+    """
+    if len(desc) != 2:
+        raise TypeError(f"Invalid type for argument 'desc': {str(type(desc))}")
+    return MultiLanguageOverviewParagraph.make(*desc)
+
+
+# Converters used by Identifiable.__init__ for its desc argument, keyed by exact type
+_DESC_CTORS = {
+    MultiLanguageOverviewParagraph: lambda desc: desc,
+    str: lambda desc: MultiLanguageOverviewParagraph.make(ar_enum.Language.FOR_ALL, desc),
+    tuple: _desc_from_tuple,
+}
+
+
 class DocumentViewSelectable(ARObject):
     """
     Group AR:DOCUMENT-VIEW-SELECTABLE
@@ -844,6 +1308,8 @@ class DocumentViewSelectable(ARObject):
 
     """
 
+    __slots__ = ("semantic_information", "view")
+
     def __init__(self,
                  semantic_information: None | str = None,
                  view: None | str = None) -> None:
@@ -866,6 +1332,8 @@ class Paginateable(DocumentViewSelectable):
     Unknown parent attributes hidden in kwargs
     """
 
+    __slots__ = ("page_break", "keep_with_previous")
+
     def __init__(self,
                  page_break: None | ar_enum.PageBreak = None,
                  keep_with_previous: None | ar_enum.KeepWithPrevious = None,
@@ -887,9 +1355,12 @@ class MixedContentForParagraph(LanguageSpecific):
     Type: Abstract
     """
 
+    __slots__ = ("parts",)
+
     def __init__(self, language: ar_enum.Language) -> None:
         super().__init__(language)
-        self.parts = []  # Unbounded list of str | BR | E | IE | SUB | SUP | TT
+        # Unbounded list of str | BR | E | IE | SUB | SUP | TT, allocated on first append
+        self.parts: list | None = None
         # Unsupported elements:
         # FT : AR:SL-OVERVIEW-PARAGRAPH
         # STD: AR:STD
@@ -900,12 +1371,15 @@ class MixedContentForParagraph(LanguageSpecific):
         # XREF-TARGET: AR:-XREF-TARGET
 
     def append(self,
-               part: str | Break | EmphasisText | IndexEntry | Subscript | Subscript | TechnicalTerm):
+               part: str | Break | EmphasisText | IndexEntry | Subscript | Superscript | TechnicalTerm):
         """
         Checks type validity before adding element to elements
         """
-        if isinstance(part, (str, Break, EmphasisText, IndexEntry, Subscript, Subscript, TechnicalTerm)):
-            self.parts.append(part)
+        if part.__class__ in _PARAGRAPH_PART_TYPES or isinstance(part, tuple(_PARAGRAPH_PART_TYPES)):
+            parts = self.parts
+            if parts is None:
+                self.parts = parts = []
+            parts.append(part)
         else:
             raise TypeError('Unsupported element type: ' + str(type(part)))
 
@@ -926,9 +1400,11 @@ class LanguageParagraph(MixedContentForParagraph):
     * EmphasisText
     * TechnicalTerm
     * Subscript
-    * Subscript
+    * Superscript
     """
 
+    __slots__ = ()
+
     def __init__(self, language: ar_enum.Language, parts: None | str | list[Any] = None) -> None:
         super().__init__(language)
         if parts is not None:
@@ -939,6 +1415,13 @@ class LanguageParagraph(MixedContentForParagraph):
                     self.append(part)
 
 
+# Converters used by MultiLanguageParagraph.__init__ for its paragraph argument, keyed by exact type
+_PARAGRAPH_CTORS = {
+    LanguageParagraph: lambda paragraph: paragraph,
+    tuple: lambda paragraph: LanguageParagraph(paragraph[0], paragraph[1]),
+}
+
+
 class MultiLanguageParagraph(Paginateable):
     """
     Complex-type AR:MULTI-LANGUAGE-PARAGRAPH
@@ -955,22 +1438,31 @@ class MultiLanguageParagraph(Paginateable):
         self.help_entry = help_entry  # Attribute 'HELP-ENTRY'
         self.elements: list[LanguageParagraph] = []
         if paragraph is not None:
-            if isinstance(paragraph, LanguageParagraph):
-                self.append(paragraph)
-            elif isinstance(paragraph, tuple):
-                self.append(LanguageParagraph(paragraph[0], paragraph[1]))
-            else:
+            paragraph_ctor = _lookup_ctor(_PARAGRAPH_CTORS, paragraph)
+            if paragraph_ctor is None:
                 raise TypeError('Invalid type for paragraph. '
                                 f'Expected tuple[ar_enum.Language,str] or LanguageParagraph,'
                                 f' got "{str(type(paragraph))}"')
+            self.append(paragraph_ctor(paragraph))
 
     def append(self, paragraph: LanguageParagraph) -> None:
         """
         Adds long_name to its inner list with type-check
         """
-        assert isinstance(paragraph, LanguageParagraph)
+        if not isinstance(paragraph, LanguageParagraph):
+            raise TypeError(f"paragraph: Expected type 'LanguageParagraph', got '{str(type(paragraph))}'")
         self.elements.append(paragraph)
 
+    def extend_trusted(self, elements: Iterable[LanguageParagraph]) -> None:
+        """
+        Extends inner list without type-check.
+        Only use this when element types are already known to be correct.
+        """
+        self.elements.extend(elements)
+
+
+_VERBATIM_PART_TYPES = frozenset([str, Break, EmphasisText, TechnicalTerm])
+
 
 class MixedContentForVerbatim(LanguageSpecific):
     """
@@ -982,9 +1474,11 @@ class MixedContentForVerbatim(LanguageSpecific):
     own.
     """
 
+    __slots__ = ("parts",)
+
     def __init__(self, language: ar_enum.Language) -> None:
         super().__init__(language)
-        self.parts = []  # Unbounded list of str | BR | E | TT
+        self.parts: list | None = None  # Unbounded list of str | BR | E | TT, allocated on first append
         # Unsupported elements:
         # XREF: AR:XREF
 
@@ -993,8 +1487,11 @@ class MixedContentForVerbatim(LanguageSpecific):
         """
         Checks type validity before adding element to elements
         """
-        if isinstance(part, (str, Break, EmphasisText, TechnicalTerm)):
-            self.parts.append(part)
+        if part.__class__ in _VERBATIM_PART_TYPES or isinstance(part, tuple(_VERBATIM_PART_TYPES)):
+            parts = self.parts
+            if parts is None:
+                self.parts = parts = []
+            parts.append(part)
         else:
             raise TypeError('Unsupported element type: ' + str(type(part)))
 
@@ -1006,6 +1503,8 @@ class LanguageVerbatim(MixedContentForVerbatim):
     Tag variants: 'L-5'
     """
 
+    __slots__ = ()
+
     def __init__(self, language: ar_enum.Language, parts: None | str | list[Any] = None) -> None:
         super().__init__(language)
         if parts is not None:
@@ -1016,6 +1515,13 @@ class LanguageVerbatim(MixedContentForVerbatim):
                     self.append(part)
 
 
+# Converters used by MultiLanguageVerbatim.__init__ for its element argument, keyed by exact type
+_VERBATIM_CTORS = {
+    LanguageVerbatim: lambda element: element,
+    tuple: lambda element: LanguageVerbatim(element[0], element[1]),
+}
+
+
 class MultiLanguageVerbatim(Paginateable):
     """
     Complex-type AR:MULTI-LANGUAGE-VERBATIM
@@ -1036,23 +1542,38 @@ class MultiLanguageVerbatim(Paginateable):
         self.float = float  # Attribte 'FLOAT'
         self.page_wide = page_wide  # Attribute 'PGWIDE'
         self.help_entry = help_entry  # Attribute 'HELP-ENTRY'
-        self.elements: list[LanguageVerbatim] = []
+        self.elements: list[LanguageVerbatim] | None = None  # Allocated on first append
         if element is not None:
-            if isinstance(element, LanguageVerbatim):
-                self.append(element)
-            elif isinstance(element, tuple):
-                self.append(LanguageVerbatim(element[0], element[1]))
-            else:
+            element_ctor = _lookup_ctor(_VERBATIM_CTORS, element)
+            if element_ctor is None:
                 raise TypeError('Invalid type for element. '
                                 f'Expected tuple[ar_enum.Language,str] or LanguageVerbatim,'
                                 f' got "{str(type(element))}"')
+            self.append(element_ctor(element))
 
     def append(self, paragraph: LanguageVerbatim) -> None:
         """
         Adds long_name to its inner list with type-check
         """
-        assert isinstance(paragraph, LanguageVerbatim)
-        self.elements.append(paragraph)
+        if not isinstance(paragraph, LanguageVerbatim):
+            raise TypeError(f"paragraph: Expected type 'LanguageVerbatim', got '{str(type(paragraph))}'")
+        if self.elements is None:
+            self.elements = [paragraph]
+        else:
+            self.elements.append(paragraph)
+
+    def extend_trusted(self, elements: Iterable[LanguageVerbatim]) -> None:
+        """
+        Extends inner list without type-check.
+        Only use this when element types are already known to be correct.
+        """
+        if self.elements is None:
+            self.elements = list(elements) or None
+        else:
+            self.elements.extend(elements)
+
+
+_UNIT_NAMES_PART_TYPES = frozenset([str, Subscript, Superscript])
 
 
 class MixedContentForUnitNames(ARObject):
@@ -1061,16 +1582,21 @@ class MixedContentForUnitNames(ARObject):
     Type: Abstract
     """
 
+    __slots__ = ("parts",)
+
     def __init__(self) -> None:
-        self.parts = []  # Unbounded list of str | SUB | SUP
+        self.parts: list | None = None  # Unbounded list of str | SUB | SUP, allocated on first append
 
     def append(self,
                part: str | Break | EmphasisText | TechnicalTerm):
         """
         Checks type validity before adding element to elements
         """
-        if isinstance(part, (str, Subscript, Superscript)):
-            self.parts.append(part)
+        if part.__class__ in _UNIT_NAMES_PART_TYPES or isinstance(part, tuple(_UNIT_NAMES_PART_TYPES)):
+            parts = self.parts
+            if parts is None:
+                self.parts = parts = []
+            parts.append(part)
         else:
             raise TypeError('Unsupported element type: ' + str(type(part)))
 
@@ -1082,10 +1608,15 @@ class SingleLanguageUnitNames(MixedContentForUnitNames):
     Tag variants: 'PRM-UNIT' | 'UNIT-DISPLAY-NAME' | 'UNIT-DISPLAY-NAME' | 'DISPLAY-NAME'
     """
 
+    __slots__ = ()
+
     def __init__(self, parts: str | list | None = None) -> None:
         super().__init__()
         if parts is not None:
-            if isinstance(parts, Iterable):
+            parts_type = parts.__class__
+            if parts_type is str:
+                self.append(parts)
+            elif parts_type is list or parts_type is tuple or isinstance(parts, Iterable):
                 for part in parts:
                     self.append(part)
             else:
@@ -1096,8 +1627,13 @@ class SingleLanguageUnitNames(MixedContentForUnitNames):
         Convert to string if the unit name has simple
         type (at most one part of type str).
         """
+        parts = self.parts
+        if not parts:
+            return ""
+        if all(part.__class__ is str for part in parts):
+            return "".join(parts)
         result = []
-        for part in self.parts:
+        for part in parts:
             if isinstance(part, str):
                 result.append(part)
             elif isinstance(part, Superscript):
@@ -1107,6 +1643,9 @@ class SingleLanguageUnitNames(MixedContentForUnitNames):
         return "".join(result)
 
 
+_DOCUMENTATION_BLOCK_ELEMENT_TYPES = frozenset([MultiLanguageParagraph, MultiLanguageVerbatim])
+
+
 class DocumentationBlock(ARObject):
     """
     Complex type AR:DOCUMENTATION-BLOCK
@@ -1118,9 +1657,12 @@ class DocumentationBlock(ARObject):
 
     def __init__(self,
                  element: MultiLanguageParagraph | MultiLanguageVerbatim | list[Any] | None = None) -> None:
-        self.elements: list[MultiLanguageParagraph | MultiLanguageVerbatim] = []
+        self.elements: list[MultiLanguageParagraph | MultiLanguageVerbatim] | None = None  # Allocated on first append
         if element is not None:
-            if isinstance(element, Iterable):
+            element_type = element.__class__
+            if element_type in _DOCUMENTATION_BLOCK_ELEMENT_TYPES:
+                self.append(element)
+            elif element_type is list or element_type is tuple or isinstance(element, Iterable):
                 for elem in element:
                     self.append(elem)
             else:
@@ -1130,10 +1672,22 @@ class DocumentationBlock(ARObject):
         """
         Appends new element with type check
         """
-        assert isinstance(element,
-                          (MultiLanguageParagraph,
-                           MultiLanguageVerbatim))
-        self.elements.append(element)
+        if element.__class__ not in _DOCUMENTATION_BLOCK_ELEMENT_TYPES:
+            assert isinstance(element, (MultiLanguageParagraph, MultiLanguageVerbatim))
+        if self.elements is None:
+            self.elements = [element]
+        else:
+            self.elements.append(element)
+
+    def extend_trusted(self, elements: Iterable[MultiLanguageParagraph | MultiLanguageVerbatim]) -> None:
+        """
+        Extends inner list without type-check.
+        Only use this when element types are already known to be correct.
+        """
+        if self.elements is None:
+            self.elements = list(elements) or None
+        else:
+            self.elements.extend(elements)
 
 
 class GeneralAnnotation(ARObject):
@@ -1174,6 +1728,8 @@ class CompuRational(ARObject):
     Tag variants: 'COMPU-RATIONAL-COEFFS'
     """
 
+    __slots__ = ("numerator", "denominator")
+
     def __init__(self,
                  numerator: tuple[int | float] | list[int | float] | None,
                  denominator: tuple[int | float] | list[int | float] | None = None) -> None:
@@ -1200,6 +1756,8 @@ class CompuConst(ARObject):
     and AR:COMPU-CONST-TEXT-CONTENT dynamically
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: int | float | str):
         self.value = value
 
@@ -1211,6 +1769,9 @@ class CompuScale(ARObject):
     Tag variants: 'COMPU-SCALE'
     """
 
+    __slots__ = ("_content", "_content_type", "lower_limit", "upper_limit", "label", "symbol", "desc", "mask",
+                 "inverse_value", "lower_limit_type", "upper_limit_type")
+
     def __init__(self,
                  content: CompuConst | CompuRational | None = None,
                  lower_limit: int | float | str | None = None,
@@ -1225,13 +1786,18 @@ class CompuScale(ARObject):
         self.content = content                      # CHOICE(COMPU-SCALE-CONSTANT-CONTENTS, COMPU-SCALE-RATIONAL-FORMULA) # noqa E501 pylint: disable=C0301
         self.lower_limit = lower_limit              # .LOWER-LIMIT
         self.upper_limit = upper_limit              # .UPPER-LIMIT
-        self.label = label                          # .SHORT-LABEL
+        self.label = _intern_str(label)             # .SHORT-LABEL
         self.symbol = symbol                        # .SYMBOL
         self.desc = desc                            # .DESC
         self.mask = mask                            # .MASK
         self.inverse_value: CompuConst | None = None  # .COMPU-INVERSE-VALUE
         if inverse_value is not None:
-            if isinstance(inverse_value, CompuConst):
+            inverse_value_type = inverse_value.__class__
+            if inverse_value_type is CompuConst:
+                self.inverse_value = inverse_value
+            elif inverse_value_type is int or inverse_value_type is float or inverse_value_type is str:
+                self.inverse_value = CompuConst(inverse_value)
+            elif isinstance(inverse_value, CompuConst):
                 self.inverse_value = inverse_value
             elif isinstance(inverse_value, (int, float, str)):
                 self.inverse_value = CompuConst(inverse_value)
@@ -1241,17 +1807,27 @@ class CompuScale(ARObject):
         self.upper_limit_type = upper_limit_type    # .UPPER-LIMIT@INTERVAL-TYPE
         # .VARIATION-POINT not supported
 
+    @property
+    def content(self) -> CompuConst | CompuRational | None:
+        """Scale content"""
+        return self._content
+
+    @content.setter
+    def content(self, value: CompuConst | CompuRational | None) -> None:
+        self._content = value
+        if isinstance(value, CompuConst):
+            self._content_type = ar_enum.CompuScaleContent.CONSTANT
+        elif isinstance(value, CompuRational):
+            self._content_type = ar_enum.CompuScaleContent.RATIONAL
+        else:
+            self._content_type = ar_enum.CompuScaleContent.NONE
+
     @property
     def content_type(self) -> ar_enum.CompuScaleContent:
         """
         What kind of content does this CompuScale have?
         """
-        if isinstance(self.content, CompuConst):
-            return ar_enum.CompuScaleContent.CONSTANT
-        elif isinstance(self.content, CompuRational):
-            return ar_enum.CompuScaleContent.RATIONAL
-        else:
-            return ar_enum.CompuScaleContent.NONE
+        return self._content_type
 
 
 class Computation(ARObject):
@@ -1261,6 +1837,8 @@ class Computation(ARObject):
     Tag variants: 'COMPU-INTERNAL-TO-PHYS' | 'COMPU-PHYS-TO-INTERNAL'
     """
 
+    __slots__ = ("compu_scales", "default_value")
+
     def __init__(self,
                  compu_scales: list[CompuScale] | None = None,
                  default_value: CompuConst | int | float | str | None = None) -> None:
@@ -1290,6 +1868,14 @@ class Computation(ARObject):
         auto_label: automatically creates a <SHORT-LABEL> based on the text value.
 
         """
+        if isinstance(elements, (list, tuple)) and all(elem.__class__ is str for elem in elements):
+            # Fast path for plain list of text values
+            compu_scale, compu_const = CompuScale, CompuConst
+            if auto_label:
+                compu_scales = [compu_scale(compu_const(value), i, i, value) for i, value in enumerate(elements)]
+            else:
+                compu_scales = [compu_scale(compu_const(value), i, i) for i, value in enumerate(elements)]
+            return cls(compu_scales, default_value)
         compu_scales = []
         for i, elem in enumerate(elements):
             label = None
@@ -1340,6 +1926,8 @@ class CompuMethod(ARElement):
     Tag Variants: 'COMPU-METHOD'
     """
 
+    __slots__ = ("int_to_phys", "phys_to_int", "display_format", "unit_ref")
+
     def __init__(self, name: str,
                  int_to_phys: Computation | None = None,
                  phys_to_int: Computation | None = None,
@@ -1350,23 +1938,27 @@ class CompuMethod(ARElement):
         self.int_to_phys = int_to_phys        # .COMPU-INTERNAL-TO-PHYS
         self.phys_to_int = phys_to_int        # .COMPU-PHYS-TO-INTERNAL
         self.unit_ref = unit_ref              # .UNIT-REF
-        self.display_format = display_format  # .DISPLAY-FORMAT
+        self.display_format = _intern_str(display_format)  # .DISPLAY-FORMAT
 
     def ref(self) -> CompuMethodRef | None:
         """
         Reference
         """
-        if self.parent is None:
+        value = self._ref_str()
+        if value is None:
             return None
-        ref_parts: list[str] = [self.name]
-        self.parent.update_ref_parts(ref_parts)
-        value = '/'.join(reversed(ref_parts))
         return CompuMethodRef(value)
 
 
 # Constraint elements
 
 
+_LOWER_LIMIT_CHECKS = {ar_enum.IntervalType.CLOSED: operator.ge,
+                       ar_enum.IntervalType.OPEN: operator.gt}
+_UPPER_LIMIT_CHECKS = {ar_enum.IntervalType.CLOSED: operator.le,
+                       ar_enum.IntervalType.OPEN: operator.lt}
+
+
 class LimitObject(ARObject):
     """
     Base class for elements that has
@@ -1374,6 +1966,10 @@ class LimitObject(ARObject):
     Type: Abstract
     """
 
+    __slots__ = ("lower_limit", "upper_limit",
+                 "_lower_limit_type", "_upper_limit_type",
+                 "_lower_limit_check", "_upper_limit_check")
+
     def __init__(self,
                  lower_limit: int | float | None = None,
                  upper_limit: int | float | None = None,
@@ -1385,26 +1981,45 @@ class LimitObject(ARObject):
         self.lower_limit_type = lower_limit_type    # .LOWER-LIMIT@INTERVAL-TYPE
         self.upper_limit_type = upper_limit_type    # .UPPER-LIMIT@INTERVAL-TYPE
 
+    @property
+    def lower_limit_type(self) -> ar_enum.IntervalType:
+        """Interval type of lower limit"""
+        return self._lower_limit_type
+
+    @lower_limit_type.setter
+    def lower_limit_type(self, value: ar_enum.IntervalType) -> None:
+        self._lower_limit_type = value
+        self._lower_limit_check = _LOWER_LIMIT_CHECKS.get(value, operator.gt)
+
+    @property
+    def upper_limit_type(self) -> ar_enum.IntervalType:
+        """Interval type of upper limit"""
+        return self._upper_limit_type
+
+    @upper_limit_type.setter
+    def upper_limit_type(self, value: ar_enum.IntervalType) -> None:
+        self._upper_limit_type = value
+        self._upper_limit_check = _UPPER_LIMIT_CHECKS.get(value, operator.lt)
+
     @property
     def is_empty(self) -> bool:
         """Overrides is_empty from base class"""
-        return self.is_empty_with_ignore({"lower_limit_type", "upper_limit_type"})
+        return self.is_empty_with_ignore({"_lower_limit_type", "_upper_limit_type",
+                                          "_lower_limit_check", "_upper_limit_check"})
 
     def check_value(self, value: int | float) -> bool:
         """
         Checks if given value is inside the constraint limits
         """
-        if self.lower_limit_type == ar_enum.IntervalType.CLOSED:
-            if value < self.lower_limit:
-                return False
-        elif value <= self.lower_limit:
-            return False
-        if self.upper_limit_type == ar_enum.IntervalType.CLOSED:
-            if value > self.upper_limit:
-                return False
-        elif value >= self.upper_limit:
-            return False
-        return True
+        return self._lower_limit_check(value, self.lower_limit) and self._upper_limit_check(value, self.upper_limit)
+
+    def check_values(self, values: Iterable[int | float]) -> list[bool]:
+        """
+        Checks a sequence of values against the constraint limits
+        """
+        lower_check, lower_limit = self._lower_limit_check, self.lower_limit
+        upper_check, upper_limit = self._upper_limit_check, self.upper_limit
+        return [lower_check(value, lower_limit) and upper_check(value, upper_limit) for value in values]
 
 
 class ScaleConstraint(LimitObject):
@@ -1414,6 +2029,8 @@ class ScaleConstraint(LimitObject):
     Tag variants: 'SCALE-CONSTR'
     """
 
+    __slots__ = ("label", "desc", "validity")
+
     def __init__(self,
                  label: str | None = None,
                  desc: MultiLanguageOverviewParagraph | None = None,
@@ -1423,7 +2040,7 @@ class ScaleConstraint(LimitObject):
                  lower_limit_type: ar_enum.IntervalType = ar_enum.IntervalType.CLOSED,
                  upper_limit_type: ar_enum.IntervalType = ar_enum.IntervalType.CLOSED) -> None:
         super().__init__(lower_limit, upper_limit, lower_limit_type, upper_limit_type)
-        self.label = label
+        self.label = _intern_str(label)
         self.desc = desc
         self.validity = validity
 
@@ -1434,6 +2051,8 @@ class ConstraintBase(LimitObject):
     Type: Abstract
     """
 
+    __slots__ = ("scale_constrs", "max_gradient", "max_diff", "monotony")
+
     def __init__(self,
                  lower_limit: int | float | None = None,
                  upper_limit: int | float | None = None,
@@ -1442,9 +2061,14 @@ class ConstraintBase(LimitObject):
                  max_diff: int | float | None = None,
                  monotony: ar_enum.Monotony | None = None,
                  lower_limit_type: ar_enum.IntervalType = ar_enum.IntervalType.CLOSED,
-                 upper_limit_type: ar_enum.IntervalType = ar_enum.IntervalType.CLOSED) -> None:
+                 upper_limit_type: ar_enum.IntervalType = ar_enum.IntervalType.CLOSED,
+                 _own_list: bool = False) -> None:
         super().__init__(lower_limit, upper_limit, lower_limit_type, upper_limit_type)
-        self.scale_constrs = list(scale_constrs) if scale_constrs else []
+        # When _own_list is True the caller hands over ownership of scale_constrs and no copy is made
+        if _own_list and scale_constrs is not None:
+            self.scale_constrs = scale_constrs
+        else:
+            self.scale_constrs = list(scale_constrs) if scale_constrs else []
         self.max_gradient = max_gradient
         self.max_diff = max_diff
         self.monotony = monotony
@@ -1457,6 +2081,8 @@ class InternalConstraint(ConstraintBase):
     Tag variants: 'INTERNAL-CONSTRS'
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  lower_limit: int | float | None = None,
                  upper_limit: int | float | None = None,
@@ -1465,7 +2091,8 @@ class InternalConstraint(ConstraintBase):
                  max_diff: int | float | None = None,
                  monotony: ar_enum.Monotony | None = None,
                  lower_limit_type: ar_enum.IntervalType = ar_enum.IntervalType.CLOSED,
-                 upper_limit_type: ar_enum.IntervalType = ar_enum.IntervalType.CLOSED) -> None:
+                 upper_limit_type: ar_enum.IntervalType = ar_enum.IntervalType.CLOSED,
+                 _own_list: bool = False) -> None:
         super().__init__(lower_limit,
                          upper_limit,
                          scale_constr,
@@ -1473,7 +2100,8 @@ class InternalConstraint(ConstraintBase):
                          max_diff,
                          monotony,
                          lower_limit_type,
-                         upper_limit_type)
+                         upper_limit_type,
+                         _own_list)
 
 
 class PhysicalConstraint(ConstraintBase):
@@ -1483,6 +2111,8 @@ class PhysicalConstraint(ConstraintBase):
     Tag variants: 'PHYS-CONSTRS'
     """
 
+    __slots__ = ("unit_ref",)
+
     def __init__(self,
                  lower_limit: int | float | None = None,
                  upper_limit: int | float | None = None,
@@ -1492,7 +2122,8 @@ class PhysicalConstraint(ConstraintBase):
                  monotony: ar_enum.Monotony | None = None,
                  unit_ref: UnitRef | None = None,
                  lower_limit_type: ar_enum.IntervalType = ar_enum.IntervalType.CLOSED,
-                 upper_limit_type: ar_enum.IntervalType = ar_enum.IntervalType.CLOSED) -> None:
+                 upper_limit_type: ar_enum.IntervalType = ar_enum.IntervalType.CLOSED,
+                 _own_list: bool = False) -> None:
         super().__init__(lower_limit,
                          upper_limit,
                          scale_constr,
@@ -1500,7 +2131,8 @@ class PhysicalConstraint(ConstraintBase):
                          max_diff,
                          monotony,
                          lower_limit_type,
-                         upper_limit_type)
+                         upper_limit_type,
+                         _own_list)
         self.unit_ref = unit_ref
 
 
@@ -1511,6 +2143,8 @@ class DataConstraintRule(ARObject):
     Tag variants: 'DATA-CONSTR-RULE'
     """
 
+    __slots__ = ("level", "physical", "internal")
+
     def __init__(self,
                  internal: InternalConstraint | None = None,
                  physical: PhysicalConstraint | None = None,
@@ -1527,25 +2161,38 @@ class DataConstraint(ARElement):
     Tag variants: 'DATA-CONSTR'
     """
 
+    __slots__ = ("rules",)
+
     def __init__(self, name: str,
                  rules: list[DataConstraintRule] | None = None,
                  **kwargs: dict) -> None:
         super().__init__(name, **kwargs)
-        self.rules = []
-        if rules is not None:
+        self.rules: list[DataConstraintRule] | None = None  # Allocated on first append
+        if rules:
+            self.rules = []
+            append = self.rules.append
             for rule in rules:
-                assert isinstance(rule, DataConstraintRule)
-            self.rules.extend(rules)
+                if not isinstance(rule, DataConstraintRule):
+                    raise TypeError(f"Invalid type for rule: {str(type(rule))}")
+                append(rule)
+
+    def append(self, rule: DataConstraintRule) -> None:
+        """
+        Appends rule to internal list of rules
+        """
+        if not isinstance(rule, DataConstraintRule):
+            raise TypeError(f"Invalid type for rule: {str(type(rule))}")
+        if self.rules is None:
+            self.rules = [rule]
+        else:
+            self.rules.append(rule)
 
     def ref(self) -> DataConstraintRef:
         """
         Reference
         """
         assert self.parent is not None
-        ref_parts: list[str] = [self.name]
-        self.parent.update_ref_parts(ref_parts)
-        value = '/'.join(reversed(ref_parts))
-        return DataConstraintRef(value)
+        return DataConstraintRef(self._ref_str())
 
     @classmethod
     def make_physical(cls: "DataConstraint",
@@ -1604,6 +2251,17 @@ class DataConstraint(ARElement):
 # Unit elements
 
 
+# Converters used by Unit.__init__, keyed by exact type
+_UNIT_DISPLAY_NAME_CTORS = {
+    SingleLanguageUnitNames: lambda display_name: display_name,
+    str: SingleLanguageUnitNames,
+}
+_PHYSICAL_DIMENSION_REF_CTORS = {
+    PhysicalDimensionRef: lambda ref: ref,
+    str: PhysicalDimensionRef,
+}
+
+
 class Unit(ARElement):
     """
     Complex type AR:UNIT
@@ -1611,6 +2269,8 @@ class Unit(ARElement):
     Tag variants: 'UNIT'
     """
 
+    __slots__ = ("display_name", "factor", "offset", "physical_dimension_ref")
+
     def __init__(self, name: str,
                  display_name: str | SingleLanguageUnitNames | None = None,
                  factor: float | None = None,
@@ -1620,24 +2280,20 @@ class Unit(ARElement):
         super().__init__(name, **kwargs)
         self.display_name: SingleLanguageUnitNames | None = None  # .DISPLAY-NAME
         self.physical_dimension_ref: PhysicalDimensionRef | None = None  # .PHYSICAL-DIMENSION-REF
-        self.factor: float | None = None  # .FACTOR-SI-TO-UNIT
-        self.offset: float | None = None  # .OFFSET-SI-TO-UNIT
+        # .FACTOR-SI-TO-UNIT
+        self.factor: float | None = factor if factor is None or factor.__class__ is float else float(factor)
+        # .OFFSET-SI-TO-UNIT
+        self.offset: float | None = offset if offset is None or offset.__class__ is float else float(offset)
         if display_name is not None:
-            if isinstance(display_name, str):
-                self.display_name = SingleLanguageUnitNames(display_name)
-            elif isinstance(display_name, SingleLanguageUnitNames):
-                self.display_name = display_name
-            else:
+            display_name_ctor = _lookup_ctor(_UNIT_DISPLAY_NAME_CTORS, display_name)
+            if display_name_ctor is None:
                 raise TypeError(f"display_name: Invalid type '{str(type(display_name))}'")
+            self.display_name = display_name_ctor(display_name)
         if physical_dimension_ref is not None:
-            if isinstance(physical_dimension_ref, str):
-                self.physical_dimension_ref = PhysicalDimensionRef(display_name)
-            elif isinstance(physical_dimension_ref, PhysicalDimensionRef):
-                self.physical_dimension_ref = physical_dimension_ref
-            else:
+            ref_ctor = _lookup_ctor(_PHYSICAL_DIMENSION_REF_CTORS, physical_dimension_ref)
+            if ref_ctor is None:
                 raise TypeError(f"physical_dimension_ref: Invalid type '{str(type(physical_dimension_ref))}'")
-        self._assign_optional('factor', factor, float)
-        self._assign_optional('offset', offset, float)
+            self.physical_dimension_ref = ref_ctor(physical_dimension_ref)
 
 
 # DataDictionary and DataType elements
@@ -1650,6 +2306,8 @@ class BaseType(ARElement):
     Type: Abstract
     """
 
+    __slots__ = ("size", "max_size", "encoding", "alignment", "byte_order", "native_declaration")
+
     def __init__(self, name: str, **kwargs: dict) -> None:
         super().__init__(name, **kwargs)
         self.size: int | None = None  # .BASE-TYPE-SIZE
@@ -1667,6 +2325,8 @@ class SwBaseType(BaseType):
     Tag variants: SW-BASE-TYPE
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  name: str,
                  size: int | None = None,
@@ -1679,20 +2339,18 @@ class SwBaseType(BaseType):
         super().__init__(name, **kwargs)
         self.size = size
         self.max_size = max_size
-        self.encoding = encoding
+        self.encoding = _intern_str(encoding)
         self.alignment = alignment
         self.byte_order = byte_order
-        self.native_declaration = native_declaration
+        self.native_declaration = _intern_str(native_declaration)
 
     def ref(self) -> SwBaseTypeRef | None:
         """
         Reference
         """
-        if self.parent is None:
+        value = self._ref_str()
+        if value is None:
             return None
-        ref_parts: list[str] = [self.name]
-        self.parent.update_ref_parts(ref_parts)
-        value = '/'.join(reversed(ref_parts))
         return SwBaseTypeRef(value)
 
 
@@ -1706,10 +2364,8 @@ class SwBitRepresentation(ARObject):
                  position: int | None = None,
                  num_bits: int | None = None) -> None:
         super().__init__()
-        self.position: int | None = None
-        self.num_bits: int | None = None
-        self._assign_optional('position', position, int)
-        self._assign_optional('num_bits', num_bits, int)
+        self.position: int | None = position if position is None or position.__class__ is int else int(position)
+        self.num_bits: int | None = num_bits if num_bits is None or num_bits.__class__ is int else int(num_bits)
 
 
 class SwTextProps(ARObject):
@@ -1726,13 +2382,14 @@ class SwTextProps(ARObject):
                  fill_char: int | None = None,
                  ):
         self.array_size_semantics: ar_enum.ArraySizeSemantics | None = None   # .ARRAY-SIZE-SEMANTICS
-        self.max_text_size: int | None = None                                 # .SW-MAX-TEXT-SIZE
         self.base_type_ref: SwBaseTypeRef | str | None = None                 # .BASE-TYPE-REF
-        self.fill_char: int | None = None                                     # .FILL-CHAR
+        # .SW-MAX-TEXT-SIZE
+        self.max_text_size: int | None = (max_text_size if max_text_size is None or max_text_size.__class__ is int
+                                          else int(max_text_size))
+        # .FILL-CHAR
+        self.fill_char: int | None = fill_char if fill_char is None or fill_char.__class__ is int else int(fill_char)
         self._assign_optional('array_size_semantics', array_size_semantics, ar_enum.ArraySizeSemantics)
-        self._assign_optional('max_text_size', max_text_size, int)
         self._assign_optional('base_type_ref', base_type_ref, SwBaseTypeRef)
-        self._assign_optional('fill_char', fill_char, int)
 
 
 class SwPointerTargetProps(ARObject):
@@ -1742,6 +2399,8 @@ class SwPointerTargetProps(ARObject):
     Tag Variants: 'SW-POINTER-TARGET-PROPS'
     """
 
+    __slots__ = ("target_category", "sw_data_def_props", "function_ptr_signature_ref")
+
     def __init__(self,
                  target_category: str | None = None,
                  sw_data_def_props: Union["SwDataDefProps", "SwDataDefPropsConditional", None] = None,
@@ -1753,12 +2412,7 @@ class SwPointerTargetProps(ARObject):
         self._assign_optional("target_category", target_category, str)
         self._assign_optional("function_ptr_signature_ref", function_ptr_signature_ref, FunctionPtrSignatureRef)
         if sw_data_def_props is not None:
-            if isinstance(sw_data_def_props, SwDataDefProps):
-                self.sw_data_def_props = sw_data_def_props
-            elif isinstance(sw_data_def_props, SwDataDefPropsConditional):
-                self.sw_data_def_props = SwDataDefProps(sw_data_def_props)
-            else:
-                raise TypeError("'sw_data_def_props' must be one of (SwDataDefProps, SwDataDefPropsConditional)")
+            self.sw_data_def_props = _coerce_sw_data_def_props(sw_data_def_props)
 
 
 class SwDataDefPropsConditional(ARObject):
@@ -1769,6 +2423,11 @@ class SwDataDefPropsConditional(ARObject):
     Tag Variants: SW-DATA-DEF-PROPS-CONDITIONAL
     """
 
+    __slots__ = ("display_presentation", "step_size", "annotations", "sw_addr_method_ref", "alignment", "base_type_ref",
+                 "bit_representation", "calibration_access", "text_props", "compu_method_ref", "data_constraint_ref",
+                 "display_format", "impl_data_type_ref", "impl_policy", "additional_native_type_qualifier",
+                 "intended_resolution", "interpolation_method", "is_virtual", "ptr_target_props", "unit_ref")
+
     def __init__(self,
                  display_presentation: ar_enum.DisplayPresentation | None = None,
                  step_size: float | None = None,
@@ -1795,7 +2454,7 @@ class SwDataDefPropsConditional(ARObject):
         self.display_presentation: ar_enum.DisplayPresentation | None = None
         self.step_size: float | None = None  # .STEP-SIZE : AR:FLOAT
         # .SW-VALUE-BLOCK-SIZE-MULTS not supported.
-        self.annotations: list[Annotation] = []  # .ANNOTATIONS
+        self.annotations: list[Annotation] | None = None  # .ANNOTATIONS, allocated when first annotation is added
         self.sw_addr_method_ref: SwAddrMethodRef | None = None  # .SW-ADDR-METHOD-REF
         self.alignment: int | str | None = None  # .SW-ALIGNMENT
         self.base_type_ref: SwBaseTypeRef | None = None  # .BASE-TYPE-REF
@@ -1824,50 +2483,56 @@ class SwDataDefPropsConditional(ARObject):
         self.unit_ref = None  # .UNIT-REF
         # .VALUE-AXIS-DATA-TYPE-REF not yet supported. Low on priority list.
 
-        self._assign_optional('display_presentation', display_presentation, ar_enum.DisplayPresentation)
-        self._assign_optional('step_size', step_size, float)
+        assign_optional = self._assign_optional
+        assign_int_or_str_pattern_optional = self._assign_int_or_str_pattern_optional
+        assign_optional('display_presentation', display_presentation, ar_enum.DisplayPresentation)
+        assign_optional('step_size', step_size, float)
         if annotations is not None:
-            if isinstance(annotations, Annotation):
-                self.annotations.append(annotations)
-            elif isinstance(annotations, Iterable):
+            annotations_type = annotations.__class__
+            if annotations_type is Annotation or isinstance(annotations, Annotation):
+                self.annotations = [annotations]
+            elif annotations_type is list or annotations_type is tuple or isinstance(annotations, Iterable):
                 for annotation in annotations:
                     if not isinstance(annotation, Annotation):
                         raise TypeError(
                             f"Param annotations: Expected type 'Annotation', got '{str(type(annotation))}'")
-                    self.annotations.append(annotation)
+                    if self.annotations is None:
+                        self.annotations = [annotation]
+                    else:
+                        self.annotations.append(annotation)
             else:
                 raise TypeError(
                     "Param annotations: "
                     f"Expected type 'Annotation' or list[Annotation], got '{str(type(annotations))}'")
-        self._assign_optional('sw_addr_method_ref', sw_addr_method_ref, SwAddrMethodRef)
-        self._assign_int_or_str_pattern_optional('alignment', alignment, alignment_type_re)
-        self._assign_optional('base_type_ref', base_type_ref, SwBaseTypeRef)
+        assign_optional('sw_addr_method_ref', sw_addr_method_ref, SwAddrMethodRef)
+        assign_int_or_str_pattern_optional('alignment', alignment, alignment_type_re)
+        assign_optional('base_type_ref', base_type_ref, SwBaseTypeRef)
         if bit_representation is not None:
             if not isinstance(bit_representation, SwBitRepresentation):
                 raise TypeError(f"bit_representation: Invalid type '{str(type(bit_representation))}'."
                                 " Expected 'SwBitRepresentation'")
             self.bit_representation = bit_representation
-        self._assign_optional('calibration_access', calibration_access, ar_enum.SwCalibrationAccess)
+        assign_optional('calibration_access', calibration_access, ar_enum.SwCalibrationAccess)
         if text_props is not None:
             if not isinstance(text_props, SwTextProps):
                 raise TypeError(f"text_props: Invalid type '{str(type(text_props))}'."
                                 " Expected 'SwTextProps'")
             self.text_props = text_props
-        self._assign_optional('compu_method_ref', compu_method_ref, CompuMethodRef)
-        self._assign_optional('data_constraint_ref', data_constraint_ref, DataConstraintRef)
-        self._assign_optional('impl_data_type_ref', impl_data_type_ref, ImplementationDataTypeRef)
-        self._assign_optional('unit_ref', unit_ref, UnitRef)
-        self._assign_int_or_str_pattern_optional('display_format', display_format, display_format_str_re)
-        self._assign_optional('impl_policy', impl_policy, ar_enum.SwImplPolicy)
-        self._assign_optional('additional_native_type_qualifier',
-                              additional_native_type_qualifier, str)
+        assign_optional('compu_method_ref', compu_method_ref, CompuMethodRef)
+        assign_optional('data_constraint_ref', data_constraint_ref, DataConstraintRef)
+        assign_optional('impl_data_type_ref', impl_data_type_ref, ImplementationDataTypeRef)
+        assign_optional('unit_ref', unit_ref, UnitRef)
+        assign_int_or_str_pattern_optional('display_format', _intern_str(display_format), display_format_str_re)
+        assign_optional('impl_policy', impl_policy, ar_enum.SwImplPolicy)
+        assign_optional('additional_native_type_qualifier', _intern_str(additional_native_type_qualifier), str)
         if intended_resolution is not None:
-            if isinstance(intended_resolution, (int, float)):
+            resolution_type = intended_resolution.__class__
+            if resolution_type is int or resolution_type is float or isinstance(intended_resolution, (int, float)):
                 self.intended_resolution = intended_resolution
             else:
                 raise TypeError(f"Invalid type '{str(type(intended_resolution))}' for paramater 'intended_resolution'")
-        self._assign_optional('interpolation_method', interpolation_method, str)
-        self._assign_optional('is_virtual', is_virtual, bool)
+        assign_optional('interpolation_method', _intern_str(interpolation_method), str)
+        assign_optional('is_virtual', is_virtual, bool)
         if ptr_target_props is not None:
             self._set_attr_with_strict_type('ptr_target_props', ptr_target_props, SwPointerTargetProps)
 
@@ -1876,13 +2541,23 @@ class SwDataDefProps(ARObject):
     """
     SW-DATA-DEF-PROPS
     Type: Concrete
+
+    Nearly all objects hold exactly one variant, it's stored inline until a second one is added.
     """
 
+    __slots__ = ("_single", "_variants")
+
     def __init__(self, variants: SwDataDefPropsConditional | list[SwDataDefPropsConditional] | None = None) -> None:
         super().__init__()
-        self.variants: list[SwDataDefPropsConditional] = []  # .SW-DATA-DEF-PROPS-VARIANTS
+        self._single: SwDataDefPropsConditional | None = None
+        self._variants: list[SwDataDefPropsConditional] | None = None  # .SW-DATA-DEF-PROPS-VARIANTS
         if variants is not None:
-            if isinstance(variants, list):
+            if _all_of_type(variants, SwDataDefPropsConditional):
+                if len(variants) == 1:
+                    self._single = variants[0]
+                elif len(variants) > 1:
+                    self._variants = list(variants)
+            elif isinstance(variants, list):
                 for variant in variants:
                     self.append(variant)
             elif isinstance(variants, SwDataDefPropsConditional):
@@ -1890,40 +2565,99 @@ class SwDataDefProps(ARObject):
             else:
                 raise TypeError("variant must be one of (SwDataDefPropsConditional, list[SwDataDefPropsConditional])")
 
+    @classmethod
+    def _from_single(cls, variant: SwDataDefPropsConditional) -> "SwDataDefProps":
+        """
+        Creates new object holding a single variant that has already been type-checked
+        """
+        obj = cls.__new__(cls)
+        obj._single = variant
+        obj._variants = None
+        return obj
+
+    @property
+    def variants(self) -> list[SwDataDefPropsConditional]:
+        """
+        All variants as a list, .SW-DATA-DEF-PROPS-VARIANTS
+        """
+        if self._variants is None:
+            self._variants = [] if self._single is None else [self._single]
+            self._single = None
+        return self._variants
+
+    @variants.setter
+    def variants(self, value: list[SwDataDefPropsConditional]) -> None:
+        self._single = None
+        self._variants = value
+
+    def _items(self) -> list[SwDataDefPropsConditional] | tuple[SwDataDefPropsConditional, ...]:
+        """
+        Returns the variants, a single variant is returned in a tuple instead of a new list
+        """
+        if self._variants is not None:
+            return self._variants
+        return () if self._single is None else (self._single,)
+
     def __getitem__(self, index: int) -> SwDataDefPropsConditional:
         """
         Accessor of variants list
         """
-        return self.variants[index]
+        return self._items()[index]
 
     def __len__(self) -> int:
         """
         Length of variants list
         """
-        return len(self.variants)
+        if self._variants is not None:
+            return len(self._variants)
+        return 0 if self._single is None else 1
 
     def __iter__(self):
         """
         Iterator of variants list
         """
-        return iter(self.variants)
+        return iter(self._items())
 
     def append(self, variant: SwDataDefPropsConditional):
         """
         Appends SW-DATA-DEF-PROPS-CONDITIONAL to variants list
         """
         if isinstance(variant, SwDataDefPropsConditional):
-            self.variants.append(variant)
+            if self._variants is not None:
+                self._variants.append(variant)
+            elif self._single is None:
+                self._single = variant
+            else:
+                self._variants = [self._single, variant]
+                self._single = None
         else:
             raise TypeError("variant must be of type SwDataDefPropsConditional")
 
 
+def _coerce_sw_data_def_props(value: SwDataDefProps | SwDataDefPropsConditional) -> SwDataDefProps:
+    """
+    Returns value as SwDataDefProps, wrapping a single SwDataDefPropsConditional when needed
+    """
+    value_type = value.__class__
+    if value_type is SwDataDefProps:
+        return value
+    if value_type is SwDataDefPropsConditional:
+        return SwDataDefProps._from_single(value)  # pylint: disable=protected-access
+    if isinstance(value, SwDataDefProps):
+        return value
+    if isinstance(value, SwDataDefPropsConditional):
+        return SwDataDefProps._from_single(value)  # pylint: disable=protected-access
+    raise TypeError("'sw_data_def_props' must be one of (SwDataDefProps, SwDataDefPropsConditional)")
+
+
 class AutosarDataType(ARElement):
     """
     Element AUTOSAR-DATA-TYPE
     Type: Abstract
     """
 
+    __slots__ = ("sw_data_def_props",)
+
     def __init__(self,
                  name: str,
                  sw_data_def_props: SwDataDefProps | SwDataDefPropsConditional | None = None,
@@ -1931,12 +2665,7 @@ class AutosarDataType(ARElement):
         super().__init__(name, **kwargs)
         self.sw_data_def_props: SwDataDefProps | None = None
         if sw_data_def_props is not None:
-            if isinstance(sw_data_def_props, SwDataDefProps):
-                self.sw_data_def_props = sw_data_def_props
-            elif isinstance(sw_data_def_props, SwDataDefPropsConditional):
-                self.sw_data_def_props = SwDataDefProps(sw_data_def_props)
-            else:
-                raise TypeError("'sw_data_def_props' must be one of (SwDataDefProps, SwDataDefPropsConditional)")
+            self.sw_data_def_props = _coerce_sw_data_def_props(sw_data_def_props)
 
 
 class ImplementationProps(Referrable):
@@ -1945,12 +2674,14 @@ class ImplementationProps(Referrable):
     Type: Abstract
     """
 
+    __slots__ = ("symbol",)
+
     def __init__(self,
                  name: str,
                  symbol: str | None = None) -> None:
         super().__init__(name)
         self.symbol: str | None = None
-        self._assign_optional('symbol', symbol, str)
+        self._assign_optional('symbol', _intern_str(symbol), str)
 
 
 class SymbolProps(ImplementationProps):
@@ -1960,6 +2691,8 @@ class SymbolProps(ImplementationProps):
     Tag Variants: 'SYMBOL-PROPS', 'EVENT-SYMBOL-PROPS'
     """
 
+    __slots__ = ()
+
 
 class ImplementationDataTypeElement(Identifiable):
     """
@@ -1968,6 +2701,9 @@ class ImplementationDataTypeElement(Identifiable):
     Tag variants: 'IMPLEMENTATION-DATA-TYPE-ELEMENT'
     """
 
+    __slots__ = ("array_size", "array_impl_policy", "array_size_handling", "array_size_semantics", "is_optional",
+                 "sub_elements", "sw_data_def_props")
+
     def __init__(self,
                  name: str,
                  sw_data_def_props: SwDataDefProps | SwDataDefPropsConditional | None = None,
@@ -1984,30 +2720,32 @@ class ImplementationDataTypeElement(Identifiable):
         self.array_size_handling: ar_enum.ArraySizeHandling | None = None       # .ARRAY-SIZE-HANDLING
         self.array_size_semantics: ar_enum.ArraySizeSemantics | None = None     # .ARRAY-SIZE-SEMANTICS
         self.is_optional: bool | None = None                                    # .IS-OPTIONAL
-        self.sub_elements: list["ImplementationDataTypeElement"] | None = []    # .SUB-ELEMENTS
+        self.sub_elements: list["ImplementationDataTypeElement"] | None = None  # .SUB-ELEMENTS
         self.sw_data_def_props: SwDataDefProps | None = None                    # .SW-DATA-DEF-PROPS
+        assign_optional = self._assign_optional
         self._assign_optional_positive_int("array_size", array_size)
-        self._assign_optional("array_impl_policy", array_impl_policy, ar_enum.ArrayImplPolicy)
-        self._assign_optional("array_size_handling", array_size_handling, ar_enum.ArraySizeHandling)
-        self._assign_optional("array_size_semantics", array_size_semantics, ar_enum.ArraySizeSemantics)
-        self._assign_optional("is_optional", is_optional, bool)
+        assign_optional("array_impl_policy", array_impl_policy, ar_enum.ArrayImplPolicy)
+        assign_optional("array_size_handling", array_size_handling, ar_enum.ArraySizeHandling)
+        assign_optional("array_size_semantics", array_size_semantics, ar_enum.ArraySizeSemantics)
+        assign_optional("is_optional", is_optional, bool)
         if sub_elements is not None:
-            for elem in sub_elements:
-                self.append(elem)
-        if sw_data_def_props is not None:
-            if isinstance(sw_data_def_props, SwDataDefProps):
-                self.sw_data_def_props = sw_data_def_props
-            elif isinstance(sw_data_def_props, SwDataDefPropsConditional):
-                self.sw_data_def_props = SwDataDefProps(sw_data_def_props)
+            if sub_elements and _all_of_type(sub_elements, ImplementationDataTypeElement):
+                self.sub_elements = list(sub_elements)
             else:
-                raise TypeError("'sw_data_def_props' must be one of (SwDataDefProps, SwDataDefPropsConditional)")
+                for elem in sub_elements:
+                    self.append(elem)
+        if sw_data_def_props is not None:
+            self.sw_data_def_props = _coerce_sw_data_def_props(sw_data_def_props)
 
     def append(self, elem: "ImplementationDataTypeElement") -> None:
         """
         Appends elem to sub_element list
         """
         if isinstance(elem, ImplementationDataTypeElement):
-            self.sub_elements.append(elem)
+            if self.sub_elements is None:
+                self.sub_elements = [elem]
+            else:
+                self.sub_elements.append(elem)
         else:
             raise TypeError("'elem' must be of type ImplementationDataTypeElement")
 
@@ -2019,6 +2757,9 @@ class ImplementationDataType(AutosarDataType):
     Tag Variants: 'IMPLEMENTATION-DATA-TYPE'
     """
 
+    __slots__ = ("dynamic_array_size_profile", "is_struct_with_optional_element", "sub_elements", "symbol_props",
+                 "type_emitter")
+
     def __init__(self,
                  name: str,
                  dynamic_array_size_profile: str | None = None,
@@ -2030,15 +2771,19 @@ class ImplementationDataType(AutosarDataType):
         super().__init__(name, **kwargs)
         self.dynamic_array_size_profile: str | None = None                  # .DYNAMIC-ARRAY-SIZE-PROFILE
         self.is_struct_with_optional_element: bool | None = None            # .IS-STRUCT-WITH-OPTIONAL-ELEMENT
-        self.sub_elements: list[ImplementationDataTypeElement] = []         # .SUB-ELEMENTS
+        self.sub_elements: list[ImplementationDataTypeElement] = ElementList()  # .SUB-ELEMENTS
         self.symbol_props: SymbolProps | None = None                        # .SYMBOL-PROPS
         self.type_emitter: str | None = None                                # .TYPE-EMITTER
-        self._assign_optional('dynamic_array_size_profile', dynamic_array_size_profile, str)
-        self._assign_optional('is_struct_with_optional_element', is_struct_with_optional_element, bool)
-        self._assign_optional('type_emitter', type_emitter, str)
+        assign_optional = self._assign_optional
+        assign_optional('dynamic_array_size_profile', _intern_str(dynamic_array_size_profile), str)
+        assign_optional('is_struct_with_optional_element', is_struct_with_optional_element, bool)
+        assign_optional('type_emitter', _intern_str(type_emitter), str)
         if sub_elements is not None:
-            for elem in sub_elements:
-                self.append(elem)
+            if _all_of_type(sub_elements, ImplementationDataTypeElement):
+                self.sub_elements.extend(sub_elements)
+            else:
+                for elem in sub_elements:
+                    self.append(elem)
         if symbol_props is not None:
             if isinstance(symbol_props, SymbolProps):
                 self.symbol_props = symbol_props
@@ -2058,11 +2803,9 @@ class ImplementationDataType(AutosarDataType):
         """
         Returns a new reference to this object
         """
-        if self.parent is None:
+        value = self._ref_str()
+        if value is None:
             return None
-        ref_parts: list[str] = [self.name]
-        self.parent.update_ref_parts(ref_parts)
-        value = '/'.join(reversed(ref_parts))
         return ImplementationDataTypeRef(value)
 
     def find(self, ref: str) -> Any:
@@ -2079,6 +2822,8 @@ class DataPrototype(Identifiable):
     Type: Abstract
     """
 
+    __slots__ = ("sw_data_def_props",)
+
     def __init__(self,
                  name: str,
                  sw_data_def_props: SwDataDefProps | SwDataDefPropsConditional | None = None,
@@ -2086,12 +2831,7 @@ class DataPrototype(Identifiable):
         super().__init__(name, **kwargs)
         self.sw_data_def_props: SwDataDefProps | None = None  # .SW-DATA-DEF-PROPS
         if sw_data_def_props is not None:
-            if isinstance(sw_data_def_props, SwDataDefProps):
-                self.sw_data_def_props = sw_data_def_props
-            elif isinstance(sw_data_def_props, SwDataDefPropsConditional):
-                self.sw_data_def_props = SwDataDefProps(sw_data_def_props)
-            else:
-                raise TypeError("'sw_data_def_props' must be one of (SwDataDefProps, SwDataDefPropsConditional)")
+            self.sw_data_def_props = _coerce_sw_data_def_props(sw_data_def_props)
 
 
 class AutosarDataPrototype(DataPrototype):
@@ -2116,7 +2856,7 @@ class VariableDataPrototype(AutosarDataPrototype):
     """
 
     def __init__(self, name: str, **kwargs) -> None:
-        super().__init__(name, kwargs)
+        super().__init__(name, **kwargs)
         self.init_value = None  # .INIT-VALUE
         # .VARIATION-POINT not supported
 
@@ -2134,10 +2874,7 @@ class ApplicationCompositeDataType(ApplicationDataType):
     Type: Abstract
     """
 
-    @property
-    def is_composite(self):
-        """Is this a composite data type?"""
-        return True
+    is_composite: bool = True  # Is this a composite data type?
 
 
 class ApplicationPrimitiveDataType(ApplicationDataType):
@@ -2147,20 +2884,15 @@ class ApplicationPrimitiveDataType(ApplicationDataType):
     Tag variants: 'APPLICATION-PRIMITIVE-DATA-TYPE'
     """
 
-    @property
-    def is_composite(self):
-        """Is this a composite data type?"""
-        return False
+    is_composite: bool = False  # Is this a composite data type?
 
     def ref(self) -> ApplicationDataTypeRef:
         """
         Reference
         """
-        if self.parent is None:
+        value = self._ref_str()
+        if value is None:
             return None
-        ref_parts: list[str] = [self.name]
-        self.parent.update_ref_parts(ref_parts)
-        value = '/'.join(reversed(ref_parts))
         return ApplicationDataTypeRef(value, ar_enum.IdentifiableSubTypes.APPLICATION_PRIMITIVE_DATA_TYPE)
 
 
@@ -2170,6 +2902,8 @@ class ApplicationCompositeElementDataPrototype(DataPrototype):
     Type: Abstract
     """
 
+    __slots__ = ("type_ref",)
+
     def __init__(self,
                  name: str,
                  type_ref: ApplicationDataTypeRef | None = None,
@@ -2186,6 +2920,8 @@ class ApplicationArrayElement(ApplicationCompositeElementDataPrototype):
     Tag variants: 'ELEMENT'
     """
 
+    __slots__ = ("array_size_handling", "array_size_semantics", "max_number_of_elements", "index_data_type_ref")
+
     def __init__(self,
                  name: str,
                  max_number_of_elements: int | None = None,
@@ -2219,18 +2955,16 @@ class ApplicationArrayDataType(ApplicationCompositeDataType):
         super().__init__(name, **kwargs)
         self.dynamic_array_size_profile: str | None = None                  # .DYNAMIC-ARRAY-SIZE-PROFILE
         self.element: ApplicationArrayElement | None = None                 # .ELEMENT
-        self._assign_optional('dynamic_array_size_profile', dynamic_array_size_profile, str)
+        self._assign_optional('dynamic_array_size_profile', _intern_str(dynamic_array_size_profile), str)
         self._assign_optional_strict('element', element, ApplicationArrayElement)
 
     def ref(self) -> ApplicationDataTypeRef | None:
         """
         Reference
         """
-        if self.parent is None:
+        value = self._ref_str()
+        if value is None:
             return None
-        ref_parts: list[str] = [self.name]
-        self.parent.update_ref_parts(ref_parts)
-        value = '/'.join(reversed(ref_parts))
         return ApplicationDataTypeRef(value, ar_enum.IdentifiableSubTypes.APPLICATION_ARRAY_DATA_TYPE)
 
 
@@ -2282,18 +3016,19 @@ class ApplicationRecordDataType(ApplicationCompositeDataType):
         """
         Extends elements to elements list
         """
-        for element in elements:  # We want to type-check each element before adding to internal list
-            self.append(element)
+        if _all_of_type(elements, ApplicationRecordElement):
+            self.elements.extend(elements)
+        else:
+            for element in elements:  # We want to type-check each element before adding to internal list
+                self.append(element)
 
     def ref(self) -> ApplicationDataTypeRef | None:
         """
         Reference
         """
-        if self.parent is None:
+        value = self._ref_str()
+        if value is None:
             return None
-        ref_parts: list[str] = [self.name]
-        self.parent.update_ref_parts(ref_parts)
-        value = '/'.join(reversed(ref_parts))
         return ApplicationDataTypeRef(value, ar_enum.IdentifiableSubTypes.APPLICATION_RECORD_DATA_TYPE)
 
 
@@ -2304,6 +3039,8 @@ class DataTypeMap(ARObject):
     Tag variants: 'DATA-TYPE-MAP'
     """
 
+    __slots__ = ("appl_data_type_ref", "impl_data_type_ref")
+
     def __init__(self,
                  appl_data_type_ref: ApplicationDataTypeRef | None = None,
                  impl_data_type_ref: ImplementationDataTypeRef | None = None,
@@ -2330,8 +3067,11 @@ class DataTypeMappingSet(ARElement):
             if isinstance(data_type_maps, DataTypeMap):
                 self.append(data_type_maps)
             elif isinstance(data_type_maps, list):
-                for data_type_map in data_type_maps:
-                    self.append(data_type_map)
+                if _all_of_type(data_type_maps, DataTypeMap):
+                    self.data_type_maps.extend(data_type_maps)
+                else:
+                    for data_type_map in data_type_maps:
+                        self.append(data_type_map)
             else:
                 raise TypeError(f'data_type_maps: Invalid type "{str(type(data_type_maps))}"')
 
@@ -2347,6 +3087,9 @@ class DataTypeMappingSet(ARElement):
             raise TypeError(f'Unexpected type: "{str(type(element))}"')
 
 
+_VALUE_LIST_TYPES = frozenset([int, float, NumericalValue])
+
+
 class ValueList(ARObject):
     """
     Complex-type AR:VALUE-LIST
@@ -2354,10 +3097,14 @@ class ValueList(ARObject):
     Tag variants: 'SW-ARRAYSIZE'
     """
 
+    __slots__ = ("values",)
+
     def __init__(self, values: list[int | float | NumericalValue] | None = None) -> None:
         self.values = []
         if values is not None:
-            if isinstance(values, (int, float)):
+            if _all_in_types(values, _VALUE_LIST_TYPES):
+                self.values.extend(values)
+            elif isinstance(values, (int, float)):
                 self.append(values)
             else:
                 for value in values:
@@ -2367,7 +3114,7 @@ class ValueList(ARObject):
         """
         Adds value to list of values
         """
-        if isinstance(value, (int, float, NumericalValue)):
+        if value.__class__ in _VALUE_LIST_TYPES or isinstance(value, (int, float, NumericalValue)):
             self.values.append(value)
         else:
             raise TypeError(f"Invalid type for value: {str(type(value))}")
@@ -2383,6 +3130,8 @@ class SwAddrMethod(ARElement):
     Tag Variants: 'SW-ADDR-METHOD'
     """
 
+    __slots__ = ("memory_allocation_keyword_policy", "options", "section_initialization_policy", "section_type")
+
     def __init__(self, name: str, **kwargs) -> None:
         super().__init__(name, **kwargs)
         self.memory_allocation_keyword_policy = None  # .MEMORY-ALLOCATION-KEYWORD-POLICY
@@ -2395,9 +3144,7 @@ class SwAddrMethod(ARElement):
         Reference
         """
         assert self.parent is not None
-        ref_parts: list[str] = [self.name]
-        self.parent.update_ref_parts(ref_parts)
-        value = '/'.join(reversed(ref_parts))
+        value = self._ref_str()
         return SwAddrMethodRef(value)
 
 # Calibration data
@@ -2413,11 +3160,15 @@ class SwValues(ARObject):
     Tag variants: SW-VALUES-PHYS
     """
 
+    __slots__ = ("values",)
+
     def __init__(self,
                  values: list[SwValueElement] | None = None) -> None:
         self.values = []
         if values is not None:
-            if isinstance(values, (int, float, str, NumericalValue, ValueGroup)):
+            if values.__class__ is list and _all_in_types(values, _SW_VALUE_TYPES):
+                self.values.extend(values)
+            elif isinstance(values, (int, float, str, NumericalValue, ValueGroup)):
                 self.append(values)
             elif isinstance(values, list):
                 for value in values:
@@ -2431,7 +3182,7 @@ class SwValues(ARObject):
         - VTF
         - VF
         """
-        if isinstance(value, (int, float, str, NumericalValue, ValueGroup)):
+        if value.__class__ in _SW_VALUE_TYPES or isinstance(value, (int, float, str, NumericalValue, ValueGroup)):
             self.values.append(value)
         else:
             raise TypeError(f"Invalid value type: {str(type(value))}")
@@ -2444,18 +3195,18 @@ class ValueGroup(SwValues):
     Tag variants: VG
     """
 
+    __slots__ = ("label",)
+
     def __init__(self,
                  label: str | MultilanguageLongName | tuple[ar_enum.Language, str] | LanguageLongName | None = None,
                  values: SwValues | None = None) -> None:
         self.label: MultilanguageLongName | None = None
         super().__init__(values)
         if label is not None:
-            if isinstance(label, MultilanguageLongName):
-                self.label = label
-            elif isinstance(label, (tuple, LanguageLongName)):
-                self.label = MultilanguageLongName(label)
-            else:
-                raise TypeError(f"Invalid type for 'label': {str(type(label))}")
+            self.label = _coerce_multilanguage_long_name("label", label)
+
+
+_SW_VALUE_TYPES = frozenset([int, float, str, NumericalValue, ValueGroup])
 
 
 class SwAxisCont(ARObject):
@@ -2465,6 +3216,8 @@ class SwAxisCont(ARObject):
     Tag variants: SW-AXIS-CONT
     """
 
+    __slots__ = ("category", "unit_ref", "unit_display_name", "sw_axis_index", "sw_array_size", "sw_values_phys")
+
     def __init__(self,
                  category: ar_enum.CalibrationAxisCategory | None = None,
                  unit_ref: UnitRef | None = None,
@@ -2498,6 +3251,8 @@ class SwValueCont(ARObject):
     Tag variants: SW-VALUE-CONT
     """
 
+    __slots__ = ("unit_ref", "unit_display_name", "sw_array_size", "sw_values_phys")
+
     def __init__(self,
                  unit_ref: UnitRef | None = None,
                  unit_display_name: SingleLanguageUnitNames | None = None,
@@ -2515,6 +3270,10 @@ class SwValueCont(ARObject):
 
 # Constant and value specifications
 
+# First element of lists given to ValueSpecification.make_value, other spellings are upper-cased before lookup
+_ARRAY_VALUE_TAGS = frozenset(["A", "ARRAY", "a", "array"])
+_RECORD_VALUE_TAGS = frozenset(["R", "RECORD", "r", "record"])
+
 
 class ValueSpecification(ARObject):
     """
@@ -2523,6 +3282,8 @@ class ValueSpecification(ARObject):
     Base class for value specifications
     """
 
+    __slots__ = ("label",)
+
     def __init__(self, label: str | None = None) -> None:
         self.label = label  # .SHORT-LABEL
         # .VARIATION-POINT not supported
@@ -2530,58 +3291,99 @@ class ValueSpecification(ARObject):
     @classmethod
     def make_value(cls, data: Any) -> ValueSpeficationElement:
         """
-        Builds value specification based on Python data
+        Builds value specification based on Python data.
+        Existing value specifications are returned as-is.
+        """
+        data_type = data.__class__
+        if data_type is int or data_type is float:
+            return NumericalValueSpecification(None, data)
+        if data_type is str:
+            return TextValueSpecification(None, data)
+        if isinstance(data, ValueSpecification):
+            return data
+        label, value, default_pattern = ValueSpecification._split_value_data(data)
+        return ValueSpecification._make_from_args(label, value, default_pattern)
+
+    @classmethod
+    def _split_value_data(cls, data: Any) -> tuple[str | None, Any, int | None]:
+        """
+        Splits Python data into (label, value, default_pattern)
         """
-        label = None
-        default_pattern = None
         if isinstance(data, tuple):
             if not isinstance(data[0], str):
                 raise TypeError("First tuple element must be a string")
             if len(data) == 2:
                 label, value = data
+                return label, value, None
             elif len(data) == 3:
-                label, value, default_pattern = data
+                return data
             else:
                 raise ValueError(f"Too many elements in tuple: {repr(data)}")
-        else:
-            value = data
-        return ValueSpecification._make_from_args(label, value, default_pattern)
+        return None, data, None
 
     @classmethod
     def _make_from_args(cls, label: str | None,
                         value: Any,
                         default_pattern: int | None = None) -> ValueSpeficationElement:
-        if isinstance(value, (int, float)):
-            return NumericalValueSpecification(label, value)
-        elif isinstance(value, str):
-            return TextValueSpecification(label, value)
-        elif value is None:
-            return NotAvailableValueSpecification(label, default_pattern)
-        elif isinstance(value, list):
-            if not isinstance(value[0], str):
-                raise TypeError("First element of a list must be a string")
-            if value[0].upper() in ("A", "ARRAY"):
-                return ValueSpecification._make_array_value_spefication(label, value[1:])
-            elif value[0].upper() in ("R", "RECORD"):
-                return ValueSpecification._make_record_value_spefication(label, value[1:])
-            else:
-                raise ValueError(f"Invalid element type: {str(type(value[0]))}")
-        else:
+        builder = _lookup_ctor(_VALUE_SPECIFICATION_CTORS, value)
+        if builder is None:
             raise TypeError(f"Invalid value type: {str(type(value))}")
+        return builder(label, value, default_pattern)
 
     @classmethod
-    def _make_array_value_spefication(cls, label: str | None, values: list) -> "ArrayValueSpecification":
-        elements = []
-        for value in values:
-            elements.append(ValueSpecification.make_value(value))
-        return ArrayValueSpecification(label, elements)
+    def _make_composite(cls, label: str | None, value: list) -> tuple[ValueSpeficationElement, list]:
+        """
+        Creates empty array or record value specification from the type name in value[0].
+        Returns the new object and the list where its children go.
+        """
+        if not isinstance(value[0], str):
+            raise TypeError("First element of a list must be a string")
+        tag = value[0]
+        if tag not in _ARRAY_VALUE_TAGS and tag not in _RECORD_VALUE_TAGS:
+            tag = tag.upper()
+        if tag in _ARRAY_VALUE_TAGS:
+            array = ArrayValueSpecification(label)
+            return array, array.elements
+        elif tag in _RECORD_VALUE_TAGS:
+            record = RecordValueSpecification(label)
+            return record, record.fields
+        else:
+            raise ValueError(f"Invalid element type: {str(type(value[0]))}")
 
     @classmethod
-    def _make_record_value_spefication(cls, label: str | None, values: list) -> "RecordValueSpecification":
-        fields = []
-        for value in values:
-            fields.append(ValueSpecification.make_value(value))
-        return RecordValueSpecification(label, fields)
+    def _make_from_list(cls, label: str | None, value: list) -> ValueSpeficationElement:
+        """
+        Builds array or record value specification from list.
+        Nested lists are processed using an explicit stack so nesting depth isn't bound by the recursion limit.
+        """
+        split_value_data = ValueSpecification._split_value_data
+        make_from_args = ValueSpecification._make_from_args
+        make_composite = ValueSpecification._make_composite
+        root, children = make_composite(label, value)
+        stack = [(children.append, iter(value[1:]))]
+        while stack:
+            append_child, items = stack[-1]
+            for data in items:
+                data_type = data.__class__
+                if data_type is int or data_type is float:
+                    append_child(NumericalValueSpecification(None, data))
+                    continue
+                if data_type is str:
+                    append_child(TextValueSpecification(None, data))
+                    continue
+                if isinstance(data, ValueSpecification):
+                    append_child(data)
+                    continue
+                label, value, default_pattern = split_value_data(data)
+                if isinstance(value, list):
+                    child, grandchildren = make_composite(label, value)
+                    append_child(child)
+                    stack.append((grandchildren.append, iter(value[1:])))
+                    break
+                append_child(make_from_args(label, value, default_pattern))
+            else:
+                stack.pop()
+        return root
 
 
 class TextValueSpecification(ValueSpecification):
@@ -2591,6 +3393,8 @@ class TextValueSpecification(ValueSpecification):
     Tag variants: 'TEXT-VALUE-SPECIFICATION'
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, label: str | None = None, value: str | None = None) -> None:
         super().__init__(label)
         self.value = None if value is None else str(value)
@@ -2603,6 +3407,8 @@ class NumericalValueSpecification(ValueSpecification):
     Tag variants: 'NUMERICAL-VALUE-SPECIFICATION'
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, label: str | None = None, value: int | float | None = None) -> None:
         super().__init__(label)
         self.value = value
@@ -2615,6 +3421,8 @@ class NotAvailableValueSpecification(ValueSpecification):
     Tag variants: 'NOT-AVAILABLE-VALUE-SPECIFICATION'
     """
 
+    __slots__ = ("default_pattern", "default_pattern_format")
+
     def __init__(self,
                  label: str | None = None,
                  default_pattern: int | None = None,
@@ -2634,6 +3442,8 @@ class ArrayValueSpecification(ValueSpecification):
     Tag variants: 'ARRAY-VALUE-SPECIFICATION'
     """
 
+    __slots__ = ("elements",)
+
     def __init__(self,
                  label: str | None = None,
                  elements: list[ValueSpeficationElement] | None = None
@@ -2644,8 +3454,11 @@ class ArrayValueSpecification(ValueSpecification):
             if isinstance(elements, ValueSpecification):
                 self.append(elements)
             elif isinstance(elements, list):
-                for element in elements:
-                    self.append(element)
+                if all(isinstance(element, ValueSpecification) for element in elements):
+                    self.elements.extend(elements)
+                else:
+                    for element in elements:
+                        self.append(element)
 
     def append(self, element: ValueSpeficationElement):
         """
@@ -2663,6 +3476,8 @@ class RecordValueSpecification(ValueSpecification):
     Tag variants: 'RECORD-VALUE-SPECIFICATION'
     """
 
+    __slots__ = ("fields",)
+
     def __init__(self,
                  label: str | None = None,
                  fields: list[ValueSpeficationElement] | None = None
@@ -2673,8 +3488,11 @@ class RecordValueSpecification(ValueSpecification):
             if isinstance(fields, ValueSpecification):
                 self.append(fields)
             elif isinstance(fields, list):
-                for field in fields:
-                    self.append(field)
+                if all(isinstance(field, ValueSpecification) for field in fields):
+                    self.fields.extend(fields)
+                else:
+                    for field in fields:
+                        self.append(field)
 
     def append(self, field: ValueSpeficationElement):
         """
@@ -2685,6 +3503,16 @@ class RecordValueSpecification(ValueSpecification):
         self.fields.append(field)
 
 
+# Constructors used by ValueSpecification.make_value keyed by exact type, arguments are (label, value, default_pattern)
+_VALUE_SPECIFICATION_CTORS = {
+    int: lambda label, value, _: NumericalValueSpecification(label, value),
+    float: lambda label, value, _: NumericalValueSpecification(label, value),
+    str: lambda label, value, _: TextValueSpecification(label, value),
+    type(None): lambda label, _, default_pattern: NotAvailableValueSpecification(label, default_pattern),
+    list: lambda label, value, _: ValueSpecification._make_from_list(label, value),  # pylint: disable=protected-access
+}
+
+
 class ApplicationValueSpecification(ValueSpecification):
     """
     Complex-type AR:APPLICATION-VALUE-SPECIFICATION
@@ -2692,6 +3520,8 @@ class ApplicationValueSpecification(ValueSpecification):
     Tag variants: APPLICATION-VALUE-SPECIFICATION
     """
 
+    __slots__ = ("category", "sw_axis_conts", "sw_value_cont")
+
     def __init__(self,
                  label: str | None = None,
                  category: str | None = None,
@@ -2708,12 +3538,15 @@ class ApplicationValueSpecification(ValueSpecification):
             if isinstance(sw_axis_conts, SwAxisCont):
                 self.sw_axis_conts.append(sw_axis_conts)
             elif isinstance(sw_axis_conts, list):
-                for elem in sw_axis_conts:
-                    if isinstance(elem, SwAxisCont):
-                        self.sw_axis_conts.append(elem)
-                    else:
-                        error_msg = "sw_axis_conts: Elements in list must of type SwAxisCont."
-                        raise TypeError(error_msg + f" Got {str(type(elem))}")
+                if all(isinstance(elem, SwAxisCont) for elem in sw_axis_conts):
+                    self.sw_axis_conts.extend(sw_axis_conts)
+                else:
+                    for elem in sw_axis_conts:
+                        if isinstance(elem, SwAxisCont):
+                            self.sw_axis_conts.append(elem)
+                        else:
+                            error_msg = "sw_axis_conts: Elements in list must of type SwAxisCont."
+                            raise TypeError(error_msg + f" Got {str(type(elem))}")
             else:
                 error_msg = "sw_axis_conts: argument must be either SwAxisCont or list[SwAxisCont]."
                 raise TypeError(error_msg + f" Got {str(type(sw_axis_conts))}")
@@ -2741,9 +3574,7 @@ class ConstantSpecification(ARElement):
         Reference
         """
         assert self.parent is not None
-        ref_parts: list[str] = [self.name]
-        self.parent.update_ref_parts(ref_parts)
-        value = '/'.join(reversed(ref_parts))
+        value = self._ref_str()
         return ConstantRef(value)
 
     @classmethod
@@ -2768,6 +3599,8 @@ class ConstantReference(ValueSpecification):
     This class is just a wrapper around an instance of ConstantRef.
     """
 
+    __slots__ = ("constant_ref",)
+
     def __init__(self,
                  label: str | None = None,
                  constant_ref: ConstantRef | None = None) -> None:
@@ -2782,13 +3615,14 @@ class PortInterface(ARElement):
     """
     Implements AR:PORT-INTERFACE
     Type: Abstract
+
+    Attributes that are rarely set default to class-level None
+    and are only stored on the instance once assigned.
     """
 
-    def __init__(self, name: str, **kwargs: dict) -> None:
-        super().__init__(name, **kwargs)
-        self.is_service: None | bool = None
-        self.namespaces = None
-        self.service_kind: None | ar_enum.ServiceKind = None
+    is_service: None | bool = None
+    namespaces = None
+    service_kind: None | ar_enum.ServiceKind = None
 
 
 class DataInterface(PortInterface):
@@ -2821,16 +3655,20 @@ class SoftwareComponentType(ARElement):
     """
     Implements AR:SW-COMPONENT-TYPE
     Type: Abstract
+
+    Attributes that are rarely set default to class-level None
+    and are only stored on the instance once assigned.
     """
 
+    documentations = None  # AR:SW-COMPONENT-DOCUMENTATIONS
+    consistency_needs = None  # AR:CONSISTENCY-NEEDSS
+    ports = None  # AR:PORTS
+    port_groups = None  # AR:PORT_GROUPS
+    swc_mapping_constraint_refs = None  # AR:SWC-MAPPING-CONSTRAINT-REFS
+    unit_group_refs = None  # AR:UNIT-GROUP-REFS
+
     def __init__(self, name: str, kwargs: dict) -> None:
         super().__init__(name, **kwargs)
-        self.documentations = None  # AR:SW-COMPONENT-DOCUMENTATIONS
-        self.consistency_needs = None  # AR:CONSISTENCY-NEEDSS
-        self.ports = None  # AR:PORTS
-        self.port_groups = None  # AR:PORT_GROUPS
-        self.swc_mapping_constraint_refs = None  # AR:SWC-MAPPING-CONSTRAINT-REFS
-        self.unit_group_refs = None  # AR:UNIT-GROUP-REFS
 
 
 class AtomicSoftwareComponentType(SoftwareComponentType):
@@ -2839,10 +3677,8 @@ class AtomicSoftwareComponentType(SoftwareComponentType):
     Type: Abstract
     """
 
-    def __init__(self, name: str, kwargs: dict) -> None:
-        super().__init__(name, **kwargs)
-        self.internal_behaviors = None  # AR:INTERNAL-BEHAVIORS
-        self.symbol_props = None  # AR:SYMBOL-PROPS
+    internal_behaviors = None  # AR:INTERNAL-BEHAVIORS
+    symbol_props = None  # AR:SYMBOL-PROPS
 
 
 class ApplicationSoftwareComponentType(AtomicSoftwareComponentType):
@@ -2870,43 +3706,76 @@ class Package(CollectableElement):
 
     def append(self, item: Any):
         """
-        Append element or sub-package
+        Append element or sub-package.
+        Names are checked for duplicates with a single map lookup.
         """
         if isinstance(item, Package):
             package: Package = item
-            if package.name in self._collection_map:
+            size = len(self._collection_map)
+            self._collection_map.setdefault(package.name, package)
+            if len(self._collection_map) == size:
                 raise ValueError(
                     f"Package with SHORT-NAME '{package.name}' already exists in package '{self.name}")
             package.parent = self
             self.packages.append(package)
-            self._collection_map[package.name] = package
         elif isinstance(item, ARElement):
             elem: ARElement = item
-            if elem.name in self._collection_map:
+            size = len(self._collection_map)
+            self._collection_map.setdefault(elem.name, elem)
+            if len(self._collection_map) == size:
                 raise ValueError(
                     f"Element with SHORT-NAME '{elem.name}' already exists in package '{self.name}'")
             elem.parent = self
             self.elements.append(elem)
-            self._collection_map[elem.name] = elem
         else:
             raise TypeError(f"Invalid type {str(type(item))}")
 
+    def append_many(self, items: Iterable[Any]) -> None:
+        """
+        Appends multiple elements and/or sub-packages.
+        All items are validated before the package is modified.
+        """
+        items = list(items)
+        packages = []
+        elements = []
+        for item in items:
+            if isinstance(item, Package):
+                packages.append(item)
+            elif isinstance(item, ARElement):
+                elements.append(item)
+            else:
+                raise TypeError(f"Invalid type {str(type(item))}")
+        new_map = {item.name: item for item in items}
+        if len(new_map) != len(items) or not self._collection_map.keys().isdisjoint(new_map):
+            seen = set(self._collection_map)
+            for item in items:
+                if item.name in seen:
+                    raise ValueError(
+                        f"Item with SHORT-NAME '{item.name}' already exists in package '{self.name}'")
+                seen.add(item.name)
+        for item in items:
+            item.parent = self
+        self._collection_map.update(new_map)
+        self.packages.extend(packages)
+        self.elements.extend(elements)
+
     def make_packages(self, ref: str) -> "Package":
         """
         Recursively creates sub-packages
         """
-        if ref.startswith('/'):
-            raise ValueError("Reference string can't start with '/'")
-        parts = ref.partition('/')
-        package = self._collection_map.get(parts[0], None)
-        if package is None:
-            package = self.create_package(parts[0])
-        elif not isinstance(package, Package):
-            raise KeyError(f"Item with name '{parts[0]}' already exists but isn't a package")
-        if len(parts[2]) > 0:
-            return package.make_packages(parts[2])
-        else:
-            return package
+        package = self
+        while True:
+            if ref.startswith('/'):
+                raise ValueError("Reference string can't start with '/'")
+            name, _, ref = ref.partition('/')
+            child = package._collection_map.get(name, None)
+            if child is None:
+                child = package.create_package(name)
+            elif not isinstance(child, Package):
+                raise KeyError(f"Item with name '{name}' already exists but isn't a package")
+            package = child
+            if len(ref) == 0:
+                return package
 
     def create_package(self, name: str, **kwargs) -> "Package":
         """
@@ -2922,20 +3791,34 @@ class Package(CollectableElement):
 
     def find(self, ref: str) -> Any:
         """
-        Finds item by reference
+        Finds item by reference.
+        Walks through sub-packages in a loop, other elements handle the remaining reference themselves.
         """
-        if ref.startswith('/'):
-            ref = ref[1:]
-        parts = ref.partition('/')
-        item = self._collection_map.get(parts[0], None)
-        if item is not None:
-            if len(parts[2]) > 0:
-                return item.find(parts[2])
-        return item
+        item = self
+        while True:
+            if ref.startswith('/'):
+                ref = ref[1:]
+            name, _, ref = ref.partition('/')
+            item = item._collection_map.get(name, None)
+            if item is None or len(ref) == 0:
+                return item
+            if not isinstance(item, Package):
+                return item.find(ref)
 
     def update_ref_parts(self, ref_parts: list[str]):
         """
-        Utility method used generating XML references
+        Utility method used generating XML references.
+        Parts are appended in root to leaf order.
         """
-        ref_parts.append(self.name)
         self.parent.update_ref_parts(ref_parts)
+        ref_parts.append(self.name)
+
+    def _invalidate_ref(self) -> None:
+        """
+        Clears cached reference strings of this package and everything below it
+        """
+        super()._invalidate_ref()
+        for elem in getattr(self, "elements", ()):
+            elem._invalidate_ref()  # pylint: disable=protected-access
+        for package in getattr(self, "packages", ()):
+            package._invalidate_ref()  # pylint: disable=protected-access
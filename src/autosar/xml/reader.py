@@ -52,9 +52,8 @@ class ChildElementMap:
     """
 
     def __init__(self, elem: ElementTree.Element) -> None:
-        self.elements: dict[str, WrappedElement] = {}
-        for child_elem in elem.findall('./*'):
-            self.elements[str(child_elem.tag)] = WrappedElement(child_elem)
+        self.elements: dict[str, WrappedElement] = {
+            child_elem.tag: WrappedElement(child_elem) for child_elem in elem.iterchildren(ElementTree.Element)}
 
     def get(self, tag: str) -> ElementTree.Element:
         """
@@ -277,9 +276,10 @@ class Reader:
         """
         wrapped = '{' + namespace + '}'
         wrapped_len = len(wrapped)
-        for elem in self.xml_root.iter():
-            if isinstance(elem.tag, str) and elem.tag.startswith(wrapped):
-                elem.tag = elem.tag[wrapped_len:]
+        for elem in self.xml_root.iter(ElementTree.Element):
+            tag = elem.tag
+            if tag.startswith(wrapped):
+                elem.tag = tag[wrapped_len:]
 
     def _read_boolean(self, value: str) -> bool:
         """
@@ -310,7 +310,7 @@ class Reader:
         Reads AR:INTEGER
         """
         try:
-            value = int(text, 0)
+            value = ar_element.str_to_int(text)
         except ValueError as exc:
             raise ar_exception.ParseError(f"Failed to parse integer: {text}") from exc
         return value
@@ -489,25 +489,25 @@ class Reader:
         Reads AR:AR-PACKAGE.ELEMENTS
         Type: Utility
         """
+        elements = []
         for xml_child_elem in xml_elements.findall('./*'):
             read_method = self.switcher_collectable.get(
                 xml_child_elem.tag, None)
             if read_method is not None:
                 element = read_method(xml_child_elem)
                 assert isinstance(element, ar_element.ARElement)
-                package.append(element)
+                elements.append(element)
             else:
                 self._report_unprocessed_element(xml_child_elem)
+        package.append_many(elements)
 
     def _read_sub_packages(self, package: ar_element.Package, xml_packages: ElementTree.Element) -> None:
         """
         Reads AR:AR-PACKAGE.ELEMENTS
         Type: Utility
         """
-        for xml_child_package in xml_packages.findall('./AR-PACKAGE'):
-            child_package = self._read_package(xml_child_package)
-            assert isinstance(child_package, ar_element.Package)
-            package.append(child_package)
+        package.append_many([self._read_package(xml_child_package)
+                             for xml_child_package in xml_packages.findall('./AR-PACKAGE')])
 
     # Documentation elements
 
@@ -557,14 +557,16 @@ class Reader:
         Type: Concrete
         """
         elem = ar_element.DocumentationBlock()
+        elements = []
         for xml_child_elem in xml_elem.findall('./*'):
             if xml_child_elem.tag == 'P':
-                elem.append(
+                elements.append(
                     self._read_multi_language_paragraph(xml_child_elem))
             elif xml_child_elem.tag == 'VERBATIM':
-                elem.append(self._read_multi_language_verbatim(xml_child_elem))
+                elements.append(self._read_multi_language_verbatim(xml_child_elem))
             else:
                 self._report_unprocessed_element(xml_child_elem)
+        elem.extend_trusted(elements)
         return elem
 
     def _read_emphasis_text(self, elem: ElementTree.Element) -> ar_element.EmphasisText:
@@ -859,9 +861,8 @@ class Reader:
         self._read_paginateable_attrib(xml_elem.attrib, attr)
         self._read_multi_language_paragraph_attrib(xml_elem.attrib, attr)
         elem = ar_element.MultiLanguageParagraph(**attr)
-        for xml_child_elem in xml_elem.findall('./*'):
-            if xml_child_elem.tag == 'L-1':
-                elem.append(self._read_language_paragraph(xml_child_elem))
+        elem.extend_trusted(self._read_language_paragraph(xml_child_elem)
+                            for xml_child_elem in xml_elem.findall('./L-1'))
         return elem
 
     def _read_document_view_selectable_attrib(self, attrib: dict, data: dict) -> None:
@@ -903,9 +904,8 @@ class Reader:
         self._read_paginateable_attrib(xml_elem.attrib, attr)
         self._read_multi_language_verbatim_attrib(xml_elem.attrib, attr)
         elem = ar_element.MultiLanguageVerbatim(**attr)
-        for xml_child_elem in xml_elem.findall('./*'):
-            if xml_child_elem.tag == 'L-5':
-                elem.append(self._read_language_verbatim(xml_child_elem))
+        elem.extend_trusted(self._read_language_verbatim(xml_child_elem)
+                            for xml_child_elem in xml_elem.findall('./L-5'))
         return elem
 
     def _read_multi_language_verbatim_attrib(self, attrib: dict, data: dict) -> None:
@@ -1114,11 +1114,8 @@ class Reader:
         Type: Concrete
         Tag variants: 'COMPU-NUMERATOR' | 'COMPU-DENOMINATOR'
         """
-        values = []
-        for xml_child in xml_element.findall('./V'):
-            num_val = ar_element.NumericalValue(xml_child.text)
-            values.append(num_val.value)
-        return tuple(values)
+        str_to_number = ar_element.str_to_number
+        return tuple(str_to_number(xml_child.text) for xml_child in xml_element.findall('./V'))
 
     # Constraint elements
 
@@ -1211,6 +1208,7 @@ class Reader:
         xml_child = child_elements.get("SCALE-CONSTRS")
         if xml_child is not None:
             data["scale_constr"] = self._read_scale_constraints(xml_child)
+            data["_own_list"] = True
         xml_child = child_elements.get("MAX-GRADIENT")
         if xml_child is not None:
             data["max_gradient"] = self._read_number(xml_child.text)
@@ -1601,10 +1599,9 @@ class Reader:
             data["is_optional"] = self._read_boolean(xml_child.text)
         xml_child = child_elements.get("SUB-ELEMENTS")
         if xml_child is not None:
-            sub_elements = []
-            for sub_element_xml in xml_child.findall("./IMPLEMENTATION-DATA-TYPE-ELEMENT"):
-                sub_elements.append(self._read_implementation_data_type_element(sub_element_xml))
-            data["sub_elements"] = sub_elements
+            read_element = self._read_implementation_data_type_element
+            data["sub_elements"] = [read_element(sub_element_xml)
+                                    for sub_element_xml in xml_child.findall("./IMPLEMENTATION-DATA-TYPE-ELEMENT")]
         xml_child = child_elements.get("SW-DATA-DEF-PROPS")
         if xml_child is not None:
             data["sw_data_def_props"] = self._read_sw_data_def_props(xml_child)
@@ -1639,10 +1636,9 @@ class Reader:
             data["is_struct_with_optional_element"] = self._read_boolean(xml_child.text)
         xml_child = child_elements.get("SUB-ELEMENTS")
         if xml_child is not None:
-            sub_elements = []
-            for sub_element_xml in xml_child.findall("./IMPLEMENTATION-DATA-TYPE-ELEMENT"):
-                sub_elements.append(self._read_implementation_data_type_element(sub_element_xml))
-            data["sub_elements"] = sub_elements
+            read_element = self._read_implementation_data_type_element
+            data["sub_elements"] = [read_element(sub_element_xml)
+                                    for sub_element_xml in xml_child.findall("./IMPLEMENTATION-DATA-TYPE-ELEMENT")]
         xml_child = child_elements.get("SYMBOL-PROPS")
         if xml_child is not None:
             data["symbol_props"] = self._read_symbol_props(xml_child)
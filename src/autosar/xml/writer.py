@@ -2,10 +2,13 @@
 ARXML writer module
 """
 # pylint: disable=consider-using-with
-from io import StringIO
-from typing import TextIO, Union
+from typing import BinaryIO, Callable, Union
+from enum import Enum
+import functools
 import math
+import os
 import decimal
+import lxml.etree as ElementTree
 import autosar.xml.document as ar_document
 import autosar.xml.element as ar_element
 import autosar.xml.enumeration as ar_enum
@@ -15,6 +18,7 @@ import autosar.xml.enumeration as ar_enum
 
 MultiLanguageOverviewParagraph = ar_element.MultiLanguageOverviewParagraph
 TupleList = list[tuple[str, str]]
+Attributes = TupleList | tuple[tuple[str, str], ...]  # Attribute pairs, read only
 ValueSpeficationElement = Union[ar_element.TextValueSpecification,
                                 ar_element.NumericalValueSpecification,
                                 ar_element.NotAvailableValueSpecification,
@@ -23,128 +27,295 @@ ValueSpeficationElement = Union[ar_element.TextValueSpecification,
                                 ar_element.ApplicationValueSpecification,
                                 ar_element.ConstantReference]
 
+_LINESEP = os.linesep  # Line endings written to file, same as text mode would produce
+_FILE_BUFFER_SIZE = 65536  # Buffer size of output file, collects the per-element flushes into larger writes
+_XML_DECLARATION = '<?xml version="1.0" encoding="utf-8"?>'
+_float_repr = float.__repr__
+
+
+def _escape_text(text: str | int | float) -> str:
+    """
+    Escapes XML markup characters in text content.
+    Text without any such characters is returned as is.
+    """
+    if text.__class__ is not str:
+        text = str(text)
+    if '&' not in text and '<' not in text and '>' not in text:
+        return text
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def _escape_attr(value: str | int | float) -> str:
+    """
+    Escapes XML markup characters in attribute value (double-quoted).
+    Values without any such characters are returned as is.
+    """
+    if value.__class__ is not str:
+        value = str(value)
+    if '&' not in value and '<' not in value and '"' not in value:
+        return value
+    return value.replace('&', '&amp;').replace('<', '&lt;').replace('"', '&quot;')
+
+
+@functools.lru_cache(maxsize=None)
+def _autosar_start_tag(schema_file: str) -> str:
+    """
+    Creates AUTOSAR start tag with schema attributes
+    """
+    return ('<AUTOSAR'
+            f' xsi:schemaLocation="http://autosar.org/schema/r4.0 {schema_file}"'
+            ' xmlns="http://autosar.org/schema/r4.0"'
+            ' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">')
+
 
 class _XMLWriter:
     def __init__(self, indentation_step: int) -> None:
         self.file_path: str = None
-        self.fh: TextIO = None  # pylint: disable=invalid-name
+        self.fh: BinaryIO = None  # pylint: disable=invalid-name
+        self._buf: list[str] = []  # Output buffer, flushed to fh in large chunks when writing to file
+        self._write: Callable[[str], None] = None  # Bound append method of output buffer
         self.indentation_char: str = ' '
         # Number of characters (spaces) per indendation
         self.indentation_step = indentation_step
         self.indentation_level: int = 0  # current indentation level
         self.indentation_str: str = ''
-        self.tag_stack = []  # stack of tag names
+        self._line_prefix: str = '\n'  # newline followed by indentation_str
+        # Indentation strings and their newline-prefixed variants indexed by level, extended on demand
+        self._indentation_cache: list[str] = ['']
+        self._line_prefix_cache: list[str] = ['\n']
+        self.tag_stack: list[str] = []  # stack of tag names
+        self._tag_cache: dict[str, tuple[str, str, str]] = {}  # tag name -> ('<TAG>', '</TAG>', '<TAG/>')
+        self._enum_xml_cache: dict[Enum, str] = {}  # enum item -> XML text
         self.line_number: int = 0
 
     def _str_open(self):
-        self.fh = StringIO()
+        self.fh = None
+        self._buf = []
+        self._write = self._buf.append
         self.line_number = 1
-        self.indentation_level = 0
-        self.indentation_str = ''
+        self._set_indentation_level(0)
         self.tag_stack.clear()
 
     def _open(self, file_path: str):
-        self.fh = open(file_path, 'w', encoding='utf-8')
+        self.fh = open(file_path, 'wb', buffering=_FILE_BUFFER_SIZE)
+        self._buf = []
+        self._write = self._buf.append
         self.file_path = file_path
         self.line_number = 1
-        self.indentation_level = 0
-        self.indentation_str = ''
+        self._set_indentation_level(0)
         self.tag_stack.clear()
 
+    def _flush(self):
+        """
+        Writes buffered text to file. Does nothing when writing to string.
+        The text is encoded in one step, bypassing the text layer of the file object.
+        """
+        if self.fh is not None and self._buf:
+            text = ''.join(self._buf)
+            if _LINESEP != '\n':
+                text = text.replace('\n', _LINESEP)
+            self.fh.write(text.encode('utf-8'))
+            self._buf.clear()
+
     def _close(self):
+        self._flush()
         self.fh.close()
+        self.fh = None
+        self._write = None
 
-    def _indent(self):
-        self.indentation_level += 1
-        self.indentation_str = self.indentation_char * \
-            (self.indentation_level * self.indentation_step)
+    def _str_value(self) -> str:
+        """
+        Returns text written since last call to _str_open
+        """
+        return ''.join(self._buf)
 
-    def _dedent(self):
-        self.indentation_level -= 1
-        if self.indentation_level == 0:
-            self.indentation_str = ''
-        else:
-            self.indentation_str = self.indentation_char * \
-                (self.indentation_level * self.indentation_step)
+    def _set_indentation_level(self, level: int) -> None:
+        cache = self._indentation_cache
+        while len(cache) <= level:
+            indentation = self.indentation_char * (len(cache) * self.indentation_step)
+            cache.append(indentation)
+            self._line_prefix_cache.append('\n' + indentation)
+        self.indentation_level = level
+        self.indentation_str = cache[level]
+        self._line_prefix = self._line_prefix_cache[level]
+
+    def _indent(self) -> None:
+        self._set_indentation_level(self.indentation_level + 1)
+
+    def _dedent(self) -> None:
+        self._set_indentation_level(self.indentation_level - 1)
 
-    def _add_line(self, text):
+    def _add_xml_declaration(self) -> None:
+        self._add_line(_XML_DECLARATION)
+
+    def _add_line(self, text: str) -> None:
         if self.line_number > 1:
-            self.fh.write('\n')
+            self._write(self._line_prefix + text)
+        else:
+            self._write(self.indentation_str + text)
         self.line_number += 1
-        self.fh.write(self.indentation_str)
-        self.fh.write(text)
 
-    def _add_inline_text(self, text):
-        self.fh.write(text)
+    def _add_inline_text(self, text: str) -> None:
+        self._write(text)
+
+    def _add_inline_content(self, text: str) -> None:
+        self._write(_escape_text(text))
+
+    def _cache_tags(self, tag: str) -> tuple[str, str, str]:
+        """
+        Creates and caches opening, closing and empty-element tag strings for tag name
+        """
+        tags = self._tag_cache[tag] = (f'<{tag}>', f'</{tag}>', f'<{tag}/>')
+        return tags
 
-    def _add_child(self, tag: str, attr: TupleList = None):
+    def _add_child(self, tag: str, attr: None | Attributes = None) -> None:
+        tags = self._tag_cache.get(tag) or self._cache_tags(tag)
         if attr:
-            self._add_line(f'<{tag} {self._attr_to_str(attr)}>')
+            self._add_line(self._open_tag(tag, attr))
         else:
-            self._add_line(f'<{tag}>')
+            self._add_line(tags[0])
         self.tag_stack.append(tag)
         self._indent()
 
-    def _leave_child(self):
+    def _add_child_start_tag(self, tag: str, start_tag: str) -> None:
+        """
+        Same as _add_child but with a start tag that is already formatted
+        """
+        if tag not in self._tag_cache:
+            self._cache_tags(tag)
+        self._add_line(start_tag)
+        self.tag_stack.append(tag)
+        self._indent()
+
+    def _leave_child(self) -> None:
         tag = self.tag_stack.pop()
         self._dedent()
-        self._add_line(f'</{tag}>')
+        self._add_line(self._tag_cache[tag][1])
 
-    def _begin_line(self, tag: str, attr: None | TupleList = None):
-        if self.line_number > 1:
-            self.fh.write('\n')
-        self.line_number += 1
-        self.fh.write(self.indentation_str)
-        if attr is None or len(attr) == 0:
-            text = f'<{tag}>'
+    def _begin_line(self, tag: str, attr: None | Attributes = None) -> None:
+        if not attr:
+            text = (self._tag_cache.get(tag) or self._cache_tags(tag))[0]
         else:
-            text = f'<{tag} {self._attr_to_str(attr)}>'
-        self._add_inline_text(text)
+            text = self._open_tag(tag, attr)
+        self._add_line(text)
 
-    def _end_line(self, tag: str):
-        text = f'</{tag}>'
-        self.fh.write(text)
+    def _end_line(self, tag: str) -> None:
+        self._write((self._tag_cache.get(tag) or self._cache_tags(tag))[1])
 
-    def _add_content(self, tag: str, content: str = '', attr: TupleList = None, inline: bool = False):
+    def _add_content(self, tag: str, content: str = '', attr: None | Attributes = None, inline: bool = False) -> None:
+        if content:
+            content = _escape_text(content)
         if attr:
             if content:
-                text = f'<{tag} {self._attr_to_str(attr)}>{content}</{tag}>'
+                text = f'{self._open_tag(tag, attr)}{content}</{tag}>'
             else:
-                text = f'<{tag} {self._attr_to_str(attr)}/>'
+                text = self._open_tag(tag, attr, '/>')
         else:
             if content:
                 text = f'<{tag}>{content}</{tag}>'
             else:
-                text = f'<{tag}/>'
+                text = (self._tag_cache.get(tag) or self._cache_tags(tag))[2]
         if inline:
             self._add_inline_text(text)
         else:
             self._add_line(text)
 
-    def _attr_to_str(self, attr: TupleList) -> str:
+    def _add_empty_tag(self, tag: str) -> None:
+        self._add_line((self._tag_cache.get(tag) or self._cache_tags(tag))[2])
+
+    def _add_text_tag(self, tag: str, content: str) -> None:
+        if content:
+            content = _escape_text(content)
+        if content and self.line_number > 1:
+            # Same as _add_line but formatted in one step together with the line prefix
+            self._write(f'{self._line_prefix}<{tag}>{content}</{tag}>')
+            self.line_number += 1
+        elif content:
+            self._add_line(f'<{tag}>{content}</{tag}>')
+        else:
+            self._add_line((self._tag_cache.get(tag) or self._cache_tags(tag))[2])
+
+    def _add_int_tag(self, tag: str, value: int) -> None:
         """
-        Converts pairs (2-tuples) into attribute XML string
+        Same as _add_text_tag but for integer content.
+        Integers never need escaping, so the value is formatted directly.
         """
-        parts = [f'{elem[0]}="{elem[1]}"' for elem in attr]
-        return ' '.join(parts)
+        if value.__class__ is not int:
+            value = int(value)
+        if value and self.line_number > 1:
+            self._write(f'{self._line_prefix}<{tag}>{value}</{tag}>')
+            self.line_number += 1
+        elif value:
+            self._add_line(f'<{tag}>{value}</{tag}>')
+        else:
+            self._add_line((self._tag_cache.get(tag) or self._cache_tags(tag))[2])
+
+    def _add_number_tags(self, tag: str, numbers: list[str]) -> None:
+        """
+        Writes one element per formatted number in a single step.
+        Formatted numbers never need escaping.
+        """
+        if self.line_number > 1:
+            line_prefix = self._line_prefix
+            self._write(''.join([f'{line_prefix}<{tag}>{number}</{tag}>' for number in numbers]))
+            self.line_number += len(numbers)
+        else:
+            for number in numbers:
+                self._add_text_tag(tag, number)
+
+    def _add_ref_tag(self, tag: str, dest: str, value: str) -> None:
+        """
+        Same as _add_content with DEST as the only attribute.
+        The DEST value comes from an enumeration and never needs escaping.
+        """
+        if self.line_number > 1:
+            # Same as _add_line but formatted in one step together with the line prefix
+            if value:
+                self._write(f'{self._line_prefix}<{tag} DEST="{dest}">{_escape_text(value)}</{tag}>')
+            else:
+                self._write(f'{self._line_prefix}<{tag} DEST="{dest}"/>')
+            self.line_number += 1
+        elif value:
+            self._add_line(f'<{tag} DEST="{dest}">{_escape_text(value)}</{tag}>')
+        else:
+            self._add_line(f'<{tag} DEST="{dest}"/>')
+
+    def _open_tag(self, tag: str, attr: Attributes, end: str = '>') -> str:
+        """
+        Creates start tag (or empty-element tag when end is '/>') with
+        attributes from pairs (2-tuples) in a single pass
+        """
+        if len(attr) == 1:
+            name, value = attr[0]
+            return f'<{tag} {name}="{_escape_attr(value)}"{end}'
+        return f'<{tag}' + ''.join([f' {name}="{_escape_attr(value)}"' for name, value in attr]) + end
 
     def _format_float(self, value: float) -> str:
         """
         Formats a float into a printable number string.
         The fractional part will automatically be stripped if possible
         """
+        # float.__repr__ also gives the plain shortest repr for float subclasses such as numpy.float64
+        text = _float_repr(value)
+        if 'e' not in text and 'n' not in text:
+            # Positional repr is already the shortest form, only an integral '.0' suffix needs stripping
+            return text[:-2] if text.endswith('.0') else text
         if math.isinf(value):
             return '-INF' if value < 0 else 'INF'
         if math.isnan(value):
             return 'NaN'
-        else:
-            tmp = decimal.Decimal(str(value))
-            return tmp.quantize(decimal.Decimal(1)) if tmp == tmp.to_integral() else tmp.normalize()
+        tmp = decimal.Decimal(text)
+        return str(tmp.quantize(decimal.Decimal(1)) if tmp == tmp.to_integral() else tmp.normalize())
 
     def _format_number(self, number: int | float | ar_element.NumericalValue) -> str:
         """
         Converts number to string
         """
+        number_class = number.__class__
+        if number_class is int:
+            return str(number)
+        if number_class is float:
+            return self._format_float(number)
         if isinstance(number, int):
             return str(number)
         elif isinstance(number, float):
@@ -161,6 +332,15 @@ class _XMLWriter:
         assert isinstance(value, bool)
         return 'true' if value else 'false'
 
+    def _enum_to_xml(self, enum_item: Enum) -> str:
+        """
+        Converts enum value to XML, caching the result per enum item
+        """
+        text = self._enum_xml_cache.get(enum_item)
+        if text is None:
+            text = self._enum_xml_cache[enum_item] = ar_enum.enum_to_xml(enum_item)
+        return text
+
     def _format_numerical_value(self, number: ar_element.NumericalValue) -> str:
         if number.value_format in (ar_enum.ValueFormat.DEFAULT, ar_enum.ValueFormat.DECIMAL):
             return self._format_number(number.value)
@@ -179,93 +359,200 @@ class Writer(_XMLWriter):
     ARXML writer class
     """
 
+    # Writer method names keyed by element class name
+    # Elements found in AR:PACKAGE
+    _COLLECTABLE_METHODS = {
+        # Package
+        'Package': '_write_package',
+        # CompuMethod elements
+        'CompuMethod': '_write_compu_method',
+        # Data type elements
+        'ApplicationArrayDataType': '_write_application_array_data_type',
+        'ApplicationRecordDataType': '_write_application_record_data_type',
+        'ApplicationPrimitiveDataType': '_write_application_primitive_data_type',
+        'SwBaseType': '_write_sw_base_type',
+        'SwAddrMethod': '_write_sw_addr_method',
+        'ImplementationDataType': '_write_implementation_data_type',
+        'DataTypeMappingSet': '_write_data_type_mapping_set',
+        # DataConstraint elements
+        'DataConstraint': '_write_data_constraint',
+        # Unit elements
+        'Unit': '_write_unit',
+        # Constant elements
+        'ConstantSpecification': '_write_constant_specification',
+    }
+    # Value specification elements
+    _VALUE_SPECIFICATION_METHODS = {
+        'TextValueSpecification': '_write_text_value_specification',
+        'NumericalValueSpecification': '_write_numerical_value_specification',
+        'NotAvailableValueSpecification': '_write_not_available_value_specification',
+        'ArrayValueSpecification': '_write_array_value_specification',
+        'RecordValueSpecification': '_write_record_value_specification',
+        'ApplicationValueSpecification': '_write_application_value_specification',
+        'ConstantReference': '_write_constant_reference',
+    }
+    # Elements used only for unit test purposes
+    _NON_COLLECTABLE_METHODS = {
+        # Documentation elements
+        'Annotation': '_write_annotation',
+        'Break': '_write_break',
+        'DocumentationBlock': '_write_documentation_block',
+        'EmphasisText': '_write_emphasis_text',
+        'IndexEntry': '_write_index_entry',
+        'MultilanguageLongName': '_write_multi_language_long_name',
+        'MultiLanguageOverviewParagraph': '_write_multi_language_overview_paragraph',
+        'MultiLanguageParagraph': '_write_multi_language_paragraph',
+        'MultiLanguageVerbatim': '_write_multi_language_verbatim',
+        'LanguageLongName': '_write_language_long_name',
+        'LanguageParagraph': '_write_language_paragraph',
+        'LanguageVerbatim': '_write_language_verbatim',
+        'Package': '_write_package',
+        'SingleLanguageUnitNames': '_write_single_language_unit_names',
+        'Superscript': '_write_superscript',
+        'Subscript': '_write_subscript',
+        'TechnicalTerm': '_write_technical_term',
+        # CompuMethod elements
+        'Computation': '_write_computation',
+        'CompuRational': '_write_compu_rational',
+        'CompuScale': '_write_compu_scale',
+        # Constraint elements
+        'ScaleConstraint': '_write_scale_constraint',
+        'InternalConstraint': '_write_internal_constraint',
+        'PhysicalConstraint': '_write_physical_constraint',
+        'DataConstraintRule': '_write_data_constraint_rule',
+        # DataType and DataDictionary elements
+        'SwDataDefPropsConditional': '_write_sw_data_def_props_conditional',
+        'SwBaseTypeRef': '_write_sw_base_type_ref',
+        'SwBitRepresentation': '_write_sw_bit_represenation',
+        'SwTextProps': '_write_sw_text_props',
+        'SwPointerTargetProps': '_write_sw_pointer_target_props',
+        'SymbolProps': '_write_symbol_props',
+        'ImplementationDataTypeElement': '_write_implementation_data_type_element',
+        'ApplicationArrayElement': '_write_application_array_element',
+        'ApplicationRecordElement': '_write_application_record_element',
+        'DataTypeMap': '_write_data_type_map',
+        'ValueList': '_write_value_list',
+        # CalibrationData elements
+        'SwValues': '_write_sw_values',
+        'SwAxisCont': '_write_sw_axis_cont',
+        'SwValueCont': '_write_sw_value_cont',
+        # Reference elements
+        'PhysicalDimensionRef': '_write_physical_dimension_ref',
+        'ApplicationDataTypeRef': '_write_application_data_type_ref',
+        'ConstantRef': '_write_constant_ref',
+    }
+
+    _ALL_METHODS = {**_COLLECTABLE_METHODS, **_VALUE_SPECIFICATION_METHODS, **_NON_COLLECTABLE_METHODS}
+
+    # Writers for AR:COMPU-CONST values, keyed by value type in order of precedence
+    _COMPU_CONST_VALUE_WRITERS: dict[type, Callable] = {
+        str: lambda self, value: self._add_text_tag("VT", value),
+        float: lambda self, value: self._add_text_tag("V", self._format_float(value)),
+        int: lambda self, value: self._add_text_tag("V", value),
+    }
+
+    # Type-keyed dispatch tables of plain functions, built once per class by _init_dispatch_tables
+    _collectable_by_type: dict[type, Callable] = {}
+    _value_specification_by_type: dict[type, Callable] = {}
+    _all_by_type: dict[type, Callable] = {}
+    # Writers for inline text parts, one table per parent element in order of precedence
+    _long_name_part_writers: dict[type, Callable] = {}
+    _paragraph_part_writers: dict[type, Callable] = {}
+    _verbatim_part_writers: dict[type, Callable] = {}
+    _unit_names_part_writers: dict[type, Callable] = {}
+
     def __init__(self) -> None:
         super().__init__(indentation_step=2)
-        # Elements found in AR:PACKAGE
-        self.switcher_collectable = {
-            # Package
-            'Package': self._write_package,
-            # CompuMethod elements
-            'CompuMethod': self._write_compu_method,
-            # Data type elements
-            'ApplicationArrayDataType': self._write_application_array_data_type,
-            'ApplicationRecordDataType': self._write_application_record_data_type,
-            'ApplicationPrimitiveDataType': self._write_application_primitive_data_type,
-            'SwBaseType': self._write_sw_base_type,
-            'SwAddrMethod': self._write_sw_addr_method,
-            'ImplementationDataType': self._write_implementation_data_type,
-            'DataTypeMappingSet': self._write_data_type_mapping_set,
-            # DataConstraint elements
-            'DataConstraint': self._write_data_constraint,
-            # Unit elements
-            'Unit': self._write_unit,
-            # Constant elements
-            'ConstantSpecification': self._write_constant_specification,
+        # Attribute list shared by writers that pass it on to _add_child, _begin_line or _add_content
+        # right after filling it. Those consume the attributes immediately, making reuse safe.
+        self._scratch_attr: TupleList = []
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Rebuilds dispatch tables for subclasses
+        """
+        super().__init_subclass__(**kwargs)
+        cls._init_dispatch_tables()
+
+    @classmethod
+    def _init_dispatch_tables(cls) -> None:
+        """
+        Builds the type-keyed dispatch tables from the method name tables.
+        Runs once per class so that methods overridden in subclasses are used.
+        """
+        def by_type(method_names: dict[str, str]) -> dict[type, Callable]:
+            table = {}
+            for class_name, method_name in method_names.items():
+                elem_type = getattr(ar_element, class_name, None)
+                if isinstance(elem_type, type):
+                    table[elem_type] = getattr(cls, method_name)
+            return table
+
+        cls._collectable_by_type = by_type(cls._COLLECTABLE_METHODS)
+        cls._value_specification_by_type = by_type(cls._VALUE_SPECIFICATION_METHODS)
+        cls._all_by_type = by_type(cls._ALL_METHODS)
+        part_writers = {
+            str: cls._add_inline_content,
+            ar_element.Break: cls._write_break,
+            ar_element.EmphasisText: cls._write_emphasis_text,
+            ar_element.IndexEntry: cls._write_index_entry,
+            ar_element.Subscript: cls._write_subscript,
+            ar_element.Superscript: cls._write_superscript,
+            ar_element.TechnicalTerm: cls._write_technical_term,
         }
-        # Value specification elements
-        self.switcher_value_specification = {
-            'TextValueSpecification': self._write_text_value_specification,
-            'NumericalValueSpecification': self._write_numerical_value_specification,
-            'NotAvailableValueSpecification': self._write_not_available_value_specification,
-            'ArrayValueSpecification': self._write_array_value_specification,
-            'RecordValueSpecification': self._write_record_value_specification,
-            'ApplicationValueSpecification': self._write_application_value_specification,
-            'ConstantReference': self._write_constant_reference,
-        }
-        # Elements used only for unit test purposes
-        self.switcher_non_collectable = {
-            # Documentation elements
-            'Annotation': self._write_annotation,
-            'Break': self._write_break,
-            'DocumentationBlock': self._write_documentation_block,
-            'EmphasisText': self._write_emphasis_text,
-            'IndexEntry': self._write_index_entry,
-            'MultilanguageLongName': self._write_multi_language_long_name,
-            'MultiLanguageOverviewParagraph': self._write_multi_language_overview_paragraph,
-            'MultiLanguageParagraph': self._write_multi_language_paragraph,
-            'MultiLanguageVerbatim': self._write_multi_language_verbatim,
-            'LanguageLongName': self._write_language_long_name,
-            'LanguageParagraph': self._write_language_paragraph,
-            'LanguageVerbatim': self._write_language_verbatim,
-            'Package': self._write_package,
-            'SingleLanguageUnitNames': self._write_single_language_unit_names,
-            'Superscript': self._write_superscript,
-            'Subscript': self._write_subscript,
-            'TechnicalTerm': self._write_technical_term,
-            # CompuMethod elements
-            'Computation': self._write_computation,
-            'CompuRational': self._write_compu_rational,
-            'CompuScale': self._write_compu_scale,
-            # Constraint elements
-            'ScaleConstraint': self._write_scale_constraint,
-            'InternalConstraint': self._write_internal_constraint,
-            'PhysicalConstraint': self._write_physical_constraint,
-            'DataConstraintRule': self._write_data_constraint_rule,
-            # DataType and DataDictionary elements
-            'SwDataDefPropsConditional': self._write_sw_data_def_props_conditional,
-            'SwBaseTypeRef': self._write_sw_base_type_ref,
-            'SwBitRepresentation': self._write_sw_bit_represenation,
-            'SwTextProps': self._write_sw_text_props,
-            'SwPointerTargetProps': self._write_sw_pointer_target_props,
-            'SymbolProps': self._write_symbol_props,
-            'ImplementationDataTypeElement': self._write_implementation_data_type_element,
-            'ApplicationArrayElement': self._write_application_array_element,
-            'ApplicationRecordElement': self._write_application_record_element,
-            'DataTypeMap': self._write_data_type_map,
-            'ValueList': self._write_value_list,
-            # CalibrationData elements
-            'SwValues': self._write_sw_values,
-            'SwAxisCont': self._write_sw_axis_cont,
-            'SwValueCont': self._write_sw_value_cont,
-            # Reference elements
-            'PhysicalDimensionRef': self._write_physical_dimension_ref,
-            'ApplicationDataTypeRef': self._write_application_data_type_ref,
-            'ConstantRef': self._write_constant_ref,
-        }
-        self.switcher_all = {}  # All concrete elements (used for unit testing)
-        self.switcher_all.update(self.switcher_collectable)
-        self.switcher_all.update(self.switcher_value_specification)
-        self.switcher_all.update(self.switcher_non_collectable)
+        cls._long_name_part_writers = {key: value for key, value in part_writers.items()
+                                       if key is not ar_element.Break}
+        cls._paragraph_part_writers = part_writers
+        cls._verbatim_part_writers = {key: part_writers[key] for key in (str,
+                                                                         ar_element.Break,
+                                                                         ar_element.EmphasisText,
+                                                                         ar_element.TechnicalTerm)}
+        cls._unit_names_part_writers = {key: part_writers[key] for key in (str,
+                                                                           ar_element.Subscript,
+                                                                           ar_element.Superscript)}
+
+    def _find_write_function(self, by_type: dict[type, Callable], method_names: dict[str, str],
+                             elem: ar_element.ARObject) -> Callable | None:
+        """
+        Returns unbound writer function for elem, looked up by type and then by class name
+        """
+        write_function = by_type.get(elem.__class__)
+        if write_function is None:
+            method_name = method_names.get(elem.__class__.__name__)
+            if method_name is not None:
+                write_function = getattr(self.__class__, method_name)
+        return write_function
+
+    @functools.cached_property
+    def switcher_collectable(self) -> dict[str, Callable]:
+        """
+        Bound writer methods for elements found in AR:PACKAGE, keyed by class name
+        """
+        return self._bind_methods(self._COLLECTABLE_METHODS)
+
+    @functools.cached_property
+    def switcher_value_specification(self) -> dict[str, Callable]:
+        """
+        Bound writer methods for value specification elements, keyed by class name
+        """
+        return self._bind_methods(self._VALUE_SPECIFICATION_METHODS)
+
+    @functools.cached_property
+    def switcher_non_collectable(self) -> dict[str, Callable]:
+        """
+        Bound writer methods for elements used only for unit test purposes, keyed by class name
+        """
+        return self._bind_methods(self._NON_COLLECTABLE_METHODS)
+
+    @functools.cached_property
+    def switcher_all(self) -> dict[str, Callable]:
+        """
+        Bound writer methods for all concrete elements (used for unit testing), keyed by class name
+        """
+        return self._bind_methods(self._ALL_METHODS)
+
+    def _bind_methods(self, method_names: dict[str, str]) -> dict[str, Callable]:
+        return {class_name: getattr(self, method_name) for class_name, method_name in method_names.items()}
 
     def write_str(self, document: ar_document.Document, skip_root_attr: bool = True) -> str:
         """
@@ -273,7 +560,7 @@ class Writer(_XMLWriter):
         """
         self._str_open()
         self._write_document(document, skip_root_attr)
-        return self.fh.getvalue()
+        return self._str_value()
 
     def write_file(self, document: ar_document.Document, file_path: str):
         """
@@ -288,41 +575,45 @@ class Writer(_XMLWriter):
         Writes single ARXML element as string
         """
         self._str_open()
-        class_name = elem.__class__.__name__
-        write_method = self.switcher_all.get(class_name, None)
-        if write_method is not None:
+        write_function = self._find_write_function(self._all_by_type, self._ALL_METHODS, elem)
+        if write_function is not None:
             if tag is not None:
-                write_method(elem, tag)
+                write_function(self, elem, tag)
             else:
-                write_method(elem)
+                write_function(self, elem)
         else:
             raise NotImplementedError(
-                f"Found no writer for class {class_name}")
-        return self.fh.getvalue()
+                f"Found no writer for class {elem.__class__.__name__}")
+        return self._str_value()
 
     def write_file_elem(self, elem: ar_element.ARElement, file_path: str):
         """
         Writes single ARXML element to file
         """
         self._open(file_path)
-        class_name = elem.__class__.__name__
-        write_method = self.switcher_collectable.get(class_name, None)
-        if write_method is not None:
-            write_method(elem)
+        write_function = self._find_write_function(self._collectable_by_type, self._COLLECTABLE_METHODS, elem)
+        if write_function is not None:
+            write_function(self, elem)
         else:
-            raise NotImplementedError(f"Found no writer for {class_name}")
+            raise NotImplementedError(f"Found no writer for {elem.__class__.__name__}")
         self._close()
 
     # Abstract base classes
 
-    def _write_referrable(self, elem: ar_element.MultiLanguageReferrable):
+    def _write_referrable(self, elem: ar_element.MultiLanguageReferrable) -> None:
         """
         Writes group AR:REFERRABLE
         Type: Abstract
         """
-        self._add_content('SHORT-NAME', elem.name)
+        name = elem.name
+        if name and self.line_number > 1:
+            name = _escape_text(name)
+            self._write(f'{self._line_prefix}<SHORT-NAME>{name}</SHORT-NAME>')
+            self.line_number += 1
+        else:
+            self._add_text_tag('SHORT-NAME', name)
 
-    def _write_multilanguage_referrable(self, elem: ar_element.MultiLanguageReferrable):
+    def _write_multilanguage_referrable(self, elem: ar_element.MultiLanguageReferrable) -> None:
         """
         Writes AR:MULTILANGUAGE-REFFERABLE
         Type: Abstract
@@ -330,11 +621,22 @@ class Writer(_XMLWriter):
         if elem.long_name is not None:
             self._write_multi_language_long_name(elem.long_name, 'LONG-NAME')
 
-    def _collect_identifiable_attributes(self, elem: ar_element.Identifiable, attr: TupleList):
+    def _write_identifiable_header(self, elem: ar_element.Identifiable) -> None:
+        """
+        Writes groups AR:REFERRABLE, AR:MULTILANGUAGE-REFFERABLE and AR:IDENTIFIABLE
+        in sequence, as they appear at the start of every identifiable element
+        """
+        self._write_referrable(elem)
+        if elem.long_name is not None:
+            self._write_multi_language_long_name(elem.long_name, 'LONG-NAME')
+        self._write_identifiable(elem)
+
+    def _identifiable_attributes(self, elem: ar_element.Identifiable) -> None | Attributes:
+        """
+        Returns attributes from attributeGroup AR:IDENTIFIABLE, None when there are none
+        """
         if elem.uuid is not None:
-            attr.append(('UUID', elem.uuid))
-        if len(attr) > 0:
-            return attr
+            return (('UUID', elem.uuid),)
         return None
 
     def _write_identifiable(self, elem: ar_element.Identifiable) -> None:
@@ -345,7 +647,7 @@ class Writer(_XMLWriter):
         if elem.desc:
             self._write_multi_language_overview_paragraph(elem.desc, 'DESC')
         if elem.category:
-            self._add_content('CATEGORY', elem.category)
+            self._add_text_tag('CATEGORY', elem.category)
         if elem.admin_data:
             self._write_admin_data(elem.admin_data)
         if elem.introduction:
@@ -364,20 +666,17 @@ class Writer(_XMLWriter):
 
     # AUTOSAR Document
 
-    def _write_document(self, document: ar_document.Document, skip_root_attr: bool = False):
-        self._add_line('<?xml version="1.0" encoding="utf-8"?>')
+    def _write_document(self, document: ar_document.Document, skip_root_attr: bool = False) -> None:
+        self._add_xml_declaration()
         if skip_root_attr:
             self._add_child("AUTOSAR")
         else:
-            self._add_child("AUTOSAR", [('xsi:schemaLocation',
-                                         f'http://autosar.org/schema/r4.0 {document.schema_file}'),
-                                        ('xmlns', 'http://autosar.org/schema/r4.0'),
-                                        ('xmlns:xsi', 'http://www.w3.org/2001/XMLSchema-instance')])
-        if len(document.packages) > 0:
+            self._add_child_start_tag("AUTOSAR", _autosar_start_tag(document.schema_file))
+        if document.packages:
             self._write_packages(document.packages)
         self._leave_child()
 
-    def _write_packages(self, packages: list[ar_element.Package]):
+    def _write_packages(self, packages: list[ar_element.Package]) -> None:
         self._add_child("AR-PACKAGES")
         for package in packages:
             self._write_package(package)
@@ -392,28 +691,27 @@ class Writer(_XMLWriter):
         Tag variants: 'AR-PACKAGE'
         """
         assert isinstance(package, ar_element.Package)
-        attr: TupleList = []
-        self._collect_identifiable_attributes(package, attr)
+        attr = self._identifiable_attributes(package)
         self._add_child("AR-PACKAGE", attr)
-        self._write_referrable(package)
-        self._write_multilanguage_referrable(package)
-        self._write_identifiable(package)
-        if len(package.elements) > 0:
+        self._write_identifiable_header(package)
+        if package.elements:
             self._write_package_elements(package)
-        if len(package.packages) > 0:
+        if package.packages:
             self._write_sub_packages(package)
         self._leave_child()
 
     def _write_package_elements(self, package: ar_element.Package) -> None:
         self._add_child('ELEMENTS')
+        by_type = self._collectable_by_type
         for elem in package.elements:
-            class_name = elem.__class__.__name__
-            write_method = self.switcher_collectable.get(class_name, None)
-            if write_method is not None:
-                write_method(elem)
-            else:
-                raise NotImplementedError(
-                    f"Package: Found no writer for {class_name}")
+            write_function = by_type.get(elem.__class__)
+            if write_function is None:
+                write_function = self._find_write_function(by_type, self._COLLECTABLE_METHODS, elem)
+                if write_function is None:
+                    raise NotImplementedError(
+                        f"Package: Found no writer for {elem.__class__.__name__}")
+            write_function(self, elem)
+            self._flush()
         self._leave_child()
 
     def _write_sub_packages(self, package: ar_element.Package) -> None:
@@ -432,7 +730,7 @@ class Writer(_XMLWriter):
         assert isinstance(elem, ar_element.Annotation)
         tag = 'ANNOTATION'
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
             self._write_general_annotation(elem)
@@ -449,17 +747,16 @@ class Writer(_XMLWriter):
                 self._write_annotation(elem)
                 self._leave_child()
         else:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
 
     def _write_break(self, elem: ar_element.Break, inline=True) -> None:
         """
         Writes AR:BR
         Type: Concrete
         """
-        assert isinstance(elem, ar_element.Break)
         self._add_content('BR', '', inline=inline)
 
-    def _write_documentation_block(self, elem: ar_element.DocumentationBlock, tag: str):
+    def _write_documentation_block(self, elem: ar_element.DocumentationBlock, tag: str) -> None:
         """
         Writes AR:DOCUMENTATION-BLOCK
         Type: Concrete
@@ -467,25 +764,31 @@ class Writer(_XMLWriter):
         """
         assert isinstance(elem, ar_element.DocumentationBlock)
         if not elem.elements:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
+            write_paragraph = self._write_multi_language_paragraph
+            write_verbatim = self._write_multi_language_verbatim
             for child_elem in elem.elements:
-                if isinstance(child_elem, ar_element.MultiLanguageParagraph):
-                    self._write_multi_language_paragraph(child_elem)
+                child_type = child_elem.__class__
+                if child_type is ar_element.MultiLanguageParagraph:
+                    write_paragraph(child_elem)
+                elif child_type is ar_element.MultiLanguageVerbatim:
+                    write_verbatim(child_elem)
+                elif isinstance(child_elem, ar_element.MultiLanguageParagraph):
+                    write_paragraph(child_elem)
                 elif isinstance(child_elem, ar_element.MultiLanguageVerbatim):
-                    self._write_multi_language_verbatim(child_elem)
+                    write_verbatim(child_elem)
                 else:
                     raise NotImplementedError(str(type(child_elem)))
             self._leave_child()
 
-    def _write_emphasis_text(self, elem: ar_element.EmphasisText, inline=True):
+    def _write_emphasis_text(self, elem: ar_element.EmphasisText, inline: bool = True) -> None:
         """
         Writes AR:EMPHASIS-TEXT
         Type: Concrete
         TagName: E
         """
-        assert isinstance(elem, ar_element.EmphasisText)
         attr = self._collect_emphasis_text_attributes(elem)
         if len(elem.elements) == 1 and isinstance(elem.elements[0], str):
             self._add_content('E', elem.elements[0], attr, inline=inline)
@@ -498,33 +801,33 @@ class Writer(_XMLWriter):
         if elem.color is not None:
             attr.append(('COLOR', elem.color))
         if elem.font is not None:
-            attr.append(('FONT', ar_enum.enum_to_xml(elem.font)))
+            attr.append(('FONT', self._enum_to_xml(elem.font)))
         if elem.type is not None:
-            attr.append(('TYPE', ar_enum.enum_to_xml(elem.type)))
-        if len(attr) > 0:
+            attr.append(('TYPE', self._enum_to_xml(elem.type)))
+        if attr:
             return attr
         return None
 
-    def _write_index_entry(self, elem: ar_element.IndexEntry, inline=True):
+    def _write_index_entry(self, elem: ar_element.IndexEntry, inline: bool = True) -> None:
         """
         Writes IndexEntry (AR:INDEX-ENTRY)
         Type: Concrete
         """
-        assert isinstance(elem, ar_element.IndexEntry)
         self._add_content('IE', elem.text, inline=inline)
 
-    def _write_technical_term(self, elem: ar_element.TechnicalTerm, inline=True):
+    def _write_technical_term(self, elem: ar_element.TechnicalTerm, inline: bool = True) -> None:
         """
         Writes AR:TT
         Type: Concrete
         TagName: TT
         """
-        assert isinstance(elem, ar_element.TechnicalTerm)
-        attr: TupleList = []
-        self._collect_technical_term_attributes(elem, attr)
+        attr: None | TupleList = None
+        if elem.tex_render is not None or elem.type is not None:
+            attr = []
+            self._collect_technical_term_attributes(elem, attr)
         self._add_content('TT', elem.text, attr, inline)
 
-    def _collect_technical_term_attributes(self, elem: ar_element.TechnicalTerm, attr: TupleList):
+    def _collect_technical_term_attributes(self, elem: ar_element.TechnicalTerm, attr: TupleList) -> None:
         """
         Collects attributes from attributeGroup AR:TT
         """
@@ -533,20 +836,18 @@ class Writer(_XMLWriter):
         if elem.type is not None:
             attr.append(('TYPE', elem.type))
 
-    def _write_superscript(self, elem: ar_element.Superscript, inline=True):
+    def _write_superscript(self, elem: ar_element.Superscript, inline: bool = True) -> None:
         """
         Writes Superscript (AR:SUPSCRIPT)
         Type: Concrete
         """
-        assert isinstance(elem, ar_element.Superscript)
         self._add_content('SUP', elem.text, inline=inline)
 
-    def _write_subscript(self, elem: ar_element.Subscript, inline=True):
+    def _write_subscript(self, elem: ar_element.Subscript, inline: bool = True) -> None:
         """
         Writes Subscript (AR:SUPSCRIPT)
         Type: Concrete
         """
-        assert isinstance(elem, ar_element.Subscript)
         self._add_content('SUB', elem.text, inline=inline)
 
     def _write_multi_language_long_name(self, elem: ar_element.MultilanguageLongName, tag: str) -> None:
@@ -561,38 +862,39 @@ class Writer(_XMLWriter):
             self._write_language_long_name(child_elem)
         self._leave_child()
 
-    def _write_language_long_name(self, elem: ar_element.LanguageLongName):
+    def _write_language_long_name(self, elem: ar_element.LanguageLongName) -> None:
         """
         Writes complexType AR:L-LONG-NAME
         Type: Concrete
         """
-        assert isinstance(elem, ar_element.LanguageLongName)
-        attr: TupleList = []
+        attr = self._scratch_attr
+        attr.clear()
         self._collect_language_specific_attr(elem, attr)
         tag = 'L-4'
         self._begin_line(tag, attr)
-        for part in elem.parts:
-            if isinstance(part, str):
-                self._add_inline_text(part)
-            elif isinstance(part, ar_element.EmphasisText):
-                self._write_emphasis_text(part, inline=True)
-            elif isinstance(part, ar_element.IndexEntry):
-                self._write_index_entry(part, inline=True)
-            elif isinstance(part, ar_element.Subscript):
-                self._write_subscript(part, inline=True)
-            elif isinstance(part, ar_element.Superscript):
-                self._write_superscript(part, inline=True)
-            elif isinstance(part, ar_element.TechnicalTerm):
-                self._write_technical_term(part, inline=True)
-            else:
-                raise TypeError('Unsupported type: ' + str(type(part)))
+        self._write_inline_parts(elem.parts, self._long_name_part_writers)
         self._end_line(tag)
 
+    def _write_inline_parts(self, parts: list | None, part_writers: dict[type, Callable]) -> None:
+        """
+        Writes mixed inline content using the given type-keyed table of part writer functions
+        """
+        for part in parts or ():
+            write_function = part_writers.get(part.__class__)
+            if write_function is None:
+                # Subclasses of supported types are resolved in table order
+                for part_type, write_function in part_writers.items():
+                    if isinstance(part, part_type):
+                        break
+                else:
+                    raise TypeError('Unsupported type: ' + str(type(part)))
+            write_function(self, part)
+
     def _collect_language_specific_attr(self, elem: ar_element.LanguageSpecific, attr: TupleList) -> None:
         """
         Collects attributes from attributeGroup AR:LANGUAGE-SPECIFIC
         """
-        attr.append(('L', ar_enum.enum_to_xml(elem.language))
+        attr.append(('L', self._enum_to_xml(elem.language))
                     )  # The L attribute is mandatory
 
     def _write_multi_language_overview_paragraph(self, elem: MultiLanguageOverviewParagraph, tag: str) -> None:
@@ -616,29 +918,30 @@ class Writer(_XMLWriter):
         Tag variants: 'VERBATIM'
         """
         assert isinstance(elem, ar_element.MultiLanguageVerbatim)
-        attr: TupleList = []
+        attr = self._scratch_attr
+        attr.clear()
         self._collect_document_view_selectable_attributes(elem, attr)
         self._collect_paginateable_attributes(elem, attr)
         self._collect_multi_language_verbatim_attributes(elem, attr)
         self._add_child('VERBATIM', attr)
-        for child_elem in elem.elements:
+        for child_elem in elem.elements or ():
             self._write_language_verbatim(child_elem)
         self._leave_child()
 
     def _collect_multi_language_verbatim_attributes(self,
                                                     elem: ar_element.MultiLanguageVerbatim,
-                                                    attr: TupleList):
+                                                    attr: TupleList) -> None:
         """
         Collects attributes from attributeGroup AR:MULTI-LANGUAGE-VERBATIM
         """
         if elem.allow_break is not None:
             attr.append(('ALLOW-BREAK', elem.allow_break))
         if elem.float is not None:
-            attr.append(('FLOAT', ar_enum.enum_to_xml(elem.float)))
+            attr.append(('FLOAT', self._enum_to_xml(elem.float)))
         if elem.help_entry is not None:
             attr.append(('HELP-ENTRY', elem.help_entry))
         if elem.page_wide is not None:
-            attr.append(('PGWIDE', ar_enum.enum_to_xml(elem.page_wide)))
+            attr.append(('PGWIDE', self._enum_to_xml(elem.page_wide)))
 
     def _write_language_overview_paragraph(self, elem: ar_element.LanguageOverviewParagraph) -> None:
         """
@@ -646,28 +949,12 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'L-2'
         """
-        assert isinstance(elem, ar_element.LanguageOverviewParagraph)
-        attr: TupleList = []
+        attr = self._scratch_attr
+        attr.clear()
         self._collect_language_specific_attr(elem, attr)
         tag = 'L-2'
         self._begin_line(tag, attr)
-        for part in elem.parts:
-            if isinstance(part, str):
-                self._add_inline_text(part)
-            elif isinstance(part, ar_element.Break):
-                self._write_break(part, inline=True)
-            elif isinstance(part, ar_element.EmphasisText):
-                self._write_emphasis_text(part, inline=True)
-            elif isinstance(part, ar_element.IndexEntry):
-                self._write_index_entry(part, inline=True)
-            elif isinstance(part, ar_element.Subscript):
-                self._write_subscript(part, inline=True)
-            elif isinstance(part, ar_element.Superscript):
-                self._write_superscript(part, inline=True)
-            elif isinstance(part, ar_element.TechnicalTerm):
-                self._write_technical_term(part, inline=True)
-            else:
-                raise TypeError('Unsupported type: ' + str(type(part)))
+        self._write_inline_parts(elem.parts, self._paragraph_part_writers)
         self._end_line(tag)
 
     def _write_language_paragraph(self, elem: ar_element.LanguageParagraph) -> None:
@@ -676,28 +963,12 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'L-1'
         """
-        assert isinstance(elem, ar_element.LanguageParagraph)
-        attr: TupleList = []
+        attr = self._scratch_attr
+        attr.clear()
         self._collect_language_specific_attr(elem, attr)
         tag = 'L-1'
         self._begin_line(tag, attr)
-        for part in elem.parts:
-            if isinstance(part, str):
-                self._add_inline_text(part)
-            elif isinstance(part, ar_element.Break):
-                self._write_break(part, inline=True)
-            elif isinstance(part, ar_element.EmphasisText):
-                self._write_emphasis_text(part, inline=True)
-            elif isinstance(part, ar_element.IndexEntry):
-                self._write_index_entry(part, inline=True)
-            elif isinstance(part, ar_element.Subscript):
-                self._write_subscript(part, inline=True)
-            elif isinstance(part, ar_element.Superscript):
-                self._write_superscript(part, inline=True)
-            elif isinstance(part, ar_element.TechnicalTerm):
-                self._write_technical_term(part, inline=True)
-            else:
-                raise TypeError('Unsupported type: ' + str(type(part)))
+        self._write_inline_parts(elem.parts, self._paragraph_part_writers)
         self._end_line(tag)
 
     def _write_language_verbatim(self, elem: ar_element.LanguageVerbatim) -> None:
@@ -706,22 +977,12 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'L-5'
         """
-        assert isinstance(elem, ar_element.LanguageVerbatim)
-        attr: TupleList = []
+        attr = self._scratch_attr
+        attr.clear()
         self._collect_language_specific_attr(elem, attr)
         tag = 'L-5'
         self._begin_line(tag, attr)
-        for part in elem.parts:
-            if isinstance(part, str):
-                self._add_inline_text(part)
-            elif isinstance(part, ar_element.Break):
-                self._write_break(part, inline=True)
-            elif isinstance(part, ar_element.EmphasisText):
-                self._write_emphasis_text(part, inline=True)
-            elif isinstance(part, ar_element.TechnicalTerm):
-                self._write_technical_term(part, inline=True)
-            else:
-                raise TypeError('Unsupported type: ' + str(type(part)))
+        self._write_inline_parts(elem.parts, self._verbatim_part_writers)
         self._end_line(tag)
 
     def _write_multi_language_paragraph(self, elem: ar_element.MultiLanguageParagraph) -> None:
@@ -731,7 +992,8 @@ class Writer(_XMLWriter):
         Tag variants: 'P'
         """
         assert isinstance(elem, ar_element.MultiLanguageParagraph)
-        attr: TupleList = []
+        attr = self._scratch_attr
+        attr.clear()
         self._collect_document_view_selectable_attributes(elem, attr)
         self._collect_paginateable_attributes(elem, attr)
         self._collect_multi_language_paragraph_attributes(elem, attr)
@@ -742,7 +1004,7 @@ class Writer(_XMLWriter):
 
     def _collect_multi_language_paragraph_attributes(self,
                                                      elem: ar_element.MultiLanguageParagraph,
-                                                     attr: TupleList):
+                                                     attr: TupleList) -> None:
         """
         Collects attributes from attributeGroup AR:MULTI-LANGUAGE-PARAGRAPH
         """
@@ -751,7 +1013,7 @@ class Writer(_XMLWriter):
 
     def _collect_document_view_selectable_attributes(self,
                                                      elem: ar_element.DocumentViewSelectable,
-                                                     attr: TupleList):
+                                                     attr: TupleList) -> None:
         """
         Collects attributes from attributeGroup AR:DOCUMENT-VIEW-SELECTABLE
         """
@@ -762,15 +1024,15 @@ class Writer(_XMLWriter):
 
     def _collect_paginateable_attributes(self,
                                          elem: ar_element.Paginateable,
-                                         attr: TupleList):
+                                         attr: TupleList) -> None:
         """
         Collects attributes from attributeGroup AR:PAGINATEABLE
         """
         if elem.page_break is not None:
-            attr.append(('BREAK', ar_enum.enum_to_xml(elem.page_break)))
+            attr.append(('BREAK', self._enum_to_xml(elem.page_break)))
         if elem.keep_with_previous is not None:
             attr.append(
-                ('KEEP-WITH-PREVIOUS', ar_enum.enum_to_xml(elem.keep_with_previous)))
+                ('KEEP-WITH-PREVIOUS', self._enum_to_xml(elem.keep_with_previous)))
 
     def _write_general_annotation(self, elem: ar_element.GeneralAnnotation) -> None:
         """
@@ -779,7 +1041,7 @@ class Writer(_XMLWriter):
         if elem.label is not None:
             self._write_multi_language_long_name(elem.label, 'LABEL')
         if elem.origin is not None:
-            self._add_content('ANNOTATION-ORIGIN', str(elem.origin))
+            self._add_text_tag('ANNOTATION-ORIGIN', str(elem.origin))
         if elem.text is not None:
             self._write_documentation_block(elem.text, 'ANNOTATION-TEXT')
 
@@ -791,15 +1053,7 @@ class Writer(_XMLWriter):
         """
         assert isinstance(elem, ar_element.SingleLanguageUnitNames)
         self._begin_line(tag)
-        for part in elem.parts:
-            if isinstance(part, str):
-                self._add_inline_text(part)
-            elif isinstance(part, ar_element.Subscript):
-                self._write_subscript(part)
-            elif isinstance(part, ar_element.Superscript):
-                self._write_superscript(part)
-            else:
-                raise TypeError('Unsupported type: ' + str(type(part)))
+        self._write_inline_parts(elem.parts, self._unit_names_part_writers)
         self._end_line(tag)
 
     # CompuMethod elements
@@ -810,13 +1064,9 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tab variants: 'COMPU-METHOD'
         """
-        assert isinstance(elem, ar_element.CompuMethod)
-        attr: TupleList = []
-        self._collect_identifiable_attributes(elem, attr)
+        attr = self._identifiable_attributes(elem)
         self._add_child("COMPU-METHOD", attr)
-        self._write_referrable(elem)
-        self._write_multilanguage_referrable(elem)
-        self._write_identifiable(elem)
+        self._write_identifiable_header(elem)
         self._write_compu_method_group(elem)
         self._leave_child()
 
@@ -825,7 +1075,7 @@ class Writer(_XMLWriter):
         Writes group AR:COMPU-METHOD
         """
         if elem.display_format is not None:
-            self._add_content("DISPLAY-FORMAT", str(elem.display_format))
+            self._add_text_tag("DISPLAY-FORMAT", str(elem.display_format))
         if elem.unit_ref is not None:
             self._write_unit_ref(elem.unit_ref)
         if elem.int_to_phys is not None:
@@ -842,8 +1092,9 @@ class Writer(_XMLWriter):
         self._add_child(tag)
         if elem.compu_scales is not None:
             self._add_child("COMPU-SCALES")
+            write_compu_scale = self._write_compu_scale
             for compu_scale in elem.compu_scales:
-                self._write_compu_scale(compu_scale)
+                write_compu_scale(compu_scale)
             self._leave_child()
         if elem.default_value is not None:
             self._write_compu_const(elem.default_value, "COMPU-DEFAULT-VALUE")
@@ -855,31 +1106,31 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'COMPU-SCALE'
         """
-        assert isinstance(elem, ar_element.CompuScale)
         tag = "COMPU-SCALE"
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
             return
         self._add_child(tag)
         if elem.label is not None:
-            self._add_content("SHORT-LABEL", str(elem.label))
+            self._add_text_tag("SHORT-LABEL", str(elem.label))
         if elem.symbol is not None:
-            self._add_content("SYMBOL", str(elem.symbol))
+            self._add_text_tag("SYMBOL", str(elem.symbol))
         if elem.desc is not None:
             self._write_multi_language_overview_paragraph(elem.desc, "DESC")
         if elem.mask is not None:
-            self._add_content("MASK", int(elem.mask))
+            self._add_int_tag("MASK", elem.mask)
         if elem.lower_limit is not None:
             self._write_limit("LOWER-LIMIT", elem.lower_limit, elem.lower_limit_type)
         if elem.upper_limit is not None:
             self._write_limit("UPPER-LIMIT", elem.upper_limit, elem.upper_limit_type)
         if elem.inverse_value is not None:
             self._write_compu_const(elem.inverse_value, "COMPU-INVERSE-VALUE")
-        if elem.content is not None:
-            if isinstance(elem.content, ar_element.CompuConst):
-                self._write_compu_const(elem.content, "COMPU-CONST")
-            elif isinstance(elem.content, ar_element.CompuRational):
-                self._write_compu_rational(elem.content)
+        content = elem.content
+        if content is not None:
+            if isinstance(content, ar_element.CompuConst):
+                self._write_compu_const(content, "COMPU-CONST")
+            elif isinstance(content, ar_element.CompuRational):
+                self._write_compu_rational(content)
         self._leave_child()
 
     def _write_limit(self,
@@ -888,7 +1139,9 @@ class Writer(_XMLWriter):
                      limit_type: ar_enum.IntervalType):
         assert limit is not None
         assert limit_type is not None
-        attr: TupleList = [("INTERVAL-TYPE", ar_enum.enum_to_xml(limit_type))]
+        attr = self._scratch_attr
+        attr.clear()
+        attr.append(("INTERVAL-TYPE", self._enum_to_xml(limit_type)))
         if isinstance(limit, float):
             text = self._format_float(limit)
         elif isinstance(limit, int):
@@ -903,16 +1156,17 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'COMPU-CONST', 'COMPU-INVERSE-VALUE', 'COMPU-DEFAULT-VALUE'
         """
-        assert isinstance(elem, ar_element.CompuConst)
+        value = elem.value
+        write_value = self._COMPU_CONST_VALUE_WRITERS.get(value.__class__)
+        if write_value is None:
+            # Subclasses (e.g. bool) are resolved in table order
+            for value_type, write_value in self._COMPU_CONST_VALUE_WRITERS.items():
+                if isinstance(value, value_type):
+                    break
+            else:
+                raise TypeError(f"Unsupported type: {str(type(value))}")
         self._add_child(tag)
-        if isinstance(elem.value, str):
-            self._add_content("VT", elem.value)
-        elif isinstance(elem.value, float):
-            self._add_content("V", self._format_float(elem.value))
-        elif isinstance(elem.value, int):
-            self._add_content("V", elem.value)
-        else:
-            raise TypeError(f"Unsupported type: {str(type(elem.value))}")
+        write_value(self, value)
         self._leave_child()
 
     def _write_compu_rational(self, elem: ar_element.CompuRational) -> None:
@@ -921,10 +1175,9 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'COMPU-RATIONAL-COEFFS'
         """
-        assert isinstance(elem, ar_element.CompuRational)
         tag = 'COMPU-RATIONAL-COEFFS'
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
             if elem.numerator is not None:
@@ -937,20 +1190,14 @@ class Writer(_XMLWriter):
                 self._leave_child()
             self._leave_child()
 
-    def _write_numerator_denominator_values(self, value: int | float | tuple):
-        if isinstance(value, tuple):
-            for inner_value in value:
-                if isinstance(inner_value, float):
-                    content = self._format_float(inner_value)
-                else:
-                    content = str(inner_value)
-                self._add_content('V', content)
-        else:
-            if isinstance(value, float):
-                content = self._format_float(value)
-            else:
-                content = str(value)
-            self._add_content('V', content)
+    def _write_numerator_denominator_values(self, value: int | float | tuple) -> None:
+        add_text_tag = self._add_text_tag
+        format_float = self._format_float
+        if value.__class__ is not tuple and not isinstance(value, tuple):
+            value = (value,)
+        for inner_value in value:
+            # isinstance rather than an exact type check so that float subclasses (e.g. numpy.float64) are formatted
+            add_text_tag('V', format_float(inner_value) if isinstance(inner_value, float) else str(inner_value))
 
     # Constraint elements
 
@@ -960,13 +1207,9 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tab variants: 'DATA-CONSTR-RULE'
         """
-        assert isinstance(elem, ar_element.DataConstraint)
-        attr: TupleList = []
-        self._collect_identifiable_attributes(elem, attr)
+        attr = self._identifiable_attributes(elem)
         self._add_child("DATA-CONSTR", attr)
-        self._write_referrable(elem)
-        self._write_multilanguage_referrable(elem)
-        self._write_identifiable(elem)
+        self._write_identifiable_header(elem)
         self._write_data_constraint_group(elem)
         self._leave_child()
 
@@ -977,8 +1220,9 @@ class Writer(_XMLWriter):
         """
         if elem.rules:
             self._add_child("DATA-CONSTR-RULES")
+            write_rule = self._write_data_constraint_rule
             for rule in elem.rules:
-                self._write_data_constraint_rule(rule)
+                write_rule(rule)
             self._leave_child()
 
     def _write_data_constraint_rule(self, elem: ar_element.DataConstraintRule) -> None:
@@ -990,11 +1234,11 @@ class Writer(_XMLWriter):
         tag = "DATA-CONSTR-RULE"
         assert isinstance(elem, ar_element.DataConstraintRule)
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
             return
         self._add_child(tag)
         if elem.level is not None:
-            self._add_content("CONSTR-LEVEL", str(elem.level))
+            self._add_text_tag("CONSTR-LEVEL", str(elem.level))
         if elem.physical is not None:
             self._write_physical_constraint(elem.physical)
         if elem.internal is not None:
@@ -1010,7 +1254,7 @@ class Writer(_XMLWriter):
         tag = "INTERNAL-CONSTRS"
         assert isinstance(elem, ar_element.InternalConstraint)
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
             return
         self._add_child(tag)
         self._write_constraint_base(elem)
@@ -1025,7 +1269,7 @@ class Writer(_XMLWriter):
         tag = "PHYS-CONSTRS"
         assert isinstance(elem, ar_element.PhysicalConstraint)
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
             return
         self._add_child(tag)
         self._write_constraint_base(elem)
@@ -1045,15 +1289,16 @@ class Writer(_XMLWriter):
             self._write_limit("UPPER-LIMIT", elem.upper_limit, elem.upper_limit_type)
         if elem.scale_constrs:
             self._add_child("SCALE-CONSTRS")
+            write_scale_constraint = self._write_scale_constraint
             for scale_constr in elem.scale_constrs:
-                self._write_scale_constraint(scale_constr)
+                write_scale_constraint(scale_constr)
             self._leave_child()
         if elem.max_gradient is not None:
-            self._add_content("MAX-GRADIENT", self._format_number(elem.max_gradient))
+            self._add_text_tag("MAX-GRADIENT", self._format_number(elem.max_gradient))
         if elem.max_diff is not None:
-            self._add_content("MAX-DIFF", self._format_number(elem.max_diff))
+            self._add_text_tag("MAX-DIFF", self._format_number(elem.max_diff))
         if elem.monotony is not None:
-            self._add_content("MONOTONY", ar_enum.enum_to_xml(elem.monotony))
+            self._add_text_tag("MONOTONY", self._enum_to_xml(elem.monotony))
 
     def _write_scale_constraint(self, elem: ar_element.ScaleConstraint) -> None:
         """
@@ -1062,16 +1307,16 @@ class Writer(_XMLWriter):
         Tag variants: 'SCALE-CONSTR'
         """
         tag = "SCALE-CONSTR"
-        assert isinstance(elem, ar_element.ScaleConstraint)
-        attr: TupleList = []
+        attr = self._scratch_attr
+        attr.clear()
         if elem.validity is not None:
-            attr.append(("VALIDITY", ar_enum.enum_to_xml(elem.validity)))
+            attr.append(("VALIDITY", self._enum_to_xml(elem.validity)))
         if elem.is_empty:
             self._add_content(tag, attr=attr)
             return
         self._add_child(tag, attr)
         if elem.label is not None:
-            self._add_content("SHORT-LABEL", elem.label)
+            self._add_text_tag("SHORT-LABEL", elem.label)
         if elem.desc is not None:
             self._write_multi_language_overview_paragraph(elem.desc, "DESC")
         if elem.lower_limit is not None:
@@ -1088,13 +1333,9 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'UNIT'
         """
-        assert isinstance(elem, ar_element.Unit)
-        attr: TupleList = []
-        self._collect_identifiable_attributes(elem, attr)
+        attr = self._identifiable_attributes(elem)
         self._add_child('UNIT', attr)
-        self._write_referrable(elem)
-        self._write_multilanguage_referrable(elem)
-        self._write_identifiable(elem)
+        self._write_identifiable_header(elem)
         self._write_unit_group(elem)
         self._leave_child()
 
@@ -1102,9 +1343,9 @@ class Writer(_XMLWriter):
         if elem.display_name is not None:
             self._write_single_language_unit_names(elem.display_name, "DISPLAY-NAME")
         if elem.factor is not None:
-            self._add_content("FACTOR-SI-TO-UNIT", self._format_float(elem.factor))
+            self._add_text_tag("FACTOR-SI-TO-UNIT", self._format_float(elem.factor))
         if elem.offset is not None:
-            self._add_content("OFFSET-SI-TO-UNIT", self._format_float(elem.offset))
+            self._add_text_tag("OFFSET-SI-TO-UNIT", self._format_float(elem.offset))
         if elem.physical_dimension_ref is not None:
             self._write_physical_dimension_ref(elem.physical_dimension_ref)
 
@@ -1116,13 +1357,9 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'SW-ADDR-METHOD'
         """
-        assert isinstance(elem, ar_element.SwAddrMethod)
-        attr: TupleList = []
-        self._collect_identifiable_attributes(elem, attr)
+        attr = self._identifiable_attributes(elem)
         self._add_child('SW-ADDR-METHOD', attr)
-        self._write_referrable(elem)
-        self._write_multilanguage_referrable(elem)
-        self._write_identifiable(elem)
+        self._write_identifiable_header(elem)
         self._write_sw_addr_method_group(elem)
         self._leave_child()
 
@@ -1145,13 +1382,9 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'SW-BASE-TYPE'
         """
-        assert isinstance(elem, ar_element.SwBaseType)
-        attr: TupleList = []
-        self._collect_identifiable_attributes(elem, attr)
+        attr = self._identifiable_attributes(elem)
         self._add_child('SW-BASE-TYPE', attr)
-        self._write_referrable(elem)
-        self._write_multilanguage_referrable(elem)
-        self._write_identifiable(elem)
+        self._write_identifiable_header(elem)
         self._write_base_type(elem)
         self._leave_child()
 
@@ -1160,19 +1393,19 @@ class Writer(_XMLWriter):
         Writes groups AR:BASE-TYPE and AR:BASE-TYPE-DIRECT-DEFINITION
         """
         if elem.size is not None:
-            self._add_content('BASE-TYPE-SIZE', int(elem.size))
+            self._add_int_tag('BASE-TYPE-SIZE', elem.size)
         if elem.max_size is not None:
-            self._add_content('MAX-BASE-TYPE-SIZE', int(elem.max_size))
+            self._add_int_tag('MAX-BASE-TYPE-SIZE', elem.max_size)
         if elem.encoding is not None:
-            self._add_content('BASE-TYPE-ENCODING', str(elem.encoding))
+            self._add_text_tag('BASE-TYPE-ENCODING', str(elem.encoding))
         if elem.alignment is not None:
-            self._add_content('MEM-ALIGNMENT', int(elem.alignment))
+            self._add_int_tag('MEM-ALIGNMENT', elem.alignment)
         if elem.byte_order is not None:
-            self._add_content(
-                'BYTE-ORDER', ar_enum.enum_to_xml(elem.byte_order))
+            self._add_text_tag(
+                'BYTE-ORDER', self._enum_to_xml(elem.byte_order))
         if elem.native_declaration is not None:
-            self._add_content('NATIVE-DECLARATION',
-                              str(elem.native_declaration))
+            self._add_text_tag('NATIVE-DECLARATION',
+                               str(elem.native_declaration))
 
     def _write_sw_data_def_props(self, elem: ar_element.SwDataDefProps, tag: str) -> None:
         """
@@ -1180,15 +1413,15 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag Variants: 'SW-DATA-DEF-PROPS', 'NETWORK-REPRESENTATION'
         """
-        assert isinstance(elem, ar_element.SwDataDefProps)
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
-            if len(elem) > 0:
+            if elem:
                 self._add_child("SW-DATA-DEF-PROPS-VARIANTS")
+                write_conditional = self._write_sw_data_def_props_conditional
                 for child_elem in iter(elem):
-                    self._write_sw_data_def_props_conditional(child_elem)
+                    write_conditional(child_elem)
                 self._leave_child()
             self._leave_child()
 
@@ -1198,10 +1431,9 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'SW-DATA-DEF-PROPS-CONDITIONAL'
         """
-        assert isinstance(elem, ar_element.SwDataDefPropsConditional)
         tag = 'SW-DATA-DEF-PROPS-CONDITIONAL'
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
             self._write_sw_data_def_props_content(elem)
@@ -1212,47 +1444,49 @@ class Writer(_XMLWriter):
         Writes Group SW-DATA-DEF-PROPS-CONTENT
         Type: Abstract
         """
+        add_text_tag = self._add_text_tag
+        enum_to_xml = self._enum_to_xml
         if elem.display_presentation is not None:
-            self._add_content('DISPLAY-PRESENTATION',
-                              ar_enum.enum_to_xml(elem.display_presentation))
+            add_text_tag('DISPLAY-PRESENTATION',
+                         enum_to_xml(elem.display_presentation))
         if elem.step_size is not None:
-            self._add_content('STEP-SIZE', self._format_float(elem.step_size))
+            add_text_tag('STEP-SIZE', self._format_float(elem.step_size))
         if elem.annotations:
             self._write_annotations(elem.annotations)
         if elem.sw_addr_method_ref is not None:
             self._write_sw_addr_method_ref(elem.sw_addr_method_ref)
         if elem.alignment is not None:
-            self._add_content('SW-ALIGNMENT', elem.alignment)
+            add_text_tag('SW-ALIGNMENT', elem.alignment)
         if elem.base_type_ref is not None:
             self._write_sw_base_type_ref(elem.base_type_ref)
         if elem.bit_representation is not None:
             self._write_sw_bit_represenation(elem.bit_representation)
         if elem.calibration_access is not None:
-            self._add_content('SW-CALIBRATION-ACCESS',
-                              ar_enum.enum_to_xml(elem.calibration_access))
+            add_text_tag('SW-CALIBRATION-ACCESS',
+                         enum_to_xml(elem.calibration_access))
         if elem.text_props is not None:
             self._write_sw_text_props(elem.text_props)
         if elem.compu_method_ref is not None:
             self._write_compu_method_ref(elem.compu_method_ref)
         if elem.display_format is not None:
-            self._add_content('DISPLAY-FORMAT', elem.display_format)
+            add_text_tag('DISPLAY-FORMAT', elem.display_format)
         if elem.data_constraint_ref is not None:
             self._write_data_constraint_ref(elem.data_constraint_ref)
         if elem.impl_data_type_ref is not None:
             self._write_impl_data_type_ref(elem.impl_data_type_ref)
         if elem.impl_policy is not None:
-            self._add_content('SW-IMPL-POLICY',
-                              ar_enum.enum_to_xml(elem.impl_policy))
+            add_text_tag('SW-IMPL-POLICY',
+                         enum_to_xml(elem.impl_policy))
         if elem.additional_native_type_qualifier is not None:
-            self._add_content('ADDITIONAL-NATIVE-TYPE-QUALIFIER',
-                              str(elem.additional_native_type_qualifier))
+            add_text_tag('ADDITIONAL-NATIVE-TYPE-QUALIFIER',
+                         str(elem.additional_native_type_qualifier))
         if elem.intended_resolution is not None:
-            self._add_content('SW-INTENDED-RESOLUTION',
-                              self._format_number(elem.intended_resolution))
+            add_text_tag('SW-INTENDED-RESOLUTION',
+                         self._format_number(elem.intended_resolution))
         if elem.interpolation_method is not None:
-            self._add_content('SW-INTERPOLATION-METHOD', str(elem.interpolation_method))
+            add_text_tag('SW-INTERPOLATION-METHOD', str(elem.interpolation_method))
         if elem.is_virtual is not None:
-            self._add_content('SW-IS-VIRTUAL', self._format_boolean(elem.is_virtual))
+            add_text_tag('SW-IS-VIRTUAL', self._format_boolean(elem.is_virtual))
         if elem.ptr_target_props is not None:
             self._write_sw_pointer_target_props(elem.ptr_target_props)
         if elem.unit_ref is not None:
@@ -1266,13 +1500,13 @@ class Writer(_XMLWriter):
         """
         tag = 'SW-BIT-REPRESENTATION'
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
             if elem.position is not None:
-                self._add_content('BIT-POSITION', str(elem.position))
+                self._add_text_tag('BIT-POSITION', str(elem.position))
             if elem.num_bits is not None:
-                self._add_content('NUMBER-OF-BITS', str(elem.num_bits))
+                self._add_text_tag('NUMBER-OF-BITS', str(elem.num_bits))
             self._leave_child()
 
     def _write_sw_text_props(self, elem: ar_element.SwTextProps) -> None:
@@ -1283,17 +1517,17 @@ class Writer(_XMLWriter):
         """
         tag = 'SW-TEXT-PROPS'
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
             if elem.array_size_semantics is not None:
-                self._add_content('ARRAY-SIZE-SEMANTICS', ar_enum.enum_to_xml(elem.array_size_semantics))
+                self._add_text_tag('ARRAY-SIZE-SEMANTICS', self._enum_to_xml(elem.array_size_semantics))
             if elem.max_text_size is not None:
-                self._add_content('SW-MAX-TEXT-SIZE', int(elem.max_text_size))
+                self._add_int_tag('SW-MAX-TEXT-SIZE', elem.max_text_size)
             if elem.base_type_ref is not None:
                 self._write_sw_base_type_ref(elem.base_type_ref)
             if elem.fill_char is not None:
-                self._add_content('SW-FILL-CHARACTER', int(elem.fill_char))
+                self._add_int_tag('SW-FILL-CHARACTER', elem.fill_char)
             self._leave_child()
 
     def _write_sw_pointer_target_props(self, elem: ar_element.SwPointerTargetProps) -> None:
@@ -1304,11 +1538,11 @@ class Writer(_XMLWriter):
         """
         tag = 'SW-POINTER-TARGET-PROPS'
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
             if elem.target_category is not None:
-                self._add_content("TARGET-CATEGORY", str(elem.target_category))
+                self._add_text_tag("TARGET-CATEGORY", str(elem.target_category))
             if elem.sw_data_def_props is not None:
                 self._write_sw_data_def_props(elem.sw_data_def_props, "SW-DATA-DEF-PROPS")
             if elem.function_ptr_signature_ref is not None:
@@ -1333,44 +1567,61 @@ class Writer(_XMLWriter):
         Type: Abstract
         """
         if elem.symbol is not None:
-            self._add_content("SYMBOL", str(elem.symbol))
+            self._add_text_tag("SYMBOL", str(elem.symbol))
 
     def _write_implementation_data_type_element(self, elem: ar_element.ImplementationDataTypeElement) -> None:
         """
         Writes complex type AR:IMPLEMENTATION-DATA-TYPE-ELEMENT
         Type: Concrete
         Tag variants: 'IMPLEMENTATION-DATA-TYPE-ELEMENT'
+
+        Nested sub-elements are written from an explicit stack instead of by recursion.
+        A None entry on the stack marks the point where the SUB-ELEMENTS of the element
+        below it have all been written.
         """
         assert isinstance(elem, ar_element.ImplementationDataTypeElement)
-        self._add_child("IMPLEMENTATION-DATA-TYPE-ELEMENT")
-        self._write_referrable(elem)
-        self._write_multilanguage_referrable(elem)
-        self._write_identifiable(elem)
-        self.__write_implementation_data_type_element_group(elem)
-        self._leave_child()
+        stack: list[ar_element.ImplementationDataTypeElement | None] = [elem]
+        while stack:
+            elem = stack.pop()
+            if elem is None:
+                self._leave_child()  # SUB-ELEMENTS
+                self.__write_implementation_data_type_element_end(stack.pop())
+                continue
+            self._add_child("IMPLEMENTATION-DATA-TYPE-ELEMENT")
+            self._write_identifiable_header(elem)
+            self.__write_implementation_data_type_element_group(elem)
+            if elem.sub_elements:
+                self._add_child("SUB-ELEMENTS")
+                stack.append(elem)
+                stack.append(None)
+                stack.extend(reversed(elem.sub_elements))
+            else:
+                self.__write_implementation_data_type_element_end(elem)
 
     def __write_implementation_data_type_element_group(self, elem: ar_element.ImplementationDataTypeElement) -> None:
         """
-        Writes group AR:IMPLEMENTATION-DATA-TYPE-ELEMENT
+        Writes group AR:IMPLEMENTATION-DATA-TYPE-ELEMENT up to (but not including) SUB-ELEMENTS
         Type: Abstract
         """
         if elem.array_impl_policy is not None:
-            self._add_content("ARRAY-IMPL-POLICY", ar_enum.enum_to_xml(elem.array_impl_policy))
+            self._add_text_tag("ARRAY-IMPL-POLICY", self._enum_to_xml(elem.array_impl_policy))
         if elem.array_size is not None:
-            self._add_content("ARRAY-SIZE", str(elem.array_size))
+            self._add_text_tag("ARRAY-SIZE", str(elem.array_size))
         if elem.array_size_handling is not None:
-            self._add_content("ARRAY-SIZE-HANDLING", ar_enum.enum_to_xml(elem.array_size_handling))
+            self._add_text_tag("ARRAY-SIZE-HANDLING", self._enum_to_xml(elem.array_size_handling))
         if elem.array_size_semantics is not None:
-            self._add_content("ARRAY-SIZE-SEMANTICS", ar_enum.enum_to_xml(elem.array_size_semantics))
+            self._add_text_tag("ARRAY-SIZE-SEMANTICS", self._enum_to_xml(elem.array_size_semantics))
         if elem.is_optional is not None:
-            self._add_content("IS-OPTIONAL", self._format_boolean(elem.is_optional))
-        if len(elem.sub_elements) > 0:
-            self._add_child("SUB-ELEMENTS")
-            for sub_elem in elem.sub_elements:
-                self._write_implementation_data_type_element(sub_elem)
-            self._leave_child()
+            self._add_text_tag("IS-OPTIONAL", self._format_boolean(elem.is_optional))
+
+    def __write_implementation_data_type_element_end(self, elem: ar_element.ImplementationDataTypeElement) -> None:
+        """
+        Writes remainder of group AR:IMPLEMENTATION-DATA-TYPE-ELEMENT following SUB-ELEMENTS
+        and closes the element
+        """
         if elem.sw_data_def_props is not None:
             self._write_sw_data_def_props(elem.sw_data_def_props, "SW-DATA-DEF-PROPS")
+        self._leave_child()
 
     def _write_implementation_data_type(self, elem: ar_element.ImplementationDataType) -> None:
         """
@@ -1380,9 +1631,7 @@ class Writer(_XMLWriter):
         """
         assert isinstance(elem, ar_element.ImplementationDataType)
         self._add_child("IMPLEMENTATION-DATA-TYPE")
-        self._write_referrable(elem)
-        self._write_multilanguage_referrable(elem)
-        self._write_identifiable(elem)
+        self._write_identifiable_header(elem)
         self._write_autosar_data_type(elem)
         self._write_implementation_data_type_group(elem)
         self._leave_child()
@@ -1393,11 +1642,11 @@ class Writer(_XMLWriter):
         Type: Abstract
         """
         if elem.dynamic_array_size_profile is not None:
-            self._add_content("DYNAMIC-ARRAY-SIZE-PROFILE", str(elem.dynamic_array_size_profile))
+            self._add_text_tag("DYNAMIC-ARRAY-SIZE-PROFILE", str(elem.dynamic_array_size_profile))
         if elem.is_struct_with_optional_element is not None:
-            self._add_content("IS-STRUCT-WITH-OPTIONAL-ELEMENT",
-                              self._format_boolean(elem.is_struct_with_optional_element))
-        if len(elem.sub_elements) > 0:
+            self._add_text_tag("IS-STRUCT-WITH-OPTIONAL-ELEMENT",
+                               self._format_boolean(elem.is_struct_with_optional_element))
+        if elem.sub_elements:
             self._add_child("SUB-ELEMENTS")
             for sub_elem in elem.sub_elements:
                 self._write_implementation_data_type_element(sub_elem)
@@ -1405,7 +1654,7 @@ class Writer(_XMLWriter):
         if elem.symbol_props is not None:
             self._write_symbol_props(elem.symbol_props, "SYMBOL-PROPS")
         if elem.type_emitter is not None:
-            self._add_content("TYPE-EMITTER", str(elem.type_emitter))
+            self._add_text_tag("TYPE-EMITTER", str(elem.type_emitter))
 
     def _write_autosar_data_type(self, elem: ar_element.AutosarDataType) -> None:
         """
@@ -1429,11 +1678,8 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'APPLICATION-PRIMITIVE-DATA-TYPE'
         """
-        assert isinstance(elem, ar_element.ApplicationPrimitiveDataType)
         self._add_child("APPLICATION-PRIMITIVE-DATA-TYPE")
-        self._write_referrable(elem)
-        self._write_multilanguage_referrable(elem)
-        self._write_identifiable(elem)
+        self._write_identifiable_header(elem)
         self._write_autosar_data_type(elem)
         self._leave_child()
 
@@ -1444,7 +1690,6 @@ class Writer(_XMLWriter):
         Writes group AR:APPLICATION-COMPOSITE-ELEMENT-DATA-PROTOTYPE
         Type: Abstract
         """
-        assert isinstance(elem, ar_element.ApplicationCompositeElementDataPrototype)
         if elem.type_ref is not None:
             self._write_application_data_type_ref(elem.type_ref, 'TYPE-TREF')
 
@@ -1454,11 +1699,8 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'ELEMENT'
         """
-        assert isinstance(elem, ar_element.ApplicationArrayElement)
         self._add_child("ELEMENT")
-        self._write_referrable(elem)
-        self._write_multilanguage_referrable(elem)
-        self._write_identifiable(elem)
+        self._write_identifiable_header(elem)
         self._write_data_prototype(elem)
         self._write_application_composite_element_data_prototype(elem)
         self._write_application_array_element_group(elem)
@@ -1470,13 +1712,13 @@ class Writer(_XMLWriter):
         Type: Abstract
         """
         if elem.array_size_handling is not None:
-            self._add_content("ARRAY-SIZE-HANDLING", ar_enum.enum_to_xml(elem.array_size_handling))
+            self._add_text_tag("ARRAY-SIZE-HANDLING", self._enum_to_xml(elem.array_size_handling))
         if elem.array_size_semantics is not None:
-            self._add_content("ARRAY-SIZE-SEMANTICS", ar_enum.enum_to_xml(elem.array_size_semantics))
+            self._add_text_tag("ARRAY-SIZE-SEMANTICS", self._enum_to_xml(elem.array_size_semantics))
         if elem.index_data_type_ref is not None:
             self._write_index_data_type_ref(elem.index_data_type_ref)
         if elem.max_number_of_elements is not None:
-            self._add_content("MAX-NUMBER-OF-ELEMENTS", elem.max_number_of_elements)
+            self._add_text_tag("MAX-NUMBER-OF-ELEMENTS", elem.max_number_of_elements)
 
     def _write_application_record_element(self, elem: ar_element.ApplicationRecordElement) -> None:
         """
@@ -1484,11 +1726,8 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'APPLICATION-RECORD-ELEMENT'
         """
-        assert isinstance(elem, ar_element.ApplicationRecordElement)
         self._add_child("APPLICATION-RECORD-ELEMENT")
-        self._write_referrable(elem)
-        self._write_multilanguage_referrable(elem)
-        self._write_identifiable(elem)
+        self._write_identifiable_header(elem)
         self._write_data_prototype(elem)
         self._write_application_composite_element_data_prototype(elem)
         self._write_application_record_element_group(elem)
@@ -1500,7 +1739,7 @@ class Writer(_XMLWriter):
         Type: Abstract
         """
         if elem.is_optional is not None:
-            self._add_content('IS-OPTIONAL', self._format_boolean(elem.is_optional))
+            self._add_text_tag('IS-OPTIONAL', self._format_boolean(elem.is_optional))
 
     def _write_application_array_data_type(self, elem: ar_element.ApplicationArrayDataType) -> None:
         """
@@ -1508,11 +1747,8 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'APPLICATION-ARRAY-DATA-TYPE'
         """
-        assert isinstance(elem, ar_element.ApplicationArrayDataType)
         self._add_child("APPLICATION-ARRAY-DATA-TYPE")
-        self._write_referrable(elem)
-        self._write_multilanguage_referrable(elem)
-        self._write_identifiable(elem)
+        self._write_identifiable_header(elem)
         self._write_autosar_data_type(elem)
         self._write_application_array_data_type_group(elem)
         self._leave_child()
@@ -1523,7 +1759,7 @@ class Writer(_XMLWriter):
         Type: Abstract
         """
         if elem.dynamic_array_size_profile is not None:
-            self._add_content("DYNAMIC-ARRAY-SIZE-PROFILE", str(elem.dynamic_array_size_profile))
+            self._add_text_tag("DYNAMIC-ARRAY-SIZE-PROFILE", str(elem.dynamic_array_size_profile))
         if elem.element is not None:
             self._write_application_array_element(elem.element)
 
@@ -1533,11 +1769,8 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'APPLICATION-RECORD-DATA-TYPE'
         """
-        assert isinstance(elem, ar_element.ApplicationRecordDataType)
         self._add_child("APPLICATION-RECORD-DATA-TYPE")
-        self._write_referrable(elem)
-        self._write_multilanguage_referrable(elem)
-        self._write_identifiable(elem)
+        self._write_identifiable_header(elem)
         self._write_autosar_data_type(elem)
         self._write_application_record_data_type_group(elem)
         self._leave_child()
@@ -1547,10 +1780,11 @@ class Writer(_XMLWriter):
         Writes group AR:APPLICATION-RECORD-DATA-TYPE
         Type: Abstract
         """
-        if len(elem.elements) > 0:
+        if elem.elements:
             self._add_child("ELEMENTS")
+            write_record_element = self._write_application_record_element
             for child_elem in elem.elements:
-                self._write_application_record_element(child_elem)
+                write_record_element(child_elem)
             self._leave_child()
 
     def _write_data_type_map(self, elem: ar_element.DataTypeMap) -> None:
@@ -1559,7 +1793,6 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'DATA-TYPE-MAP'
         """
-        assert isinstance(elem, ar_element.DataTypeMap)
         self._add_child("DATA-TYPE-MAP")
         if elem.appl_data_type_ref is not None:
             self._write_application_data_type_ref(elem.appl_data_type_ref, "APPLICATION-DATA-TYPE-REF")
@@ -1573,17 +1806,14 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'DATA-TYPE-MAPPING-SET'
         """
-        assert isinstance(elem, ar_element.DataTypeMappingSet)
-        attr: TupleList = []
-        self._collect_identifiable_attributes(elem, attr)
+        attr = self._identifiable_attributes(elem)
         self._add_child("DATA-TYPE-MAPPING-SET", attr)
-        self._write_referrable(elem)
-        self._write_multilanguage_referrable(elem)
-        self._write_identifiable(elem)
-        if len(elem.data_type_maps) > 0:
+        self._write_identifiable_header(elem)
+        if elem.data_type_maps:
             self._add_child("DATA-TYPE-MAPS")
+            write_data_type_map = self._write_data_type_map
             for child_elem in elem.data_type_maps:
-                self._write_data_type_map(child_elem)
+                write_data_type_map(child_elem)
             self._leave_child()
         # .MODE-REQUEST-TYPE-MAPS not yet implemented
         self._leave_child()
@@ -1597,7 +1827,7 @@ class Writer(_XMLWriter):
         assert isinstance(elem, ar_element.ValueList)
         tag = "SW-ARRAYSIZE"
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
             self._write_value_list_group(elem)
@@ -1608,17 +1838,11 @@ class Writer(_XMLWriter):
         Writes group AR:VALUE-LIST
         Type: abstract
         """
-        for value in elem.values:
-            content = self._format_number(value)
-            self._add_content("V", content)
+        format_number = self._format_number
+        self._add_number_tags("V", [format_number(value) for value in elem.values])
 
     # Reference Elements
 
-    def _collect_base_ref_attr(self,
-                               elem: ar_element.BaseRef,
-                               attr: TupleList) -> None:
-        attr.append(('DEST', ar_enum.enum_to_xml(elem.dest)))
-
     def _write_compu_method_ref(self, elem: ar_element.CompuMethodRef) -> None:
         """
         Writes complex type AR:COMPU-METHOD-REF
@@ -1628,10 +1852,7 @@ class Writer(_XMLWriter):
         Note: The name of the complex-type is anonymous in the XML schema.
 
         """
-        assert isinstance(elem, ar_element.CompuMethodRef)
-        attr: TupleList = []
-        self._collect_base_ref_attr(elem, attr)
-        self._add_content('COMPU-METHOD-REF', elem.value, attr)
+        self._add_ref_tag('COMPU-METHOD-REF', self._enum_to_xml(elem.dest), elem.value)
 
     def _write_data_constraint_ref(self, elem: ar_element.DataConstraintRef) -> None:
         """
@@ -1642,10 +1863,7 @@ class Writer(_XMLWriter):
         Note: The name of the complex-type is anonymous in the XML schema.
 
         """
-        assert isinstance(elem, ar_element.DataConstraintRef)
-        attr: TupleList = []
-        self._collect_base_ref_attr(elem, attr)
-        self._add_content('DATA-CONSTR-REF', elem.value, attr)
+        self._add_ref_tag('DATA-CONSTR-REF', self._enum_to_xml(elem.dest), elem.value)
 
     def _write_function_ptr_signature_ref(self, elem: ar_element.FunctionPtrSignatureRef) -> None:
         """
@@ -1656,10 +1874,7 @@ class Writer(_XMLWriter):
         Note: The name of the complex-type is anonymous in the XML schema.
 
         """
-        assert isinstance(elem, ar_element.FunctionPtrSignatureRef)
-        attr: TupleList = []
-        self._collect_base_ref_attr(elem, attr)
-        self._add_content('FUNCTION-POINTER-SIGNATURE-REF', elem.value, attr)
+        self._add_ref_tag('FUNCTION-POINTER-SIGNATURE-REF', self._enum_to_xml(elem.dest), elem.value)
 
     def _write_impl_data_type_ref(self, elem: ar_element.ImplementationDataTypeRef) -> None:
         """
@@ -1670,10 +1885,7 @@ class Writer(_XMLWriter):
         Note: The name of the complex-type is anonymous in the XML schema.
 
         """
-        assert isinstance(elem, ar_element.ImplementationDataTypeRef)
-        attr: TupleList = []
-        self._collect_base_ref_attr(elem, attr)
-        self._add_content('IMPLEMENTATION-DATA-TYPE-REF', elem.value, attr)
+        self._add_ref_tag('IMPLEMENTATION-DATA-TYPE-REF', self._enum_to_xml(elem.dest), elem.value)
 
     def _write_sw_base_type_ref(self, elem: ar_element.SwBaseTypeRef) -> None:
         """
@@ -1684,10 +1896,7 @@ class Writer(_XMLWriter):
         Note: The name of the complex-type is anonymous in the XML schema.
 
         """
-        assert isinstance(elem, ar_element.SwBaseTypeRef)
-        attr: TupleList = []
-        self._collect_base_ref_attr(elem, attr)
-        self._add_content('BASE-TYPE-REF', elem.value, attr)
+        self._add_ref_tag('BASE-TYPE-REF', self._enum_to_xml(elem.dest), elem.value)
 
     def _write_sw_addr_method_ref(self, elem: ar_element.SwAddrMethodRef) -> None:
         """
@@ -1695,10 +1904,7 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'SW-ADDR-METHOD-REF'
         """
-        assert isinstance(elem, ar_element.SwAddrMethodRef)
-        attr: TupleList = []
-        self._collect_base_ref_attr(elem, attr)
-        self._add_content('SW-ADDR-METHOD-REF', elem.value, attr)
+        self._add_ref_tag('SW-ADDR-METHOD-REF', self._enum_to_xml(elem.dest), elem.value)
 
     def _write_unit_ref(self, elem: ar_element.UnitRef) -> None:
         """
@@ -1706,10 +1912,7 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'UNIT-REF'
         """
-        assert isinstance(elem, ar_element.UnitRef)
-        attr: TupleList = []
-        self._collect_base_ref_attr(elem, attr)
-        self._add_content('UNIT-REF', elem.value, attr)
+        self._add_ref_tag('UNIT-REF', self._enum_to_xml(elem.dest), elem.value)
 
     def _write_physical_dimension_ref(self, elem: ar_element.PhysicalDimensionRef) -> None:
         """
@@ -1717,10 +1920,7 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'PHYSICAL-DIMENSION-REF'
         """
-        assert isinstance(elem, ar_element.PhysicalDimensionRef)
-        attr: TupleList = []
-        self._collect_base_ref_attr(elem, attr)
-        self._add_content('PHYSICAL-DIMENSION-REF', elem.value, attr)
+        self._add_ref_tag('PHYSICAL-DIMENSION-REF', self._enum_to_xml(elem.dest), elem.value)
 
     def _write_index_data_type_ref(self, elem: ar_element.IndexDataTypeRef) -> None:
         """
@@ -1728,10 +1928,7 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'INDEX-DATA-TYPE-REF'
         """
-        assert isinstance(elem, ar_element.IndexDataTypeRef)
-        attr: TupleList = []
-        self._collect_base_ref_attr(elem, attr)
-        self._add_content('INDEX-DATA-TYPE-REF', elem.value, attr)
+        self._add_ref_tag('INDEX-DATA-TYPE-REF', self._enum_to_xml(elem.dest), elem.value)
 
     def _write_application_data_type_ref(self, elem: ar_element.ApplicationDataTypeRef, tag: str) -> None:
         """
@@ -1739,10 +1936,7 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'TYPE-TREF', 'APPLICATION-DATA-TYPE-REF'
         """
-        assert isinstance(elem, ar_element.ApplicationDataTypeRef)
-        attr: TupleList = []
-        self._collect_base_ref_attr(elem, attr)
-        self._add_content(tag, elem.value, attr)
+        self._add_ref_tag(tag, self._enum_to_xml(elem.dest), elem.value)
 
     def _write_constant_ref(self, elem: ar_element.ApplicationDataTypeRef, tag: str) -> None:
         """
@@ -1752,10 +1946,7 @@ class Writer(_XMLWriter):
 
         Don't confuse this with the ConstantReference class.
         """
-        assert isinstance(elem, ar_element.ConstantRef)
-        attr: TupleList = []
-        self._collect_base_ref_attr(elem, attr)
-        self._add_content(tag, elem.value, attr)
+        self._add_ref_tag(tag, self._enum_to_xml(elem.dest), elem.value)
 
 # Constant and value specifications
 
@@ -1765,15 +1956,14 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'TEXT-VALUE-SPECIFICATION'
         """
-        assert isinstance(elem, ar_element.TextValueSpecification)
         tag = "TEXT-VALUE-SPECIFICATION"
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
             self._write_value_specification_group(elem)
             if elem.value is not None:
-                self._add_content("VALUE", str(elem.value))
+                self._add_text_tag("VALUE", str(elem.value))
             self._leave_child()
 
     def _write_numerical_value_specification(self, elem: ar_element.NumericalValueSpecification) -> None:
@@ -1782,15 +1972,14 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'NUMERICAL-VALUE-SPECIFICATION'
         """
-        assert isinstance(elem, ar_element.NumericalValueSpecification)
         tag = "NUMERICAL-VALUE-SPECIFICATION"
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
             self._write_value_specification_group(elem)
             if elem.value is not None:
-                self._add_content("VALUE", self._format_number(elem.value))
+                self._add_text_tag("VALUE", self._format_number(elem.value))
             self._leave_child()
 
     def _write_not_available_value_specification(self, elem: ar_element.NotAvailableValueSpecification) -> None:
@@ -1799,15 +1988,14 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'NOT-AVAILABLE-VALUE-SPECIFICATION'
         """
-        assert isinstance(elem, ar_element.NotAvailableValueSpecification)
         tag = "NOT-AVAILABLE-VALUE-SPECIFICATION"
         if elem.is_empty_with_ignore({"default_pattern_format"}):
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
             self._write_value_specification_group(elem)
             if elem.default_pattern is not None:
-                self._add_content("DEFAULT-PATTERN", str(elem.default_pattern))  # TODO support numerical formats
+                self._add_text_tag("DEFAULT-PATTERN", str(elem.default_pattern))  # TODO support numerical formats
             self._leave_child()
 
     def _write_array_value_specification(self, elem: ar_element.ArrayValueSpecification) -> None:
@@ -1816,10 +2004,9 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'ARRAY-VALUE-SPECIFICATION'
         """
-        assert isinstance(elem, ar_element.ArrayValueSpecification)
         tag = "ARRAY-VALUE-SPECIFICATION"
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
             self._write_value_specification_group(elem)
@@ -1833,8 +2020,13 @@ class Writer(_XMLWriter):
         """
         if elem.elements:
             self._add_child("ELEMENTS")
+            by_type = self._value_specification_by_type
             for child_element in elem.elements:
-                self._write_value_specification_element(child_element)
+                write_function = by_type.get(child_element.__class__)
+                if write_function is None:
+                    self._write_value_specification_element(child_element)
+                else:
+                    write_function(self, child_element)
             self._leave_child()
 
     def _write_record_value_specification(self, elem: ar_element.RecordValueSpecification) -> None:
@@ -1843,10 +2035,9 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'RECORD-VALUE-SPECIFICATION'
         """
-        assert isinstance(elem, ar_element.RecordValueSpecification)
         tag = "RECORD-VALUE-SPECIFICATION"
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
             self._write_value_specification_group(elem)
@@ -1860,18 +2051,22 @@ class Writer(_XMLWriter):
         """
         if elem.fields:
             self._add_child("FIELDS")
+            by_type = self._value_specification_by_type
             for field in elem.fields:
-                self._write_value_specification_element(field)
+                write_function = by_type.get(field.__class__)
+                if write_function is None:
+                    self._write_value_specification_element(field)
+                else:
+                    write_function(self, field)
             self._leave_child()
 
     def _write_application_value_specification(self, elem: ar_element.ApplicationValueSpecification) -> None:
         """
         Writes complex-type AR:APPLICATION-VALUE-SPECIFICATION
         """
-        assert isinstance(elem, ar_element.ApplicationValueSpecification)
         tag = "APPLICATION-VALUE-SPECIFICATION"
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
             self._write_value_specification_group(elem)
@@ -1883,11 +2078,12 @@ class Writer(_XMLWriter):
         Writes group AR:APPLICATION-VALUE-SPECIFICATION
         """
         if elem.category is not None:
-            self._add_content("CATEGORY", str(elem.category))
+            self._add_text_tag("CATEGORY", str(elem.category))
         if elem.sw_axis_conts:
             self._add_child("SW-AXIS-CONTS")
+            write_sw_axis_cont = self._write_sw_axis_cont
             for child in elem.sw_axis_conts:
-                self._write_sw_axis_cont(child)
+                write_sw_axis_cont(child)
             self._leave_child()
         if elem.sw_value_cont is not None:
             self._write_sw_value_cont(elem.sw_value_cont)
@@ -1898,30 +2094,28 @@ class Writer(_XMLWriter):
         Type: Abstract
         """
         if elem.label is not None:
-            self._add_content("SHORT-LABEL", str(elem.label))
+            self._add_text_tag("SHORT-LABEL", str(elem.label))
 
     def _write_value_specification_element(self, elem: ValueSpeficationElement) -> None:
         """
         Switched writer for value specification elements
         """
-        class_name = elem.__class__.__name__
-        write_method = self.switcher_value_specification.get(class_name, None)
-        if write_method is not None:
-            write_method(elem)
-        else:
-            raise NotImplementedError(f"Found no writer for class {class_name}")
+        write_function = self._value_specification_by_type.get(elem.__class__)
+        if write_function is None:
+            write_function = self._find_write_function(self._value_specification_by_type,
+                                                       self._VALUE_SPECIFICATION_METHODS,
+                                                       elem)
+            if write_function is None:
+                raise NotImplementedError(f"Found no writer for class {elem.__class__.__name__}")
+        write_function(self, elem)
 
     def _write_constant_specification(self, elem: ar_element.ConstantSpecification) -> None:
         """
         Writes complex type AR:CONSTANT-SPECIFICATION
         """
-        assert isinstance(elem, ar_element.ConstantSpecification)
-        attr: TupleList = []
-        self._collect_identifiable_attributes(elem, attr)
+        attr = self._identifiable_attributes(elem)
         self._add_child('CONSTANT-SPECIFICATION', attr)
-        self._write_referrable(elem)
-        self._write_multilanguage_referrable(elem)
-        self._write_identifiable(elem)
+        self._write_identifiable_header(elem)
         self._write_constant_specification_group(elem)
         self._leave_child()
 
@@ -1938,10 +2132,9 @@ class Writer(_XMLWriter):
         """
         Writes complex type AR:CONSTANT-REFERENCE
         """
-        assert isinstance(elem, ar_element.ConstantReference)
         tag = "CONSTANT-REFERENCE"
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
             self._write_value_specification_group(elem)
@@ -1957,10 +2150,9 @@ class Writer(_XMLWriter):
         Type: Concrete
         Tag variants: 'SW-VALUES-PHYS'
         """
-        assert isinstance(elem, ar_element.SwValues)
         tag = "SW-VALUES-PHYS"
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
             self._write_sw_values_group(elem)
@@ -1971,24 +2163,31 @@ class Writer(_XMLWriter):
         Writes group AR:SW-VALUES (also used part of AR:VALUE-GROUP)
         Type: abstract
         """
+        format_number = self._format_number
+        numbers: list[str] = []  # Consecutive numbers, written together
         for value in elem.values:
+            if isinstance(value, (int, float, ar_element.NumericalValue)):
+                numbers.append(format_number(value))
+                continue
+            if numbers:
+                self._add_number_tags("V", numbers)
+                numbers = []
             if isinstance(value, str):
-                self._add_content("VT", value)
-            elif isinstance(value, (int, float, ar_element.NumericalValue)):
-                self._add_content("V", self._format_number(value))
+                self._add_text_tag("VT", value)
             elif isinstance(value, ar_element.ValueGroup):
                 self._write_value_group(value, "VG")
             else:
                 raise NotImplementedError(str(type(value)))
+        if numbers:
+            self._add_number_tags("V", numbers)
 
     def _write_value_group(self, elem: ar_element.ValueGroup, tag: str) -> None:
         """
         Writes complex-type AR:VALUE-GROUP
         Type: Concrete
         """
-        assert isinstance(elem, ar_element.ValueGroup)
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
             if elem.label is not None:
@@ -2001,10 +2200,9 @@ class Writer(_XMLWriter):
         Writes Complex-type SW-AXIS-CONT
         Type: Concrete
         """
-        assert isinstance(elem, ar_element.SwAxisCont)
         tag = "SW-AXIS-CONT"
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
             self._write_sw_axis_cont_group(elem)
@@ -2016,13 +2214,13 @@ class Writer(_XMLWriter):
         Type: Concrete
         """
         if elem.category is not None:
-            self._add_content("CATEGORY", ar_enum.enum_to_xml(elem.category))
+            self._add_text_tag("CATEGORY", self._enum_to_xml(elem.category))
         if elem.unit_ref is not None:
             self._write_unit_ref(elem.unit_ref)
         if elem.unit_display_name is not None:
             self._write_single_language_unit_names(elem.unit_display_name, "UNIT-DISPLAY-NAME")
         if elem.sw_axis_index is not None:
-            self._add_content("SW-AXIS-INDEX", str(elem.sw_axis_index))
+            self._add_text_tag("SW-AXIS-INDEX", str(elem.sw_axis_index))
         if elem.sw_array_size is not None:
             self._write_value_list(elem.sw_array_size)
         if elem.sw_values_phys is not None:
@@ -2033,10 +2231,9 @@ class Writer(_XMLWriter):
         Writes Complex-type SW-VALUE-CONT
         Type: Concrete
         """
-        assert isinstance(elem, ar_element.SwValueCont)
         tag = "SW-VALUE-CONT"
         if elem.is_empty:
-            self._add_content(tag)
+            self._add_empty_tag(tag)
         else:
             self._add_child(tag)
             self._write_sw_value_cont_group(elem)
@@ -2055,3 +2252,128 @@ class Writer(_XMLWriter):
             self._write_value_list(elem.sw_array_size)
         if elem.sw_values_phys is not None:
             self._write_sw_values(elem.sw_values_phys)
+
+
+Writer._init_dispatch_tables()  # pylint: disable=protected-access
+
+
+class TreeWriter(Writer):
+    """
+    ARXML writer that builds an lxml element tree and serializes it in one step.
+    Produces the same document structure and indentation as Writer but the output
+    is not guaranteed to be byte-identical (e.g. placement of namespace attributes).
+    Use Writer when exact output is required.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._root: ElementTree._Element | None = None
+        self._elem_stack: list[ElementTree._Element] = []
+        self._has_xml_declaration = False
+
+    def _reset_tree(self) -> None:
+        self._root = None
+        self._elem_stack = []
+        self._has_xml_declaration = False
+
+    def _str_open(self):
+        super()._str_open()
+        self._reset_tree()
+
+    def _open(self, file_path: str):
+        super()._open(file_path)
+        self._reset_tree()
+
+    def _serialize_tree(self) -> None:
+        """
+        Serializes completed tree into output buffer
+        """
+        if self._root is not None and not self._elem_stack:
+            text = ElementTree.tostring(self._root, pretty_print=True, encoding='unicode').rstrip('\n')
+            if self._has_xml_declaration:
+                text = _XML_DECLARATION + '\n' + text
+            self._buf.append(text)
+            self._root = None
+
+    def _flush(self):
+        """
+        Writes tree to file once it has been completed
+        """
+        self._serialize_tree()
+        super()._flush()
+
+    def _str_value(self) -> str:
+        self._serialize_tree()
+        return super()._str_value()
+
+    def _add_xml_declaration(self) -> None:
+        self._has_xml_declaration = True
+
+    def _new_element(self, tag: str, attr: None | Attributes = None) -> ElementTree._Element:
+        if self._elem_stack:
+            elem = ElementTree.SubElement(self._elem_stack[-1], tag)
+        else:
+            elem = self._root = ElementTree.Element(tag)
+        if attr:
+            for name, value in attr:
+                elem.set(name, str(value))
+        return elem
+
+    def _add_child(self, tag: str, attr: None | Attributes = None) -> None:
+        self._elem_stack.append(self._new_element(tag, attr))
+
+    def _add_child_start_tag(self, tag: str, start_tag: str) -> None:
+        # Parsing the formatted tag is the simplest way to get its namespace declarations
+        elem = ElementTree.fromstring(f'{start_tag}</{tag}>')
+        if self._elem_stack:
+            self._elem_stack[-1].append(elem)
+        else:
+            self._root = elem
+        self._elem_stack.append(elem)
+
+    def _leave_child(self) -> None:
+        self._elem_stack.pop()
+
+    def _begin_line(self, tag: str, attr: None | Attributes = None) -> None:
+        self._elem_stack.append(self._new_element(tag, attr))
+
+    def _end_line(self, tag: str) -> None:
+        elem = self._elem_stack.pop()
+        if elem.text is None and not len(elem):
+            elem.text = ''  # Written as start and end tag, same as Writer
+
+    def _add_inline_content(self, text: str) -> None:
+        parent = self._elem_stack[-1]
+        if len(parent):
+            last = parent[-1]
+            last.tail = text if last.tail is None else last.tail + text
+        else:
+            parent.text = text if parent.text is None else parent.text + text
+
+    def _add_content(self, tag: str, content: str = '', attr: None | Attributes = None, inline: bool = False) -> None:
+        elem = self._new_element(tag, attr)
+        if content:
+            elem.text = str(content)
+
+    def _add_empty_tag(self, tag: str) -> None:
+        self._new_element(tag)
+
+    def _add_text_tag(self, tag: str, content: str) -> None:
+        elem = self._new_element(tag)
+        if content:
+            elem.text = str(content)
+
+    def _add_int_tag(self, tag: str, value: int) -> None:
+        self._add_text_tag(tag, int(value))
+
+    def _add_number_tags(self, tag: str, numbers: list[str]) -> None:
+        for number in numbers:
+            self._add_text_tag(tag, number)
+
+    def _add_ref_tag(self, tag: str, dest: str, value: str) -> None:
+        elem = self._new_element(tag, [('DEST', dest)])
+        if value:
+            elem.text = str(value)
+
+    def _write_referrable(self, elem: ar_element.MultiLanguageReferrable) -> None:
+        self._add_text_tag('SHORT-NAME', elem.name)
@@ -190,6 +190,14 @@ class TestCompuScale(unittest.TestCase): # noqa D101
         self.assertIsInstance(elem, ar_element.CompuScale)
         self.assertEqual(elem.inverse_value.value, -1)
 
+    def test_content_type(self): # noqa D102
+        element = ar_element.CompuScale()
+        self.assertEqual(element.content_type, ar_enum.CompuScaleContent.NONE)
+        element = ar_element.CompuScale(ar_element.CompuConst(1))
+        self.assertEqual(element.content_type, ar_enum.CompuScaleContent.CONSTANT)
+        element.content = ar_element.CompuRational((0, 1))
+        self.assertEqual(element.content_type, ar_enum.CompuScaleContent.RATIONAL)
+
 
 class TestComputation(unittest.TestCase): # noqa D101
 
@@ -45,6 +45,17 @@ class TestTextValueSpecification(unittest.TestCase):
         self.assertIsInstance(elem, ar_element.TextValueSpecification)
         self.assertEqual(elem.value, "MyValue")
 
+    def test_read_write_value_with_markup_characters(self):
+        element = ar_element.TextValueSpecification(value="a < b && c > d")
+        writer = autosar.xml.Writer()
+        xml = '''<TEXT-VALUE-SPECIFICATION>
+  <VALUE>a &lt; b &amp;&amp; c &gt; d</VALUE>
+</TEXT-VALUE-SPECIFICATION>'''
+        self.assertEqual(writer.write_str_elem(element), xml)
+        reader = autosar.xml.Reader()
+        elem: ar_element.TextValueSpecification = reader.read_str_elem(xml)
+        self.assertEqual(elem.value, "a < b && c > d")
+
 
 class TestNumericalValueSpecification(unittest.TestCase):
 
@@ -81,6 +92,15 @@ class TestNumericalValueSpecification(unittest.TestCase):
         self.assertIsInstance(elem, ar_element.NumericalValueSpecification)
         self.assertAlmostEqual(elem.value, 0.4)
 
+    def test_write_float_formatting(self):
+        writer = autosar.xml.Writer()
+        for value, text in [(12.0, '12'), (-0.25, '-0.25'), (1e-7, '1E-7'), (1e20, '100000000000000000000')]:
+            element = ar_element.NumericalValueSpecification(value=value)
+            xml = f'''<NUMERICAL-VALUE-SPECIFICATION>
+  <VALUE>{text}</VALUE>
+</NUMERICAL-VALUE-SPECIFICATION>'''
+            self.assertEqual(writer.write_str_elem(element), xml)
+
 
 class TestNotAvailableValueSpecification(unittest.TestCase):
 
@@ -190,6 +210,15 @@ class TestArrayValueSpecification(unittest.TestCase):
         self.assertIsInstance(child_elem, ar_element.TextValueSpecification)
         self.assertEqual(child_elem.value, "Second")
 
+    def test_create_from_list(self):
+        elements = [ar_element.NumericalValueSpecification(value=1),
+                    ar_element.TextValueSpecification(value="Two")]
+        element = ar_element.ArrayValueSpecification(elements=elements)
+        self.assertEqual(element.elements, elements)
+        self.assertIsNot(element.elements, elements)
+        with self.assertRaises(TypeError):
+            ar_element.ArrayValueSpecification(elements=[ar_element.NumericalValueSpecification(value=1), 2])
+
 
 class TestRecordValueSpecification(unittest.TestCase):
 
@@ -350,6 +379,29 @@ class TestValueBuilder(unittest.TestCase):
                 self.assertEqual(grand_child.label, labels[j])
                 self.assertEqual(grand_child.value, i * 3 + j + 1)
 
+    def test_make_from_value_specification(self):
+        value = ar_element.NumericalValueSpecification("Label", 1)
+        self.assertIs(ar_element.ValueSpecification.make_value(value), value)
+        element: ar_element.ArrayValueSpecification
+        element = ar_element.ValueSpecification.make_value(["ARRAY", value, 2])
+        self.assertIs(element.elements[0], value)
+        self.assertEqual(element.elements[1].value, 2)
+
+    def test_make_deeply_nested_array(self):
+        depth = sys.getrecursionlimit() + 100
+        data = ["ARRAY", 1]
+        for _ in range(depth - 1):
+            data = ["ARRAY", data, ("Last", "Text")]
+        element = ar_element.ValueSpecification.make_value(data)
+        for _ in range(depth - 1):
+            self.assertIsInstance(element, ar_element.ArrayValueSpecification)
+            self.assertEqual(len(element.elements), 2)
+            self.assertIsInstance(element.elements[1], ar_element.TextValueSpecification)
+            self.assertEqual(element.elements[1].label, "Last")
+            element = element.elements[0]
+        self.assertIsInstance(element.elements[0], ar_element.NumericalValueSpecification)
+        self.assertEqual(element.elements[0].value, 1)
+
 
 class TestApplicationValueSpecification(unittest.TestCase):
 
@@ -413,6 +465,11 @@ class TestApplicationValueSpecification(unittest.TestCase):
         self.assertEqual(str(elem.sw_axis_conts[0].unit_ref), "/Units/MyUnit1")
         self.assertEqual(str(elem.sw_axis_conts[1].unit_ref), "/Units/MyUnit2")
 
+    def test_invalid_sw_axis_cont_type(self):
+        sw_axis_cont = ar_element.SwAxisCont(unit_ref=ar_element.UnitRef("/Units/MyUnit1"))
+        with self.assertRaises(TypeError):
+            ar_element.ApplicationValueSpecification(sw_axis_conts=[sw_axis_cont, ar_element.SwValueCont()])
+
     def test_read_write_sw_value_cont(self):
         sw_value_cont = ar_element.SwValueCont(sw_values_phys=ar_element.SwValues([1, 2, 3, 4]))
         element = ar_element.ApplicationValueSpecification(sw_value_cont=sw_value_cont)
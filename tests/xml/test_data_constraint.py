@@ -65,6 +65,24 @@ class TestScaleConstraint(unittest.TestCase): # noqa D101
         self.assertEqual(elem.lower_limit_type, ar_enum.IntervalType.CLOSED)
         self.assertEqual(elem.upper_limit_type, ar_enum.IntervalType.CLOSED)
 
+    def test_check_value(self): # noqa D102
+        element = ar_element.ScaleConstraint(lower_limit=0, upper_limit=10)
+        self.assertTrue(element.check_value(0))
+        self.assertTrue(element.check_value(10))
+        self.assertFalse(element.check_value(11))
+        element.lower_limit_type = ar_enum.IntervalType.OPEN
+        element.upper_limit_type = ar_enum.IntervalType.OPEN
+        self.assertFalse(element.check_value(0))
+        self.assertTrue(element.check_value(5))
+        self.assertFalse(element.check_value(10))
+
+    def test_check_values(self): # noqa D102
+        element = ar_element.ScaleConstraint(lower_limit=0,
+                                             upper_limit=10,
+                                             upper_limit_type=ar_enum.IntervalType.OPEN)
+        self.assertEqual(element.check_values([-1, 0, 5, 10]), [False, True, True, False])
+        self.assertEqual(element.check_values(()), [])
+
 class TestInternalConstraint(unittest.TestCase): # noqa D101
 
     def test_write_read_empty(self): # noqa D102
@@ -249,6 +267,19 @@ class TestDataConstraint(unittest.TestCase): # noqa D101
         self.assertIsInstance(elem, ar_element.DataConstraint)
         self.assertEqual(elem.name, "Test_Constr")
 
+    def test_invalid_rule_type(self): # noqa D102
+        with self.assertRaises(TypeError):
+            ar_element.DataConstraint("Test_Constr", [ar_element.InternalConstraint()])
+
+    def test_append_rule(self): # noqa D102
+        element = ar_element.DataConstraint("Test_Constr")
+        self.assertIsNone(element.rules)
+        rule = ar_element.DataConstraintRule(internal=ar_element.InternalConstraint(lower_limit=0, upper_limit=10))
+        element.append(rule)
+        self.assertEqual(element.rules, [rule])
+        with self.assertRaises(TypeError):
+            element.append(ar_element.InternalConstraint())
+
     def test_write_read_physical(self): # noqa D102
         element = ar_element.DataConstraint.make_physical("Test_Constr", 0, 1)
         writer = autosar.xml.Writer()
@@ -480,6 +480,12 @@ class TestDataDefPropsConditional(unittest.TestCase):
 </SW-DATA-DEF-PROPS-CONDITIONAL>'''
         self.assertEqual(writer.write_str_elem(element), xml)
 
+    def test_invalid_sw_alignment_str(self):
+        with self.assertRaises(ValueError):
+            ar_element.SwDataDefPropsConditional(alignment='0x80ZZ')
+        with self.assertRaises(ValueError):
+            ar_element.SwDataDefPropsConditional(alignment='PTRS')
+
     def test_write_sw_alignment_unspecified(self):
         writer = autosar.xml.Writer()
         element = ar_element.SwDataDefPropsConditional(alignment='UNSPECIFIED')
@@ -719,6 +725,31 @@ class TestDataDefPropsConditional(unittest.TestCase):
         self.assertEqual(props.target_category, "MY-CATEGORY")
 
 
+class TestSwDataDefProps(unittest.TestCase):
+
+    def test_single_and_multiple_variants(self):
+        first = ar_element.SwDataDefPropsConditional(is_virtual=True)
+        second = ar_element.SwDataDefPropsConditional(display_format="%d")
+        element = ar_element.SwDataDefProps(first)
+        self.assertEqual(len(element), 1)
+        self.assertIs(element[0], first)
+        self.assertEqual(list(element), [first])
+        self.assertFalse(element.is_empty)
+        element.append(second)
+        self.assertEqual(len(element), 2)
+        self.assertIs(element[1], second)
+        self.assertEqual(element.variants, [first, second])
+
+    def test_variants_list_is_live(self):
+        first = ar_element.SwDataDefPropsConditional(is_virtual=True)
+        second = ar_element.SwDataDefPropsConditional(display_format="%d")
+        element = ar_element.SwDataDefProps()
+        self.assertTrue(element.is_empty)
+        element.variants.append(first)
+        element.variants.append(second)
+        self.assertEqual(list(element), [first, second])
+
+
 class TestSymbolProps(unittest.TestCase):
 
     def test_read_write_name_only(self):
@@ -898,6 +929,44 @@ class TestImplementationDataTypeElement(unittest.TestCase):
         self.assertEqual(len(elem.sw_data_def_props), 1)
         self.assertEqual(str(elem.sw_data_def_props[0].base_type_ref), uint8_ref)
 
+    def test_write_nested_sub_elements_with_sw_data_def_props(self):
+        writer = autosar.xml.Writer()
+        uint8_ref = "/PlatformTypes/uint8"
+        sw_data_def_props = ar_element.SwDataDefPropsConditional(base_type_ref=ar_element.SwBaseTypeRef(uint8_ref))
+        grandchild = ar_element.ImplementationDataTypeElement('GrandChild', sw_data_def_props=sw_data_def_props)
+        child = ar_element.ImplementationDataTypeElement('Child', sub_elements=[grandchild])
+        element = ar_element.ImplementationDataTypeElement('ElementName',
+                                                           sub_elements=[child],
+                                                           sw_data_def_props=sw_data_def_props)
+        xml = '''<IMPLEMENTATION-DATA-TYPE-ELEMENT>
+  <SHORT-NAME>ElementName</SHORT-NAME>
+  <SUB-ELEMENTS>
+    <IMPLEMENTATION-DATA-TYPE-ELEMENT>
+      <SHORT-NAME>Child</SHORT-NAME>
+      <SUB-ELEMENTS>
+        <IMPLEMENTATION-DATA-TYPE-ELEMENT>
+          <SHORT-NAME>GrandChild</SHORT-NAME>
+          <SW-DATA-DEF-PROPS>
+            <SW-DATA-DEF-PROPS-VARIANTS>
+              <SW-DATA-DEF-PROPS-CONDITIONAL>
+                <BASE-TYPE-REF DEST="SW-BASE-TYPE">/PlatformTypes/uint8</BASE-TYPE-REF>
+              </SW-DATA-DEF-PROPS-CONDITIONAL>
+            </SW-DATA-DEF-PROPS-VARIANTS>
+          </SW-DATA-DEF-PROPS>
+        </IMPLEMENTATION-DATA-TYPE-ELEMENT>
+      </SUB-ELEMENTS>
+    </IMPLEMENTATION-DATA-TYPE-ELEMENT>
+  </SUB-ELEMENTS>
+  <SW-DATA-DEF-PROPS>
+    <SW-DATA-DEF-PROPS-VARIANTS>
+      <SW-DATA-DEF-PROPS-CONDITIONAL>
+        <BASE-TYPE-REF DEST="SW-BASE-TYPE">/PlatformTypes/uint8</BASE-TYPE-REF>
+      </SW-DATA-DEF-PROPS-CONDITIONAL>
+    </SW-DATA-DEF-PROPS-VARIANTS>
+  </SW-DATA-DEF-PROPS>
+</IMPLEMENTATION-DATA-TYPE-ELEMENT>'''
+        self.assertEqual(writer.write_str_elem(element), xml)
+
 
 class TestImplementationDataType(unittest.TestCase):
 
@@ -1033,6 +1102,27 @@ class TestImplementationDataType(unittest.TestCase):
         self.assertEqual(len(elem.sw_data_def_props), 1)
         self.assertEqual(str(elem.sw_data_def_props[0].base_type_ref), uint8_ref)
 
+    def test_find_after_modifying_sub_elements(self):
+        element = ar_element.ImplementationDataType("RecordType_T", category="STRUCTURE")
+        elem_a = ar_element.ImplementationDataTypeElement("a")
+        elem_b = ar_element.ImplementationDataTypeElement("b")
+        element.append(elem_a)
+        element.append(elem_b)
+        self.assertIs(element.find("a"), elem_a)
+        elem_c = ar_element.ImplementationDataTypeElement("c")
+        element.sub_elements[0] = elem_c
+        self.assertIsNone(element.find("a"))
+        self.assertIs(element.find("c"), elem_c)
+        elem_d = ar_element.ImplementationDataTypeElement("d")
+        element.sub_elements.insert(0, elem_d)
+        self.assertIs(element.find("d"), elem_d)
+        element.sub_elements.pop()
+        self.assertIsNone(element.find("b"))
+        self.assertIs(element.find("c"), elem_c)
+        elem_d.name = "c"
+        self.assertIs(element.find("c"), elem_d)
+        self.assertIsNone(element.find("d"))
+
 
 class TestCompleteImplementationDataType(unittest.TestCase):
 
@@ -1740,6 +1830,15 @@ class TestApplicationRecordDataType(unittest.TestCase):
         self.assertIsInstance(elem, ar_element.ApplicationRecordDataType)
         self.assertEqual(elem.name, "TypeName")
 
+    def test_extend_elements(self):
+        element1 = ar_element.ApplicationRecordElement("Pitch")
+        element2 = ar_element.ApplicationRecordElement("Yaw")
+        datatype = ar_element.ApplicationRecordDataType("TypeName")
+        datatype.extend((element1, element2))
+        self.assertEqual(datatype.elements, [element1, element2])
+        with self.assertRaises(TypeError):
+            datatype.extend([element1, "Roll"])
+
     def test_read_write_elements_directly_defined_using_sw_data_def_props(self):
         writer = autosar.xml.Writer()
         element1 = ar_element.ApplicationRecordElement(
@@ -1997,6 +2096,26 @@ class TestValueList(unittest.TestCase):
         self.assertEqual(number.value, 16)
         self.assertEqual(number.value_format, ar_enum.ValueFormat.HEXADECIMAL)
 
+    def test_create_from_list(self):
+        values = [1, 2.5, ar_element.NumericalValue(3)]
+        element = ar_element.ValueList(values)
+        self.assertEqual(element.values, values)
+        self.assertIsNot(element.values, values)
+        with self.assertRaises(TypeError):
+            ar_element.ValueList([1, "2"])
+
+
+class TestVariableDataPrototype(unittest.TestCase):
+
+    def test_create_with_keyword_arguments(self):
+        type_ref = ar_element.AutosarDataTypeRef("/DataTypes/MyType",
+                                                 ar_enum.IdentifiableSubTypes.IMPLEMENTATION_DATA_TYPE)
+        element = ar_element.VariableDataPrototype("MyVariable", type_ref=type_ref, category="VALUE")
+        self.assertEqual(element.name, "MyVariable")
+        self.assertIs(element.type_ref, type_ref)
+        self.assertEqual(element.category, "VALUE")
+        self.assertIsNone(element.init_value)
+
 
 if __name__ == '__main__':
     unittest.main()
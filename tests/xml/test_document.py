@@ -4,10 +4,13 @@
 import os
 import sys
 import unittest
+import lxml.etree as ElementTree
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
 import autosar.xml.document as ar_document # noqa E402
 import autosar.xml.element as ar_element  # noqa E402
+import autosar.xml.enumeration as ar_enum  # noqa E402
 import autosar.xml  # noqa E402
+import autosar.xml.writer as ar_writer  # noqa E402
 
 
 class DocumentTests(unittest.TestCase):
@@ -37,6 +40,52 @@ class DocumentTests(unittest.TestCase):
         self.assertEqual(base_types_package.name, "BaseTypes")
         self.assertEqual(impl_types_package.name, "ImplementationDataTypes")
 
+    def test_tree_writer_matches_writer_below_root(self):
+        workspace = autosar.xml.Workspace()
+        workspace.make_packages("DataTypes/BaseTypes",
+                                "DataTypes/ImplementationDataTypes")
+        document = ar_document.Document([workspace.find("/DataTypes")])
+        text_lines = autosar.xml.Writer().write_str(document, False).splitlines()
+        tree_lines = ar_writer.TreeWriter().write_str(document, False).splitlines()
+        self.assertEqual(len(text_lines), len(tree_lines))
+        self.assertEqual(text_lines[0], tree_lines[0])
+        self.assert_same_root_tag(text_lines[1], tree_lines[1])
+        self.assertEqual(text_lines[2:], tree_lines[2:])
+        reader = autosar.xml.Reader()
+        document2 = reader.read_str("\n".join(tree_lines))
+        self.assertEqual(document2.find("/DataTypes/BaseTypes").name, "BaseTypes")
+
+    def test_tree_writer_matches_writer_with_content(self):
+        package = ar_element.Package("Package")
+        computation = ar_element.Computation.make_value_table(["FALSE", "TRUE"], default_value="FALSE")
+        desc = ar_element.MultiLanguageOverviewParagraph(
+            (ar_enum.Language.FOR_ALL,
+             ['Value ', ar_element.EmphasisText('true', type=ar_enum.EmphasisType.BOLD), ' when enabled']))
+        package.append(ar_element.CompuMethod("boolean",
+                                              int_to_phys=computation,
+                                              category="TEXTTABLE",
+                                              desc=desc))
+        constraint = ar_element.InternalConstraint(lower_limit=0, upper_limit=7)
+        package.append(ar_element.DataConstraint("Limit",
+                                                 rules=[ar_element.DataConstraintRule(internal=constraint)]))
+        document = ar_document.Document([package])
+        text_lines = autosar.xml.Writer().write_str(document, False).splitlines()
+        tree_lines = ar_writer.TreeWriter().write_str(document, False).splitlines()
+        self.assertIn('<L-2 L="FOR-ALL">Value <E TYPE="BOLD">true</E> when enabled</L-2>',
+                      "\n".join(text_lines))
+        self.assertEqual(len(text_lines), len(tree_lines))
+        self.assertEqual(text_lines[0], tree_lines[0])
+        self.assert_same_root_tag(text_lines[1], tree_lines[1])
+        self.assertEqual(text_lines[2:], tree_lines[2:])
+
+    def assert_same_root_tag(self, text_line: str, tree_line: str):
+        # lxml places namespace declarations before other attributes, compare the parsed tags instead
+        text_root = ElementTree.fromstring(text_line + '</AUTOSAR>')
+        tree_root = ElementTree.fromstring(tree_line + '</AUTOSAR>')
+        self.assertEqual(text_root.tag, tree_root.tag)
+        self.assertEqual(text_root.nsmap, tree_root.nsmap)
+        self.assertEqual(dict(text_root.attrib), dict(tree_root.attrib))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -176,6 +176,16 @@ class TestMultilanguageLongName(unittest.TestCase): # noqa D101
   <L-4 L="FOR-ALL">Name <SUB>Subscript text</SUB> More text <TT TYPE="MY-TYPE">Technical Term</TT></L-4>
 </LONG-NAME>''')
 
+    def test_write_element_for_all_with_superscript(self): # noqa D102
+        writer = autosar.xml.Writer()
+        element = ar_element.MultilanguageLongName()
+        element.append(ar_element.LanguageLongName(
+            ar_enum.Language.FOR_ALL,
+            ['Area m', ar_element.Superscript('2')]))
+        self.assertEqual(writer.write_str_elem(element, 'LONG-NAME'), '''<LONG-NAME>
+  <L-4 L="FOR-ALL">Area m<SUP>2</SUP></L-4>
+</LONG-NAME>''')
+
     def test_read_element_english_simple(self): # noqa D102
         xml = '''
 <LONG-NAME>
@@ -224,6 +234,15 @@ class TestMultiLanguageOverviewParagraph(unittest.TestCase): # noqa D101
         self.assertEqual(elem.elements[0].language, ar_enum.Language.ZH)
 
 
+    def test_desc_from_same_string_is_not_shared(self): # noqa D102
+        first = ar_element.ImplementationDataType('A', desc='Generated')
+        second = ar_element.SwBaseType('B', desc='Generated')
+        self.assertIsNot(first.desc, second.desc)
+        first.desc.append(ar_element.LanguageOverviewParagraph(ar_enum.Language.EN, 'Extra'))
+        self.assertEqual(len(first.desc.elements), 2)
+        self.assertEqual(len(second.desc.elements), 1)
+
+
 class TestLanguageParagraph(unittest.TestCase): # noqa D101
 
     def test_write_for_all_simple_content(self): # noqa D102
@@ -233,6 +252,13 @@ class TestLanguageParagraph(unittest.TestCase): # noqa D101
         self.assertEqual(writer.write_str_elem(element),
                          '<L-1 L="FOR-ALL">Text</L-1>')
 
+    def test_append_superscript(self): # noqa D102
+        element = ar_element.LanguageParagraph(ar_enum.Language.FOR_ALL)
+        element.append(ar_element.Superscript('2'))
+        self.assertIsInstance(element.parts[0], ar_element.Superscript)
+        with self.assertRaises(TypeError):
+            element.append(1)
+
     def test_read_element_english_simple(self): # noqa D102
         xml = '<L-1 L="EN">Text</L-1>'
         reader = autosar.xml.Reader()
@@ -272,6 +298,18 @@ class TestMultiLanguageParagraph(unittest.TestCase): # noqa D101
   <L-1 L="FOR-ALL">Text</L-1>
 </P>''')
 
+    def test_write_element_with_escaped_attr_value(self): # noqa D102
+        writer = autosar.xml.Writer()
+        element = ar_element.MultiLanguageParagraph((ar_enum.Language.FOR_ALL, 'Text'),
+                                                    help_entry='"A" & <B>')
+        xml = writer.write_str_elem(element)
+        self.assertEqual(xml, '''<P HELP-ENTRY="&quot;A&quot; &amp; &lt;B>">
+  <L-1 L="FOR-ALL">Text</L-1>
+</P>''')
+        reader = autosar.xml.Reader()
+        elem: ar_element.MultiLanguageParagraph = reader.read_str_elem(xml)
+        self.assertEqual(elem.help_entry, '"A" & <B>')
+
     def test_read_element_for_all_simple(self): # noqa D102
         xml = '''
 <P>
@@ -284,6 +322,17 @@ class TestMultiLanguageParagraph(unittest.TestCase): # noqa D101
         self.assertEqual(elem.elements[0].parts[0], 'Text')
         self.assertEqual(elem.elements[0].language, ar_enum.Language.FOR_ALL)
 
+    def test_read_element_multiple_languages(self): # noqa D102
+        xml = '''
+<P>
+  <L-1 L="EN">Text</L-1>
+  <L-1 L="DE">Text</L-1>
+</P>
+'''
+        reader = autosar.xml.Reader()
+        elem: ar_element.MultiLanguageParagraph = reader.read_str_elem(xml)
+        self.assertEqual([x.language for x in elem.elements], [ar_enum.Language.EN, ar_enum.Language.DE])
+
 
 class TestLanguageVerbatim(unittest.TestCase): # noqa D101
 
@@ -302,6 +351,13 @@ class TestLanguageVerbatim(unittest.TestCase): # noqa D101
         self.assertEqual(elem.parts[0], '  Text surrounded by spaces   ')
         self.assertEqual(elem.language, ar_enum.Language.FOR_ALL)
 
+    def test_write_unsupported_part_raises_type_error(self): # noqa D102
+        writer = autosar.xml.Writer()
+        element = ar_element.LanguageVerbatim(ar_enum.Language.FOR_ALL, 'Text')
+        element.parts.append(ar_element.IndexEntry('Entry'))
+        with self.assertRaises(TypeError):
+            writer.write_str_elem(element)
+
 
 class TestMultiLanguageVerbatim(unittest.TestCase): # noqa D101
 
@@ -485,6 +541,18 @@ class TestSingleLanguageUnitNames(unittest.TestCase): # noqa D101
         self.assertEqual(child_elem.text, "2")
         self.assertEqual(str(elem), "m^2")
 
+    def test_str_is_single_part(self): # noqa D102
+        element = ar_element.SingleLanguageUnitNames("Km/h")
+        self.assertEqual(element.parts, ["Km/h"])
+
+    def test_str_conversion(self): # noqa D102
+        self.assertEqual(str(ar_element.SingleLanguageUnitNames()), "")
+        self.assertEqual(str(ar_element.SingleLanguageUnitNames(["Km", "/", "h"])), "Km/h")
+        element = ar_element.SingleLanguageUnitNames("m")
+        element.append(ar_element.Subscript("x"))
+        with self.assertRaises(ValueError):
+            str(element)
+
 
 if __name__ == '__main__':
     unittest.main()
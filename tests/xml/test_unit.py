@@ -88,6 +88,13 @@ class TestUnit(unittest.TestCase): # noqa D101
         self.assertIsInstance(elem, ar_element.Unit)
         self.assertEqual(str(elem.physical_dimension_ref), "/Dimensions/Dim1")
 
+    def test_physical_dimension_ref_from_str(self): # noqa D102
+        element = ar_element.Unit("MyUnit", display_name="Km/h", physical_dimension_ref="/Dimensions/Dim1")
+        self.assertIsInstance(element.physical_dimension_ref, ar_element.PhysicalDimensionRef)
+        self.assertEqual(str(element.physical_dimension_ref), "/Dimensions/Dim1")
+        with self.assertRaises(TypeError):
+            ar_element.Unit("MyUnit", physical_dimension_ref=1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -96,6 +96,57 @@ class WorkspaceTests(unittest.TestCase):
         self.assertIsInstance(package, ar_element.Package)
         self.assertEqual(package.name, "BaseTypes")
 
+    def test_find_deep_element(self):
+        workspace = ar_workspace.Workspace()
+        package = workspace.make_packages("/DataTypes/ImplementationDataTypes/Records")
+        data_type = ar_element.ImplementationDataType("MyRecord",
+                                                      sub_elements=[ar_element.ImplementationDataTypeElement("Elem1")])
+        package.append(data_type)
+        self.assertIs(workspace.find("/DataTypes/ImplementationDataTypes/Records/MyRecord"), data_type)
+        self.assertIs(workspace.find("/DataTypes/ImplementationDataTypes/Records/MyRecord/Elem1"),
+                      data_type.sub_elements[0])
+        self.assertIsNone(workspace.find("/DataTypes/Missing/Records"))
+
+    def test_append_duplicate_name(self):
+        workspace = ar_workspace.Workspace()
+        package = workspace.make_packages("/DataTypes/BaseTypes")
+        base_type = ar_element.SwBaseType("uint8")
+        package.append(base_type)
+        with self.assertRaises(ValueError):
+            package.append(ar_element.SwBaseType("uint8"))
+        with self.assertRaises(ValueError):
+            package.append(base_type)
+        self.assertEqual(package.elements, [base_type])
+
+    def test_append_many(self):
+        workspace = ar_workspace.Workspace()
+        package = workspace.make_packages("/DataTypes")
+        base_type = ar_element.SwBaseType("uint8")
+        sub_package = ar_element.Package("CompuMethods")
+        package.append_many([base_type, sub_package])
+        self.assertEqual(package.elements, [base_type])
+        self.assertEqual(package.packages, [sub_package])
+        self.assertIs(base_type.parent, package)
+        self.assertIs(workspace.find("/DataTypes/CompuMethods"), sub_package)
+        self.assertEqual(base_type.ref().value, "/DataTypes/uint8")
+        with self.assertRaises(ValueError):
+            package.append_many([ar_element.SwBaseType("uint16"), ar_element.SwBaseType("uint8")])
+        with self.assertRaises(ValueError):
+            package.append_many([ar_element.SwBaseType("uint16"), ar_element.SwBaseType("uint16")])
+        with self.assertRaises(TypeError):
+            package.append_many([ar_element.SwBaseType("uint16"), "uint32"])
+        self.assertEqual(package.elements, [base_type])
+        self.assertIsNone(package.find("uint16"))
+
+    def test_element_ref_follows_package_rename(self):
+        workspace = ar_workspace.Workspace()
+        package = workspace.make_packages("/DataTypes/BaseTypes")
+        base_type = ar_element.SwBaseType("uint8")
+        package.append(base_type)
+        self.assertEqual(base_type.ref().value, "/DataTypes/BaseTypes/uint8")
+        package.parent.name = "Types"
+        self.assertEqual(base_type.ref().value, "/Types/BaseTypes/uint8")
+
     def test_create_namespace(self):
         workspace = ar_workspace.Workspace()
         self.create_autosar_namespace(workspace)